@@ -0,0 +1,194 @@
+import random
+import time
+import tracemalloc
+from graph import *
+
+def generate_grid(width: int, height: int, seed: int = 0) -> 'tuple[list[list[int]], list[list[int]]]':
+    """Generates a road-network-like graph: a grid where every node links to its four
+    neighbors in both directions with random weights from 1 to 10.
+
+    Args:
+        width (int): Nodes per row.
+        height (int): Number of rows, node ids run row by row.
+        seed (int, optional): Seed for the weights. Defaults to 0.
+
+    Returns:
+        tuple[list[list[int]], list[list[int]]]: (adjacency_list, weights) in the format
+        Graph.adjacency_matrix_to_list() returns.
+    """
+    generator = random.Random(seed)
+    adjacency = [[] for _ in range(width * height)]
+    weights = [[] for _ in range(width * height)]
+    for node in range(width * height):
+        row, column = divmod(node, width)
+        for neighbor in ((node + 1) if column + 1 < width else None, (node + width) if row + 1 < height else None):
+            if neighbor is not None:
+                weight = generator.randint(1, 10)
+                adjacency[node].append(neighbor)
+                weights[node].append(weight)
+                adjacency[neighbor].append(node)
+                weights[neighbor].append(weight)
+    return (adjacency, weights)
+
+def path_weight(adjacency: 'list[list[int]]', weights: 'list[list[int]]', path: 'list[int]') -> int:
+    """Sums the weights along a path.
+    """
+    return sum(weights[node][adjacency[node].index(neighbor)] for node, neighbor in zip(path, path[1:]))
+
+def benchmark_dijkstra(width: int, height: int, queries: int = 5, with_matrix: bool = True, seed: int = 0) -> 'tuple[float, float]':
+    """Times random point-to-point queries with the matrix Dijkstra and the heap Dijkstra
+    over adjacency lists, checking both find paths of the same weight.
+
+    Args:
+        width (int): Grid width.
+        height (int): Grid height.
+        queries (int, optional): Number of queries. Defaults to 5.
+        with_matrix (bool, optional): Also time the matrix version. Defaults to True.
+        seed (int, optional): Seed for the graph and queries. Defaults to 0.
+
+    Returns:
+        tuple[float, float]: Seconds per query for (matrix, heap), matrix is None if skipped.
+    """
+    adjacency, weights = generate_grid(width, height, seed)
+    generator = random.Random(seed)
+    pairs = [(generator.randrange(width * height), generator.randrange(width * height)) for _ in range(queries)]
+
+    matrix_time = None
+    if with_matrix:
+        matrix = Graph.adjacency_list_to_matrix(adjacency, weights)
+        start = time.perf_counter()
+        matrix_paths = [Graph.dijkstra(matrix, source, target) for source, target in pairs]
+        matrix_time = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    heap_paths = [Graph.dijkstra_pq(adjacency, source, target, weights) for source, target in pairs]
+    heap_time = (time.perf_counter() - start) / queries
+
+    if with_matrix:
+        for matrix_path, heap_path in zip(matrix_paths, heap_paths):
+            assert(path_weight(adjacency, weights, matrix_path) == path_weight(adjacency, weights, heap_path))
+    return (matrix_time, heap_time)
+
+def benchmark_csr(width: int, height: int, queries: int = 5, seed: int = 0) -> 'tuple[int, int, float, float, float, float]':
+    """Measures the memory of a weighted grid held as adjacency and weight lists and as a
+    CSRGraph, and times BFS and heap Dijkstra queries over both, checking they agree.
+
+    Args:
+        width (int): Grid width.
+        height (int): Grid height.
+        queries (int, optional): Number of queries. Defaults to 5.
+        seed (int, optional): Seed for the graph and queries. Defaults to 0.
+
+    Returns:
+        tuple[int, int, float, float, float, float]: (list bytes, csr bytes, list bfs, csr bfs, list dijkstra,
+        csr dijkstra), times in seconds per query.
+    """
+    tracemalloc.start()
+    adjacency, weights = generate_grid(width, height, seed)
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    csr = CSRGraph.from_adjacency_list(adjacency, weights)
+    csr_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    generator = random.Random(seed)
+    pairs = [(generator.randrange(width * height), generator.randrange(width * height)) for _ in range(queries)]
+    times = []
+    for search in (lambda graph, source, target: Graph.bfs_traverse(graph, source, target),
+                   lambda graph, source, target: Graph.dijkstra_pq(graph, source, target, weights if graph is adjacency else None)):
+        results = []
+        for graph in (adjacency, csr):
+            start = time.perf_counter()
+            results.append([search(graph, source, target) for source, target in pairs])
+            times.append((time.perf_counter() - start) / queries)
+        assert(results[0] == results[1])
+    return (list_bytes, csr_bytes, *times)
+
+class ExpansionCounter(object):
+    """Adjacency list wrapper counting how often the neighbors of a node are read, which
+    every search does exactly once per node it expands.
+    """
+    def __init__(self, adjacency: 'list[list[int]]') -> None:
+        self.adjacency = adjacency
+        self.expanded = 0
+
+    def __len__(self) -> int:
+        return len(self.adjacency)
+
+    def __getitem__(self, node: int) -> 'list[int]':
+        self.expanded = self.expanded + 1
+        return self.adjacency[node]
+
+def benchmark_point_to_point(width: int, height: int, queries: int = 5, seed: int = 0) -> 'dict[str, tuple[float, float]]':
+    """Counts the nodes expanded and times random point-to-point queries on a weighted grid
+    for the one-sided searches and their bidirectional and A* counterparts. A* uses the
+    Manhattan distance, admissible since no edge weighs less than 1.
+
+    Args:
+        width (int): Grid width.
+        height (int): Grid height.
+        queries (int, optional): Number of queries. Defaults to 5.
+        seed (int, optional): Seed for the graph and queries. Defaults to 0.
+
+    Returns:
+        dict[str, tuple[float, float]]: (nodes expanded, seconds) per query of each search.
+    """
+    adjacency, weights = generate_grid(width, height, seed)
+    generator = random.Random(seed)
+    pairs = [(generator.randrange(width * height), generator.randrange(width * height)) for _ in range(queries)]
+
+    def manhattan(target):
+        target_row, target_column = divmod(target, width)
+        def heuristic(node):
+            row, column = divmod(node, width)
+            return abs(row - target_row) + abs(column - target_column)
+        return heuristic
+
+    searches = {
+        "bfs": lambda graph, source, target: Graph.bfs_traverse(graph, source, target),
+        "bidirectional bfs": lambda graph, source, target: Graph.bidirectional_bfs(graph, source, target),
+        "dijkstra": lambda graph, source, target: Graph.dijkstra_pq(graph, source, target, weights),
+        "bidirectional dijkstra": lambda graph, source, target: Graph.bidirectional_dijkstra(graph, source, target, weights),
+        "a*": lambda graph, source, target: Graph.astar(graph, source, target, manhattan(target), weights),
+    }
+    results = {}
+    paths = {}
+    for name, search in searches.items():
+        counter = ExpansionCounter(adjacency)
+        start = time.perf_counter()
+        paths[name] = [search(counter, source, target) for source, target in pairs]
+        results[name] = (counter.expanded / queries, (time.perf_counter() - start) / queries)
+
+    for (source, target), bfs_path, bidirectional_path in zip(pairs, paths["bfs"], paths["bidirectional bfs"]):
+        assert(len(bfs_path) == len(bidirectional_path) and bidirectional_path[0] == source and bidirectional_path[-1] == target)
+        assert(all(neighbor in adjacency[node] for node, neighbor in zip(bidirectional_path, bidirectional_path[1:])))
+    for name in ("bidirectional dijkstra", "a*"):
+        for expected, path in zip(paths["dijkstra"], paths[name]):
+            assert(path_weight(adjacency, weights, expected) == path_weight(adjacency, weights, path))
+    return results
+
+if __name__ == '__main__':
+    print("Point-to-point Dijkstra on weighted grids (seconds per query)")
+    print(f"{'nodes':>10} {'matrix':>10} {'heap':>10}")
+    for side in (10, 20, 40, 300, 1000):
+        matrix_time, heap_time = benchmark_dijkstra(side, side, with_matrix=side <= 40)
+        matrix_text = f"{matrix_time:>10.4f}" if matrix_time is not None else f"{'-':>10}"
+        print(f"{side * side:>10,} {matrix_text} {heap_time:>10.4f}")
+
+    
+    print()
+    print("Weighted grids as adjacency lists and CSR (MB, seconds per query)")
+    print(f"{'nodes':>10} {'list MB':>10} {'csr MB':>10} {'list bfs':>10} {'csr bfs':>10} {'list dijk':>10} {'csr dijk':>10}")
+    for side in (100, 300, 700):
+        list_bytes, csr_bytes, list_bfs, csr_bfs, list_dijkstra, csr_dijkstra = benchmark_csr(side, side)
+        print(f"{side * side:>10,} {list_bytes / 2**20:>10.1f} {csr_bytes / 2**20:>10.1f} {list_bfs:>10.4f} "
+              f"{csr_bfs:>10.4f} {list_dijkstra:>10.4f} {csr_dijkstra:>10.4f}")
+    
+    print()
+    print("Point-to-point searches on weighted grids (nodes expanded, seconds per query)")
+    for side in (100, 300, 700):
+        print(f"{side * side:,} nodes")
+        for name, (expanded, seconds) in benchmark_point_to_point(side, side).items():
+            print(f"{name:>24} {expanded:>12,.0f} {seconds:>10.4f}")
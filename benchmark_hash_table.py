@@ -0,0 +1,108 @@
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from hash_table_chaining import HashTableSC
+from hash_table_concurrent import ConcurrentHashTable
+from hash_table_mapped import MappedHashTable
+
+class GlobalLockHashTable(HashTableSC):
+    """Baseline for the concurrency benchmark, a chaining table behind one global lock.
+    """
+    def __init__(self, hash_function=None, max_size=256):
+        self.__lock__ = threading.Lock()
+        super().__init__(hash_function, max_size)
+
+    def __find_entry__(self, key: object) -> 'HashTableSC.ListNode':
+        with self.__lock__:
+            return super().__find_entry__(key)
+
+    def insert(self, key: object, value: object) -> None:
+        with self.__lock__:
+            super().insert(key, value)
+
+def benchmark_concurrent_throughput(table_type, threads: int, operations: int, write_ratio: float = 0.2) -> float:
+    """Runs a mixed read/write workload on a shared table from a thread pool.
+
+    Args:
+        table_type (type): Table class to construct, called with max_size=1024.
+        threads (int): Number of worker threads.
+        operations (int): Operations executed by each thread.
+        write_ratio (float, optional): Fraction of operations that are inserts. Defaults to 0.2.
+
+    Returns:
+        float: Throughput in operations per second.
+    """
+    table = table_type(max_size=1024)
+    for key in range(1024):
+        table[key] = key
+
+    writes_every = max(1, int(1 / write_ratio)) if write_ratio > 0 else operations + 1
+    def worker(seed):
+        for i in range(operations):
+            key = (seed * 7919 + i * 31) % 4096
+            if i % writes_every == 0:
+                table[key] = i
+            else:
+                table.get(key)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+    return threads * operations / elapsed
+
+def benchmark_mapped_startup(size: int, lookups: int = 10000) -> 'tuple[float, float, float, float]':
+    """Compares rebuilding a table in memory with opening the same pairs from a mapped file.
+
+    Args:
+        size (int): Number of pairs in the table.
+        lookups (int, optional): Number of lookups timed on each table. Defaults to 10000.
+
+    Returns:
+        tuple[float, float, float, float]: Seconds for (rebuild, open, in-memory lookups,
+        mapped lookups).
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.plht")
+
+        start = time.perf_counter()
+        table = HashTableSC(max_size=size)
+        for key in range(size):
+            table[key] = key
+        rebuild = time.perf_counter() - start
+        MappedHashTable.write(table, path)
+
+        start = time.perf_counter()
+        mapped = MappedHashTable(path)
+        opened = time.perf_counter() - start
+
+        keys = [(i * 7919) % size for i in range(lookups)]
+        start = time.perf_counter()
+        for key in keys:
+            table.get(key)
+        memory_lookups = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            mapped.get(key)
+        mapped_lookups = time.perf_counter() - start
+
+        mapped.close()
+        return (rebuild, opened, memory_lookups, mapped_lookups)
+
+if __name__ == '__main__':
+    print("Concurrent throughput (ops/s), 20% writes")
+    print(f"{'threads':>8} {'global lock':>14} {'lock striping':>14}")
+    for threads in (1, 2, 4, 8, 16):
+        baseline = benchmark_concurrent_throughput(GlobalLockHashTable, threads, 20000)
+        striped = benchmark_concurrent_throughput(ConcurrentHashTable, threads, 20000)
+        print(f"{threads:>8} {baseline:>14,.0f} {striped:>14,.0f}")
+
+    print()
+    print("Startup: rebuild in memory vs open mapped file (seconds)")
+    print(f"{'pairs':>10} {'rebuild':>10} {'open':>10} {'lookups':>10} {'mapped':>10}")
+    for size in (10000, 100000, 1000000):
+        rebuild, opened, memory_lookups, mapped_lookups = benchmark_mapped_startup(size)
+        print(f"{size:>10} {rebuild:>10.4f} {opened:>10.6f} {memory_lookups:>10.4f} {mapped_lookups:>10.4f}")
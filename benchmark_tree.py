@@ -0,0 +1,349 @@
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from tree_avl import AVLTree
+from tree_avl_concurrent import ConcurrentAVLTree
+from tree_avl_persistent import PersistentAVLTree
+from tree_avl_sets import SetOperation, set_operation
+from tree_sorted_blocks import SortedBlockList
+
+class RecursiveAVLTree(AVLTree):
+    """Baseline for the tree benchmarks, the previous AVL insert/remove: a membership walk
+    followed by a second recursive descent for inserts, and a recursive remove that
+    rebalances every node on the way back up.
+    """
+    def insert(self, value: object) -> bool:
+        if value is None or value in self:
+            return False
+        self.__root__ = self.__insert_recursive__(value, self.__root__)
+        self.count = self.count + 1
+        return True
+
+    def remove(self, value: object) -> bool:
+        if value not in self:
+            return False
+        self.__root__ = self.__remove_recursive__(value, self.__root__)
+        self.count = self.count - 1
+        return True
+
+    def __insert_recursive__(self, value: object, node: AVLTree.Node) -> AVLTree.Node:
+        if node is None:
+            return self.Node(value)
+        if value < node.value:
+            node.left = self.__insert_recursive__(value, node.left)
+        else:
+            node.right = self.__insert_recursive__(value, node.right)
+        self.__update_node__(node)
+        return self.__balance_tree__(node)
+
+    def __remove_recursive__(self, value: object, node: AVLTree.Node) -> AVLTree.Node:
+        if value < node.value:
+            node.left = self.__remove_recursive__(value, node.left)
+        elif node.value < value:
+            node.right = self.__remove_recursive__(value, node.right)
+        elif not node.left:
+            return node.right
+        elif not node.right:
+            return node.left
+        else:
+            successor = self.__find_min__(node.right)
+            node.value = successor.value
+            node.right = self.__remove_recursive__(successor.value, node.right)
+        self.__update_node__(node)
+        return self.__balance_tree__(node)
+
+class GlobalLockAVLTree(AVLTree):
+    """Baseline for the contention benchmark, an AVL tree behind one global lock.
+    """
+    def __init__(self) -> None:
+        self.__lock__ = threading.Lock()
+        super().__init__()
+
+    def __contains__(self, value: object) -> bool:
+        with self.__lock__:
+            return super().__contains__(value)
+
+    def insert(self, value: object) -> bool:
+        with self.__lock__:
+            return super().insert(value)
+
+    def remove(self, value: object) -> bool:
+        with self.__lock__:
+            return super().remove(value)
+
+def benchmark_insert_remove(tree_type, size: int, seed: int = 0) -> 'tuple[float, float]':
+    """Times inserting size shuffled values and then removing them in another order.
+
+    Args:
+        tree_type (type): Tree class to construct.
+        size (int): Number of values.
+        seed (int, optional): Seed for the shuffles. Defaults to 0.
+
+    Returns:
+        tuple[float, float]: (inserts per second, removals per second)
+    """
+    generator = random.Random(seed)
+    values = list(range(size))
+    generator.shuffle(values)
+    tree = tree_type()
+
+    start = time.perf_counter()
+    for value in values:
+        tree.insert(value)
+    inserts = size / (time.perf_counter() - start)
+
+    generator.shuffle(values)
+    start = time.perf_counter()
+    for value in values:
+        tree.remove(value)
+    removals = size / (time.perf_counter() - start)
+
+    assert(tree.count == 0)
+    return (inserts, removals)
+
+def benchmark_bulk_load(size: int, seed: int = 0) -> 'tuple[float, float, float]':
+    """Times building a tree with repeated inserts against the bulk loaders.
+
+    Args:
+        size (int): Number of values.
+        seed (int, optional): Seed for the shuffle. Defaults to 0.
+
+    Returns:
+        tuple[float, float, float]: Seconds for (inserts, from_sorted, from_iterable).
+    """
+    values = list(range(size))
+    random.Random(seed).shuffle(values)
+
+    start = time.perf_counter()
+    tree = AVLTree()
+    for value in values:
+        tree.insert(value)
+    inserts = time.perf_counter() - start
+
+    start = time.perf_counter()
+    AVLTree.from_sorted(range(size))
+    from_sorted = time.perf_counter() - start
+
+    start = time.perf_counter()
+    AVLTree.from_iterable(values)
+    from_iterable = time.perf_counter() - start
+    return (inserts, from_sorted, from_iterable)
+
+def benchmark_set_operations(first_size: int, second_size: int, processes: int = 2, seed: int = 0) -> 'dict[str, tuple[float, float, float]]':
+    """Times each set operation done naively (iterate one tree, insert into or remove from
+    a copy of the other) against the join-based algorithm, sequential and with a process
+    pool.
+
+    Args:
+        first_size (int): Values in the first tree.
+        second_size (int): Values in the second tree.
+        processes (int, optional): Worker processes for the parallel run. Defaults to 2.
+        seed (int, optional): Seed for the sampled values. Defaults to 0.
+
+    Returns:
+        dict[str, tuple[float, float, float]]: Seconds for (naive, join-based, parallel)
+        keyed by operation name.
+    """
+    generator = random.Random(seed)
+    first = AVLTree.from_sorted(sorted(generator.sample(range(first_size * 4), first_size)))
+    second = AVLTree.from_sorted(sorted(generator.sample(range(first_size * 4), second_size)))
+
+    def naive(operation):
+        if operation == SetOperation.UNION:
+            result = first.copy()
+            for value in second:
+                result.insert(value)
+        elif operation == SetOperation.INTERSECTION:
+            result = AVLTree()
+            for value in second:
+                if value in first:
+                    result.insert(value)
+        else:
+            result = first.copy()
+            for value in second:
+                result.remove(value)
+        return result
+
+    results = {}
+    for operation in SetOperation:
+        timings = []
+        for run in (naive,
+                    lambda operation: set_operation(operation, first, second),
+                    lambda operation: set_operation(operation, first, second, processes, threshold=first_size // 4)):
+            start = time.perf_counter()
+            run(operation)
+            timings.append(time.perf_counter() - start)
+        results[operation.name.lower()] = tuple(timings)
+    return results
+
+def benchmark_ordered_containers(container_type, size: int, seed: int = 0) -> 'tuple[float, float, float]':
+    """Times the main operations of an ordered container with the TreeBST API.
+
+    Args:
+        container_type (type): Container class to construct.
+        size (int): Number of values inserted.
+        seed (int, optional): Seed for the shuffle. Defaults to 0.
+
+    Returns:
+        tuple[float, float, float]: Seconds for (size inserts, size lookups with half of
+        them missing, 1000 range scans of 100 values each).
+    """
+    generator = random.Random(seed)
+    values = list(range(0, size * 2, 2))
+    generator.shuffle(values)
+    container = container_type()
+
+    start = time.perf_counter()
+    for value in values:
+        container.insert(value)
+    inserts = time.perf_counter() - start
+
+    probes = [generator.randrange(size * 2) for _ in range(size)]
+    start = time.perf_counter()
+    for probe in probes:
+        probe in container
+    lookups = time.perf_counter() - start
+
+    lows = [generator.randrange(size * 2) for _ in range(1000)]
+    start = time.perf_counter()
+    for low in lows:
+        for _ in container.range(low, low + 200):
+            pass
+    scans = time.perf_counter() - start
+    return (inserts, lookups, scans)
+
+def benchmark_snapshots(size: int, updates: int, seed: int = 0) -> 'tuple[int, int, float, float]':
+    """Measures how much two versions of a persistent tree share: a snapshot is taken, then
+    updates random inserts and removals are applied to the tree.
+
+    Args:
+        size (int): Number of values in the first version.
+        updates (int): Inserts and removals applied after the snapshot.
+        seed (int, optional): Seed for the updates. Defaults to 0.
+
+    Returns:
+        tuple[int, int, float, float]: (distinct nodes across both versions, nodes two full
+        copies would need, seconds for snapshot(), seconds for copy())
+    """
+    def nodes(root):
+        # Ids of every node reachable from the root
+        found = set()
+        stack = [root] if root else []
+        while stack:
+            node = stack.pop()
+            found.add(id(node))
+            stack.extend(child for child in (node.left, node.right) if child)
+        return found
+
+    generator = random.Random(seed)
+    tree = PersistentAVLTree.from_sorted(range(0, size * 2, 2))
+
+    start = time.perf_counter()
+    snapshot = tree.snapshot()
+    snapshot_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree.copy()
+    copy_time = time.perf_counter() - start
+
+    for _ in range(updates):
+        value = generator.randrange(size * 2)
+        if generator.random() < 0.5:
+            tree.insert(value)
+        else:
+            tree.remove(value)
+    return (len(nodes(snapshot.__root__) | nodes(tree.__root__)), snapshot.count + tree.count, snapshot_time, copy_time)
+
+def benchmark_contention(tree_type, threads: int, operations: int, write_ratio: float = 0.1) -> float:
+    """Runs a mixed lookup/insert/remove workload on a shared tree from a thread pool.
+
+    Args:
+        tree_type (type): Tree class to construct.
+        threads (int): Number of worker threads.
+        operations (int): Operations executed by each thread.
+        write_ratio (float, optional): Fraction of operations that are writes, alternating
+        between inserts and removals. Defaults to 0.1.
+
+    Returns:
+        float: Throughput in operations per second.
+    """
+    tree = tree_type()
+    for value in range(0, 20000, 2):
+        tree.insert(value)
+
+    writes_every = max(1, int(1 / write_ratio)) if write_ratio > 0 else operations + 1
+    def worker(seed):
+        for i in range(operations):
+            value = (seed * 7919 + i * 31) % 20000
+            if i % writes_every == 0:
+                if i % (2 * writes_every):
+                    tree.remove(value)
+                else:
+                    tree.insert(value)
+            else:
+                value in tree
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+    return threads * operations / elapsed
+
+if __name__ == '__main__':
+    sys.setrecursionlimit(10000)
+
+    print("AVL insert/remove throughput (ops/s)")
+    print(f"{'size':>10} {'recursive ins':>14} {'iterative ins':>14} {'recursive rem':>14} {'iterative rem':>14}")
+    for size in (1000, 10000, 100000):
+        recursive_inserts, recursive_removals = benchmark_insert_remove(RecursiveAVLTree, size)
+        iterative_inserts, iterative_removals = benchmark_insert_remove(AVLTree, size)
+        print(f"{size:>10} {recursive_inserts:>14,.0f} {iterative_inserts:>14,.0f} {recursive_removals:>14,.0f} {iterative_removals:>14,.0f}")
+
+    print()
+    print("AVL construction (seconds)")
+    print(f"{'size':>10} {'inserts':>10} {'from_sorted':>12} {'from_iterable':>14}")
+    for size in (10000, 100000, 1000000):
+        inserts, from_sorted, from_iterable = benchmark_bulk_load(size)
+        print(f"{size:>10} {inserts:>10.3f} {from_sorted:>12.3f} {from_iterable:>14.3f}")
+
+    for first_size, second_size in ((200000, 200000), (200000, 20000)):
+        print()
+        print(f"Set operations, {first_size:,} and {second_size:,} values (seconds)")
+        print(f"{'operation':>14} {'naive':>10} {'join-based':>11} {'parallel':>10}")
+        for name, (naive, joined, parallel) in benchmark_set_operations(first_size, second_size).items():
+            print(f"{name:>14} {naive:>10.3f} {joined:>11.3f} {parallel:>10.3f}")
+
+    print()
+    print("AVLTree vs SortedBlockList (seconds)")
+    print(f"{'size':>10} {'operation':>10} {'AVLTree':>10} {'blocks':>10}")
+    for size in (10000, 100000, 1000000):
+        tree = benchmark_ordered_containers(AVLTree, size)
+        blocks = benchmark_ordered_containers(SortedBlockList, size)
+        for name, tree_time, blocks_time in zip(("insert", "lookup", "range"), tree, blocks):
+            print(f"{size:>10} {name:>10} {tree_time:>10.3f} {blocks_time:>10.3f}")
+
+    print()
+    print("Persistent AVL insert/remove throughput (ops/s)")
+    print(f"{'size':>10} {'mutable ins':>14} {'persistent ins':>14} {'mutable rem':>14} {'persistent rem':>14}")
+    for size in (1000, 10000, 100000):
+        mutable_inserts, mutable_removals = benchmark_insert_remove(AVLTree, size)
+        persistent_inserts, persistent_removals = benchmark_insert_remove(PersistentAVLTree, size)
+        print(f"{size:>10} {mutable_inserts:>14,.0f} {persistent_inserts:>14,.0f} {mutable_removals:>14,.0f} {persistent_removals:>14,.0f}")
+
+    print()
+    print("Persistent AVL snapshot followed by updates (nodes shared between the two versions)")
+    print(f"{'size':>10} {'updates':>8} {'nodes':>10} {'two copies':>11} {'snapshot s':>11} {'copy s':>8}")
+    for size in (100000, 1000000):
+        for updates in (1, 100, 10000):
+            distinct, copies, snapshot_time, copy_time = benchmark_snapshots(size, updates)
+            print(f"{size:>10} {updates:>8} {distinct:>10,} {copies:>11,} {snapshot_time:>11.6f} {copy_time:>8.3f}")
+
+    print()
+    print("Shared tree throughput, 10% writes (ops/s)")
+    print(f"{'threads':>8} {'global lock':>12} {'concurrent':>12}")
+    for threads in (1, 2, 4, 8, 16):
+        global_lock = benchmark_contention(GlobalLockAVLTree, threads, 20000)
+        concurrent = benchmark_contention(ConcurrentAVLTree, threads, 20000)
+        print(f"{threads:>8} {global_lock:>12,.0f} {concurrent:>12,.0f}")
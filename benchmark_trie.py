@@ -0,0 +1,382 @@
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from trie import Trie
+from trie_aho_corasick import AhoCorasick
+from trie_frozen import FrozenTrie
+from trie_radix import RadixTrie
+
+class AlphabetTrie(Trie):
+    """Baseline for the trie benchmarks, the previous node layout: every node allocates a
+    26-slot list indexed by lowercase letter, leaves included.
+    """
+    class Node(object):
+        def __init__(self) -> None:
+            self.is_terminal = False
+            self.children = [None for _ in range(26)]
+
+    def __contains__(self, string: str) -> bool:
+        node = self.__head__
+        for character in string:
+            node = node.children[ord(character.lower()) - ord('a')]
+            if not node:
+                return False
+        return node.is_terminal
+
+    def insert(self, string: str) -> None:
+        node = self.__head__
+        for character in string:
+            index = ord(character.lower()) - ord('a')
+            if not node.children[index]:
+                node.children[index] = self.Node()
+            node = node.children[index]
+        node.is_terminal = True
+
+class UnprunedTrie(Trie):
+    """Baseline for the churn benchmark, a remove that only unmarks the word and never
+    frees the nodes left unused.
+    """
+    def remove(self, string: str) -> None:
+        node = self.__find__(string)
+        if node and node.is_terminal:
+            node.is_terminal = False
+
+def generate_words(count: int, seed: int = 0, alphabet: str = "etaoinshrdlcumwfgypbvkjxqz") -> 'list[str]':
+    """Generates distinct dictionary-like words: lengths of 3 to 14 characters, letters
+    skewed towards the start of the alphabet string like English letter frequencies.
+
+    Args:
+        count (int): Number of words.
+        seed (int, optional): Seed for the generator. Defaults to 0.
+        alphabet (str, optional): Letters, most frequent first. Defaults to English order.
+
+    Returns:
+        list[str]: The words in random order.
+    """
+    generator = random.Random(seed)
+    weights = [1 / (rank + 2) for rank in range(len(alphabet))]
+    words = set()
+    while len(words) < count:
+        length = min(14, 3 + int(generator.expovariate(0.35)))
+        words.add("".join(generator.choices(alphabet, weights, k=length)))
+    words = list(words)
+    generator.shuffle(words)
+    return words
+
+def generate_urls(count: int, seed: int = 0) -> 'list[str]':
+    """Generates distinct URLs sharing long prefixes: a few hosts, nested path segments and
+    numeric ids.
+
+    Args:
+        count (int): Number of URLs.
+        seed (int, optional): Seed for the generator. Defaults to 0.
+
+    Returns:
+        list[str]: The URLs in random order.
+    """
+    generator = random.Random(seed)
+    hosts = [f"https://{name}.example.com/" for name in ("www", "api", "static", "docs")]
+    segments = ["v1", "v2", "users", "projects", "repositories", "settings", "assets", "images", "reports"]
+    urls = set()
+    while len(urls) < count:
+        path = "/".join(generator.choices(segments, k=generator.randrange(1, 5)))
+        urls.add(f"{generator.choice(hosts)}{path}/{generator.randrange(10 ** 6)}")
+    urls = list(urls)
+    generator.shuffle(urls)
+    return urls
+
+def benchmark_memory_per_key(trie_type, words: 'list[str]') -> 'tuple[float, float, float]':
+    """Measures the memory a trie allocates for the words and the time to build and query it.
+
+    Args:
+        trie_type (type): Trie class to construct.
+        words (list[str]): Words to insert.
+
+    Returns:
+        tuple[float, float, float]: (bytes per word, seconds to insert, seconds to look
+        every word up)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    trie = trie_type()
+    for word in words:
+        trie.insert(word)
+    inserts = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for word in words:
+        word in trie
+    lookups = time.perf_counter() - start
+    return (allocated / len(words), inserts, lookups)
+
+def benchmark_completions(words: 'list[str]', queries: int = 10000, k: int = 5, seed: int = 0) -> 'tuple[float, float, float]':
+    """Times top-k completion queries for short random prefixes against ranking every
+    word with the prefix on each query.
+
+    Args:
+        words (list[str]): Words to insert, each with a random weight.
+        queries (int, optional): Number of queries. Defaults to 10000.
+        k (int, optional): Completions per query. Defaults to 5.
+        seed (int, optional): Seed for the weights and prefixes. Defaults to 0.
+
+    Returns:
+        tuple[float, float, float]: Microseconds per query for (full ranking, cold cache,
+        warm cache).
+    """
+    generator = random.Random(seed)
+    trie = Trie()
+    weights = {}
+    for word in words:
+        weights[word] = generator.random()
+        trie.insert(word, weights[word])
+    prefixes = [generator.choice(words)[:generator.randrange(1, 4)] for _ in range(queries)]
+
+    start = time.perf_counter()
+    for prefix in prefixes:
+        sorted(trie.starts_with(prefix), key=lambda word: (-weights[word], word))[:k]
+    full = time.perf_counter() - start
+
+    timings = []
+    for _ in range(2):
+        start = time.perf_counter()
+        for prefix in prefixes:
+            trie.top_k_completions(prefix, k)
+        timings.append(time.perf_counter() - start)
+    return (full / queries * 1e6, timings[0] / queries * 1e6, timings[1] / queries * 1e6)
+
+def benchmark_frozen(words: 'list[str]') -> 'tuple[int, int, float, float, float]':
+    """Compares a mutable Trie with its frozen, mapped form.
+
+    Args:
+        words (list[str]): Words to insert.
+
+    Returns:
+        tuple[int, int, float, float, float]: (Trie bytes, frozen file bytes, seconds to open
+        the file, seconds to look every word up in the Trie, same in the frozen trie)
+    """
+    tracemalloc.start()
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    trie_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "words.pldw")
+        FrozenTrie.write(trie, path)
+        frozen_bytes = os.path.getsize(path)
+
+        start = time.perf_counter()
+        frozen = FrozenTrie(path)
+        opening = time.perf_counter() - start
+
+        timings = []
+        for structure in (trie, frozen):
+            start = time.perf_counter()
+            for word in words:
+                word in structure
+            timings.append(time.perf_counter() - start)
+        frozen.close()
+    return (trie_bytes, frozen_bytes, opening, timings[0], timings[1])
+
+def benchmark_fuzzy(words: 'list[str]', max_distance: int, queries: int = 5, seed: int = 0) -> 'tuple[float, float, int]':
+    """Times Trie.fuzzy_search against a full scan computing the edit distance to every
+    word of a matching length. Queries are dictionary words with one random substitution.
+
+    Args:
+        words (list[str]): Dictionary words.
+        max_distance (int): Max edit distance.
+        queries (int, optional): Number of queries. Defaults to 5.
+        seed (int, optional): Seed for the queries. Defaults to 0.
+
+    Returns:
+        tuple[float, float, int]: (seconds per query for the scan, seconds per query for
+        the trie, total matches)
+    """
+    generator = random.Random(seed)
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    probes = []
+    for word in generator.sample(words, queries):
+        position = generator.randrange(len(word))
+        probes.append(word[:position] + generator.choice("abcxyz") + word[position + 1:])
+
+    def distance(first, second):
+        row = list(range(len(second) + 1))
+        for character in first:
+            row = Trie.__levenshtein_row__(second, row, character)
+        return row[-1]
+
+    start = time.perf_counter()
+    scanned = []
+    for probe in probes:
+        scanned.append(sorted((word, distance(word, probe)) for word in words
+                              if abs(len(word) - len(probe)) <= max_distance and distance(word, probe) <= max_distance))
+    scan = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    found = [trie.fuzzy_search(probe, max_distance) for probe in probes]
+    search = (time.perf_counter() - start) / queries
+    assert(found == scanned)
+    return (scan, search, sum(len(matches) for matches in found))
+
+def benchmark_keyword_scan(keyword_count: int, line_count: int, seed: int = 0) -> 'tuple[float, float, int]':
+    """Scans generated log lines for keywords, with one 'in' check per keyword per line
+    against a single Aho-Corasick pass over the lines as chunks.
+
+    Args:
+        keyword_count (int): Number of keywords.
+        line_count (int): Number of log lines.
+        seed (int, optional): Seed for the keywords and lines. Defaults to 0.
+
+    Returns:
+        tuple[float, float, int]: (MB/s for the 'in' checks, MB/s for Aho-Corasick, matches)
+    """
+    generator = random.Random(seed)
+    keywords = generate_words(keyword_count, seed)
+    filler = generate_words(5000, seed + 1)
+    lines = []
+    for number in range(line_count):
+        words = generator.choices(filler, k=12)
+        if generator.random() < 0.1:
+            words[generator.randrange(12)] = generator.choice(keywords)
+        lines.append(f"2024-01-01 12:00:{number % 60:02d} INFO " + " ".join(words) + "\n")
+    megabytes = sum(len(line) for line in lines) / 2 ** 20
+
+    start = time.perf_counter()
+    naive = sum(1 for line in lines for keyword in keywords if keyword in line)
+    naive_time = time.perf_counter() - start
+
+    automaton = AhoCorasick(keywords)
+    start = time.perf_counter()
+    matched = set()
+    for position, _ in automaton.scan(lines):
+        matched.add(position)
+    automaton_time = time.perf_counter() - start
+    return (megabytes / naive_time, megabytes / automaton_time, len(matched))
+
+def benchmark_bulk_insert(words: 'list[str]') -> 'tuple[float, float]':
+    """Times inserting sorted words one at a time against insert_many(). The benchmark
+    owns the process, so the cyclic garbage collector is paused around both runs.
+
+    Args:
+        words (list[str]): Words to insert.
+
+    Returns:
+        tuple[float, float]: Seconds for (insert loop, insert_many).
+    """
+    words = sorted(words)
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        trie = Trie()
+        for word in words:
+            trie.insert(word)
+        inserts = time.perf_counter() - start
+
+        start = time.perf_counter()
+        Trie().insert_many(words)
+        return (inserts, time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+def benchmark_churn(trie_type, rounds: int, batch: int, seed: int = 0) -> 'list[float]':
+    """Keeps a fixed number of words stored while replacing a batch of them each round,
+    sampling the memory the trie holds after every round.
+
+    Args:
+        trie_type (type): Trie class to construct.
+        rounds (int): Number of rounds.
+        batch (int): Words removed and inserted per round, also the number stored.
+        seed (int, optional): Seed for the words. Defaults to 0.
+
+    Returns:
+        list[float]: MB allocated after each round.
+    """
+    words = iter(generate_words(batch * (rounds + 1), seed))
+    tracemalloc.start()
+    trie = trie_type()
+    stored = [next(words) for _ in range(batch)]
+    trie.insert_many(sorted(stored))
+    samples = []
+    for _ in range(rounds):
+        for word in stored:
+            trie.remove(word)
+        stored = [next(words) for _ in range(batch)]
+        trie.insert_many(sorted(stored))
+        samples.append(tracemalloc.get_traced_memory()[0] / 2 ** 20)
+    tracemalloc.stop()
+    return samples
+
+if __name__ == '__main__':
+    print("Trie memory and speed (bytes per word, seconds)")
+    print(f"{'words':>10} {'layout':>10} {'bytes/word':>11} {'insert':>8} {'lookup':>8}")
+    for count in (10000, 100000, 1000000):
+        words = generate_words(count)
+        layouts = (("26-slot", AlphabetTrie), ("compact", Trie)) if count <= 100000 else (("compact", Trie),)
+        for name, trie_type in layouts:
+            per_word, inserts, lookups = benchmark_memory_per_key(trie_type, words)
+            print(f"{count:>10} {name:>10} {per_word:>11,.0f} {inserts:>8.2f} {lookups:>8.2f}")
+
+    words = generate_words(100000, alphabet="абвгдеёжзийклмнопрстуфхцчшщъыьэюя")
+    per_word, inserts, lookups = benchmark_memory_per_key(Trie, words)
+    print(f"{len(words):>10} {'cyrillic':>10} {per_word:>11,.0f} {inserts:>8.2f} {lookups:>8.2f}")
+
+    print()
+    print("Per-character vs radix trie on URLs (bytes per key, seconds)")
+    print(f"{'keys':>10} {'trie':>10} {'bytes/key':>11} {'insert':>8} {'lookup':>8}")
+    for count in (10000, 100000, 500000):
+        urls = generate_urls(count)
+        for name, trie_type in (("per-char", Trie), ("radix", RadixTrie)):
+            per_key, inserts, lookups = benchmark_memory_per_key(trie_type, urls)
+            print(f"{count:>10} {name:>10} {per_key:>11,.0f} {inserts:>8.2f} {lookups:>8.2f}")
+
+    print()
+    print("Top-5 completions for 1-3 character prefixes (microseconds per query)")
+    print(f"{'words':>10} {'full rank':>10} {'cold':>10} {'warm':>10}")
+    for count in (10000, 100000):
+        full, cold, warm = benchmark_completions(generate_words(count))
+        print(f"{count:>10} {full:>10,.1f} {cold:>10,.1f} {warm:>10,.1f}")
+
+    print()
+    print("Mutable vs frozen (DAWG) trie")
+    print(f"{'words':>10} {'trie MB':>8} {'frozen MB':>10} {'open s':>8} {'trie lookup':>12} {'frozen lookup':>14}")
+    for count in (10000, 100000, 1000000):
+        trie_bytes, frozen_bytes, opening, trie_lookups, frozen_lookups = benchmark_frozen(generate_words(count))
+        print(f"{count:>10} {trie_bytes / 2 ** 20:>8.1f} {frozen_bytes / 2 ** 20:>10.1f} {opening:>8.5f} {trie_lookups:>12.2f} {frozen_lookups:>14.2f}")
+
+    print()
+    print("Fuzzy search on 500,000 words (seconds per query)")
+    print(f"{'distance':>9} {'full scan':>10} {'trie':>10} {'matches':>8}")
+    words = generate_words(500000)
+    for max_distance in (1, 2):
+        scan, search, matches = benchmark_fuzzy(words, max_distance)
+        print(f"{max_distance:>9} {scan:>10.3f} {search:>10.3f} {matches:>8}")
+
+    print()
+    print("Keyword scan throughput over 20,000 log lines (MB/s)")
+    print(f"{'keywords':>9} {'in checks':>10} {'automaton':>10}")
+    for keyword_count in (100, 1000, 5000):
+        naive, automaton, _ = benchmark_keyword_scan(keyword_count, 20000)
+        print(f"{keyword_count:>9} {naive:>10.2f} {automaton:>10.2f}")
+
+    print()
+    print("Sorted insert loop vs insert_many (seconds)")
+    print(f"{'words':>10} {'insert':>8} {'insert_many':>12}")
+    for count in (100000, 1000000):
+        inserts, bulk = benchmark_bulk_insert(generate_words(count))
+        print(f"{count:>10} {inserts:>8.2f} {bulk:>12.2f}")
+
+    print()
+    print("Memory under churn, 20,000 words replaced per round (MB)")
+    unpruned = benchmark_churn(UnprunedTrie, 10, 20000)
+    pruned = benchmark_churn(Trie, 10, 20000)
+    print(f"{'round':>6} {'no pruning':>11} {'pruning':>8}")
+    for round_number, (unpruned_size, pruned_size) in enumerate(zip(unpruned, pruned), 1):
+        print(f"{round_number:>6} {unpruned_size:>11.1f} {pruned_size:>8.1f}")
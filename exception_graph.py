@@ -0,0 +1,5 @@
+from exception_base import PythonLibraryException
+
+class GraphException(PythonLibraryException):
+    def __init__(self, __classname__, message):
+        super().__init__("Data Structures", __classname__, message)
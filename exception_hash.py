@@ -3,3 +3,7 @@ from exception_base import PythonLibraryException
 class HashException(PythonLibraryException):
     def __init__(self, __classname__, message):
         super().__init__("Data Structures", __classname__, message)
+
+class HashKeyException(HashException, KeyError):
+    def __init__(self, __classname__, message):
+        super().__init__(__classname__, message)
@@ -0,0 +1,227 @@
+from exception_filter import FilterException
+
+class MembershipFilterBase(object):
+    """Base probabilistic membership filter, only meant to be inherited. A filter can answer
+    'definitely not present' or 'maybe present' using far less memory than the set of keys
+    itself. It never gives false negatives, 'maybe present' is wrong at most error_rate of
+    the time while the filter holds no more than capacity keys.
+    """
+    # Constants
+    MASK_64 = (1 << 64) - 1
+    SUPPORTS_REMOVE = False
+
+    # Constructor
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """Constructor for the filter, sized for the given capacity and error rate.
+
+        Args:
+            capacity (int): Number of keys the filter is sized for.
+            error_rate (float, optional): Target false positive rate at capacity. Defaults to 0.01.
+
+        Raises:
+            FilterException: Raised if capacity is less than 1 or error_rate isn't in (0, 1).
+        """
+        if capacity < 1:
+            raise FilterException(self.__class__.__name__, f"Capacity must be at least 1, got {capacity}.")
+        if not 0 < error_rate < 1:
+            raise FilterException(self.__class__.__name__, f"Error rate must be between 0 and 1, got {error_rate}.")
+
+        # Public
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = 0
+
+    # Operator Overloads
+    def __len__(self) -> int:
+        """Number of keys added to the filter.
+
+        Returns:
+            int: Count of added keys.
+        """
+        return self.count
+
+    # Comparison Operators
+    def __contains__(self, key: object) -> bool:
+        """Comparison operator 'in' override. False means the key was never added, True
+        means it maybe was.
+
+        Args:
+            key (object): Key to check.
+
+        Returns:
+            bool: True if the key may have been added.
+        """
+        raise FilterException(self.__class__.__name__, "'__contains__' method not implemented")
+
+    # Public Methods
+    def add(self, key: object) -> None:
+        """Adds the key to the filter.
+
+        Args:
+            key (object): Key to add, must be hashable.
+        """
+        raise FilterException(self.__class__.__name__, "'add()' method not implemented")
+
+    def remove(self, key: object) -> None:
+        """Removes a key that was previously added. Removing a key that was never added can
+        remove another key and cause false negatives.
+
+        Args:
+            key (object): Key to remove.
+        """
+        raise FilterException(self.__class__.__name__, "Filter does not support removal.")
+
+    def clear(self) -> None:
+        """Resets the filter to hold no keys.
+        """
+        raise FilterException(self.__class__.__name__, "'clear()' method not implemented")
+
+    def expected_false_positive_rate(self) -> float:
+        """Theoretical false positive rate given the number of keys currently added.
+
+        Returns:
+            float: Probability that a key that was never added is reported as maybe present.
+        """
+        raise FilterException(self.__class__.__name__, "'expected_false_positive_rate()' method not implemented")
+
+    # Helper (Private) Methods
+    def __hash_pair__(self, key: object) -> 'tuple[int, int]':
+        """Derives two independent 64-bit hashes from the key's builtin hash, used for
+        double hashing. This is a private function and should only be called internally.
+
+        Args:
+            key (object): Key to hash.
+
+        Returns:
+            tuple[int, int]: Two 64-bit hashes, the second one is always odd.
+        """
+        first = self.__mix__(hash(key) & self.MASK_64)
+        return (first, self.__mix__(first) | 1)
+
+    @staticmethod
+    def __mix__(value: int) -> int:
+        """SplitMix64 finalizer, scrambles the bits of a 64-bit value. This is a private
+        function and should only be called internally.
+
+        Args:
+            value (int): 64-bit value.
+
+        Returns:
+            int: Scrambled 64-bit value.
+        """
+        mask = MembershipFilterBase.MASK_64
+        value = (value + 0x9E3779B97F4A7C15) & mask
+        value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & mask
+        return value ^ (value >> 31)
+
+class FilterGuard(object):
+    """Puts a membership filter in front of a structure that supports 'in' and insert()
+    (e.g. HashTableSC or Trie), so definite misses are answered by the filter without
+    touching the structure. Inserts and removals must go through the guard to keep the
+    filter in sync. Filters that can't remove keys only get less selective after removals,
+    answers stay correct. Keys are filtered exactly as given, so a structure that treats
+    different keys as equal (e.g. a table with a case-insensitive hash function) should be
+    given normalized keys.
+    """
+    # Constructor
+    def __init__(self, structure, membership_filter: MembershipFilterBase, keys=None):
+        """Constructor for the guard.
+
+        Args:
+            structure (object): Structure to guard.
+            membership_filter (MembershipFilterBase): Filter to answer misses with.
+            keys (iterable, optional): Keys already stored in the structure, added to the
+            filter. Defaults to None.
+        """
+        # Public
+        self.structure = structure
+        self.filter = membership_filter
+        self.lookups = 0
+        self.filtered = 0
+        self.false_positives = 0
+
+        for key in keys or ():
+            self.filter.add(key)
+
+    # Comparison Operators
+    def __contains__(self, key: object) -> bool:
+        self.lookups = self.lookups + 1
+        if key not in self.filter:
+            self.filtered = self.filtered + 1
+            return False
+
+        found = key in self.structure
+        if not found:
+            self.false_positives = self.false_positives + 1
+        return found
+
+    # Public Methods
+    def get(self, key: object, default: object = None) -> object:
+        """Mapping style get() that skips the structure on a definite miss.
+
+        Args:
+            key (object): Key to get to obtain value.
+            default (object, optional): Value returned if the key isn't found. Defaults to None.
+
+        Returns:
+            object: Value paired with the given key, or default if not found.
+        """
+        self.lookups = self.lookups + 1
+        if key not in self.filter:
+            self.filtered = self.filtered + 1
+            return default
+
+        missing = object()
+        value = self.structure.get(key, missing)
+        if value is missing:
+            self.false_positives = self.false_positives + 1
+            return default
+        return value
+
+    def insert(self, key: object, *args) -> None:
+        """Adds the key to the filter if it's new, then inserts into the structure. The
+        filter goes first so a filter that can't take the key (e.g. a full CuckooFilter)
+        fails before the structure holds a key the filter would deny.
+
+        Args:
+            key (object): Key (or string for a Trie) to insert.
+            *args: Remaining arguments for the structure's insert(), e.g. the value.
+
+        Raises:
+            FilterException: Raised if the filter is too full to add the key, the structure is left unchanged.
+        """
+        new = key not in self.structure
+        if new:
+            self.filter.add(key)
+        try:
+            self.structure.insert(key, *args)
+        except Exception:
+            # A key left in the filter only costs a false positive, but drop it if possible
+            if new and self.filter.SUPPORTS_REMOVE:
+                self.filter.remove(key)
+            raise
+
+    def remove(self, key: object) -> object:
+        """Removes from the structure, and from the filter if it supports removal.
+
+        Args:
+            key (object): Key to remove.
+
+        Returns:
+            object: Whatever the structure's remove() returns.
+        """
+        present = key in self.structure
+        result = self.structure.remove(key)
+        if present and self.filter.SUPPORTS_REMOVE:
+            self.filter.remove(key)
+        return result
+
+    def measured_false_positive_rate(self) -> float:
+        """Fraction of lookups for absent keys that the filter let through to the structure.
+
+        Returns:
+            float: Measured false positive rate, 0 if there were no misses yet.
+        """
+        misses = self.filtered + self.false_positives
+        return self.false_positives / misses if misses else 0.0
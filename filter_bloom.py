@@ -0,0 +1,90 @@
+import math
+from filter_base import *
+
+class BloomFilter(MembershipFilterBase):
+    """Bloom filter stored as a bit array inside of a bytearray. Each key sets k bits whose
+    positions come from double hashing (h1 + i * h2), so only two hashes are computed per
+    key no matter k. Keys can't be removed.
+    """
+    # Constructor
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        super().__init__(capacity, error_rate)
+
+        # Optimal bit count m = -n ln(p) / ln(2)^2 and hash count k = (m / n) ln(2)
+        self.bit_count = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+
+        # Private
+        self.__bits__ = bytearray((self.bit_count + 7) // 8)
+
+    # Comparison Operators
+    def __contains__(self, key: object) -> bool:
+        bits = self.__bits__
+        for position in self.__positions__(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    # Public Methods
+    def add(self, key: object) -> None:
+        bits = self.__bits__
+        for position in self.__positions__(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count = self.count + 1
+
+    def clear(self) -> None:
+        self.__bits__ = bytearray(len(self.__bits__))
+        self.count = 0
+
+    def expected_false_positive_rate(self) -> float:
+        # (1 - e^(-kn/m))^k
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_count)) ** self.hash_count
+
+    def fill_ratio(self) -> float:
+        """Fraction of bits currently set, the measured counterpart of the expected rate.
+
+        Returns:
+            float: Set bits divided by total bits.
+        """
+        set_bits = sum(bin(byte).count("1") for byte in self.__bits__)
+        return set_bits / self.bit_count
+
+    # Helper (Private) Methods
+    def __positions__(self, key: object):
+        """Generator for the k bit positions of the key. This is a private function and
+        should only be called internally.
+
+        Args:
+            key (object): Key to hash.
+        """
+        first, second = self.__hash_pair__(key)
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.bit_count
+
+if __name__ == '__main__':
+    from hash_table_chaining import HashTableSC
+    from trie import Trie
+
+    bloom = BloomFilter(10000, 0.01)
+    for key in range(10000):
+        bloom.add(key)
+    assert(all(key in bloom for key in range(10000)))
+    false_positives = sum(key in bloom for key in range(10000, 110000))
+    print("Bloom bits/hashes:", bloom.bit_count, bloom.hash_count)
+    print("Bloom expected/measured false positive rate:", bloom.expected_false_positive_rate(), false_positives / 100000)
+    assert(false_positives / 100000 < 0.02)
+
+    table = FilterGuard(HashTableSC(), BloomFilter(1000))
+    for key in range(0, 1000, 2):
+        table.insert(key, str(key))
+    assert(all(table.get(key) == str(key) for key in range(0, 1000, 2)))
+    assert(not any(key in table for key in range(1, 1000, 2)))
+    print("Guarded table filtered/false positives:", table.filtered, table.false_positives)
+    table.remove(0)
+    assert(0 not in table)
+
+    trie = FilterGuard(Trie(), BloomFilter(100))
+    for word in ("hello", "help", "world"):
+        trie.insert(word)
+    assert("help" in trie and "hel" not in trie and "word" not in trie)
+    print("Guarded trie measured false positive rate:", trie.measured_false_positive_rate())
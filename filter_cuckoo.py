@@ -0,0 +1,206 @@
+import math
+import random
+from filter_base import *
+
+class CuckooFilter(MembershipFilterBase):
+    """Cuckoo filter storing a small fingerprint of each key in one of two candidate buckets
+    of four slots. The alternate bucket is derived from the fingerprint alone (partial-key
+    cuckoo hashing), so fingerprints can be moved without the original key and keys can be
+    removed. Fingerprints live in a bytearray, one byte each up to 8 bits and two up to 16.
+    """
+    # Constants
+    BUCKET_SIZE = 4
+    MAX_KICKS = 500
+    SUPPORTS_REMOVE = True
+
+    # Constructor
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        super().__init__(capacity, error_rate)
+
+        # Fingerprint bits f >= log2(2b / e) keep the rate under error_rate, where b is the
+        # bucket size
+        self.fingerprint_bits = min(16, max(4, math.ceil(math.log2(2 * self.BUCKET_SIZE / error_rate))))
+
+        # Bucket count is a power of two sized for a 95% load factor
+        self.bucket_count = 1
+        while self.bucket_count * self.BUCKET_SIZE * 0.95 < capacity:
+            self.bucket_count = self.bucket_count * 2
+
+        # Private
+        width = 1 if self.fingerprint_bits <= 8 else 2
+        self.__table__ = memoryview(bytearray(self.bucket_count * self.BUCKET_SIZE * width)).cast("B" if width == 1 else "H")
+        self.__victim__ = None
+        self.__random__ = random.Random(0)
+
+    # Comparison Operators
+    def __contains__(self, key: object) -> bool:
+        index, alternate, fingerprint = self.__locate__(key)
+        if self.__victim__ and self.__victim__[1] == fingerprint and self.__victim__[0] in (index, alternate):
+            return True
+        return self.__find_slot__(index, fingerprint) >= 0 or self.__find_slot__(alternate, fingerprint) >= 0
+
+    # Public Methods
+    def add(self, key: object) -> None:
+        """Adds the key to the filter.
+
+        Args:
+            key (object): Key to add, must be hashable.
+
+        Raises:
+            FilterException: Raised if the filter is too full to place the key.
+        """
+        if self.__victim__:
+            raise FilterException(self.__class__.__name__, "Filter is full, could not add key.")
+
+        index, alternate, fingerprint = self.__locate__(key)
+        self.count = self.count + 1
+        for bucket in (index, alternate):
+            slot = self.__find_slot__(bucket, 0)
+            if slot >= 0:
+                self.__table__[slot] = fingerprint
+                return
+
+        # Both buckets are full, kick fingerprints to their alternate buckets
+        bucket = self.__random__.choice((index, alternate))
+        for _ in range(self.MAX_KICKS):
+            slot = bucket * self.BUCKET_SIZE + self.__random__.randrange(self.BUCKET_SIZE)
+            fingerprint, self.__table__[slot] = self.__table__[slot], fingerprint
+            bucket = self.__alternate__(bucket, fingerprint)
+            empty = self.__find_slot__(bucket, 0)
+            if empty >= 0:
+                self.__table__[empty] = fingerprint
+                return
+
+        # Keep the homeless fingerprint aside so no key is lost
+        self.__victim__ = (bucket, fingerprint)
+
+    def remove(self, key: object) -> None:
+        index, alternate, fingerprint = self.__locate__(key)
+        if self.__victim__ and self.__victim__[1] == fingerprint and self.__victim__[0] in (index, alternate):
+            self.__victim__ = None
+            self.count = self.count - 1
+            return
+
+        for bucket in (index, alternate):
+            slot = self.__find_slot__(bucket, fingerprint)
+            if slot >= 0:
+                self.__table__[slot] = 0
+                self.count = self.count - 1
+
+                # A slot just freed up, try to bring the victim back in
+                if self.__victim__:
+                    victim_bucket, victim = self.__victim__
+                    self.__victim__ = None
+                    for candidate in (victim_bucket, self.__alternate__(victim_bucket, victim)):
+                        empty = self.__find_slot__(candidate, 0)
+                        if empty >= 0:
+                            self.__table__[empty] = victim
+                            return
+                    self.__victim__ = (victim_bucket, victim)
+                return
+
+        raise FilterException(self.__class__.__name__, f"{key} was not found, could not remove key.")
+
+    def clear(self) -> None:
+        for slot in range(len(self.__table__)):
+            self.__table__[slot] = 0
+        self.__victim__ = None
+        self.count = 0
+
+    def expected_false_positive_rate(self) -> float:
+        # A lookup compares against the occupied slots of two buckets, each matching with
+        # probability 1 / (2^f - 1)
+        load = self.count / (self.bucket_count * self.BUCKET_SIZE)
+        return 1 - (1 - 1 / ((1 << self.fingerprint_bits) - 1)) ** (2 * self.BUCKET_SIZE * load)
+
+    def load_factor(self) -> float:
+        """Fraction of slots currently holding a fingerprint.
+
+        Returns:
+            float: Occupied slots divided by total slots.
+        """
+        return self.count / (self.bucket_count * self.BUCKET_SIZE)
+
+    # Helper (Private) Methods
+    def __locate__(self, key: object) -> 'tuple[int, int, int]':
+        """Computes both candidate buckets and the fingerprint of the key. This is a private
+        function and should only be called internally.
+
+        Args:
+            key (object): Key to hash.
+
+        Returns:
+            tuple[int, int, int]: (bucket, alternate bucket, fingerprint), fingerprint is never 0.
+        """
+        first, second = self.__hash_pair__(key)
+        fingerprint = second % ((1 << self.fingerprint_bits) - 1) + 1
+        index = first & (self.bucket_count - 1)
+        return (index, self.__alternate__(index, fingerprint), fingerprint)
+
+    def __alternate__(self, bucket: int, fingerprint: int) -> int:
+        """Other candidate bucket of a fingerprint, applying it twice gives back the
+        original bucket. This is a private function and should only be called internally.
+
+        Args:
+            bucket (int): One of the fingerprint's buckets.
+            fingerprint (int): Stored fingerprint.
+
+        Returns:
+            int: The other bucket.
+        """
+        return (bucket ^ self.__mix__(fingerprint)) & (self.bucket_count - 1)
+
+    def __find_slot__(self, bucket: int, fingerprint: int) -> int:
+        """Finds the slot holding the fingerprint inside of the bucket, 0 finds an empty
+        slot. This is a private function and should only be called internally.
+
+        Args:
+            bucket (int): Bucket to search.
+            fingerprint (int): Fingerprint to match.
+
+        Returns:
+            int: Index of the slot in the table, -1 if not found.
+        """
+        start = bucket * self.BUCKET_SIZE
+        for slot in range(start, start + self.BUCKET_SIZE):
+            if self.__table__[slot] == fingerprint:
+                return slot
+        return -1
+
+if __name__ == '__main__':
+    from hash_table_chaining import HashTableSC
+
+    cuckoo = CuckooFilter(10000, 0.01)
+    for key in range(10000):
+        cuckoo.add(key)
+    assert(all(key in cuckoo for key in range(10000)))
+    false_positives = sum(key in cuckoo for key in range(10000, 110000))
+    print("Cuckoo buckets/fingerprint bits:", cuckoo.bucket_count, cuckoo.fingerprint_bits)
+    print("Cuckoo expected/measured false positive rate:", cuckoo.expected_false_positive_rate(), false_positives / 100000)
+    assert(false_positives / 100000 < 0.02)
+
+    for key in range(0, 10000, 2):
+        cuckoo.remove(key)
+    assert(len(cuckoo) == 5000)
+    assert(all(key in cuckoo for key in range(1, 10000, 2)))
+    print("Cuckoo removal: Pass")
+
+    table = FilterGuard(HashTableSC(), CuckooFilter(1000))
+    for key in range(100):
+        table.insert(key, key)
+    table.remove(5)
+    assert(5 not in table and len(table.filter) == 99)
+    print("Guarded table filtered/false positives:", table.filtered, table.false_positives)
+
+    # Fill a guarded table until the filter overflows, no stored key may be denied
+    table = FilterGuard(HashTableSC(), CuckooFilter(16))
+    overflowed = False
+    for key in range(1000):
+        try:
+            table.insert(key, key)
+        except FilterException:
+            overflowed = True
+            assert(key not in table.structure)
+            break
+    assert(overflowed and all(key in table for key in table.structure))
+    print("Guarded table overflow: Pass")
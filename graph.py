@@ -1,5 +1,8 @@
 from collections import deque
+import heapq
 import math
+from itertools import repeat
+from graph_csr import *
 
 class Graph(object):
     # Static Public methods
@@ -8,42 +11,129 @@ class Graph(object):
         """Finds the shortest path via Breadth-First Search through the graph from start to end given that the path exists.
 
         Args:
-            graph (list[list[int]]): Graph in the form of an adjacency list or matrix.
+            graph (list[list[int]]): Graph in the form of an adjacency list, matrix or CSRGraph.
             start (int): Starting graph node.
             end (int): Ending graph node.
+            is_adjacency_list (bool, optional): False if graph is an adjacency matrix, ignored for a CSRGraph.
+            Defaults to True.
 
         Returns:
             list[int]: Returns shortest path found, otherwise returns None if no path exists.
         """
+        is_adjacency_list = is_adjacency_list or isinstance(graph, CSRGraph)
         return Graph.__bfs_list_traverse__(graph, start, end) if is_adjacency_list else Graph.__bfs_matrix_traverse__(graph, start, end)
     
     @staticmethod
     def dfs_traverse(graph: 'list[list[int]]', start: int, end: int, is_adjacency_list: bool = True) -> 'list[int]':
-        """Finds the shortest path via Depth-First Search through the graph from start to end given that the path exists.
+        """Finds a path via Depth-First Search through the graph from start to end given that the path exists. Every
+        node is visited at most once, O(V + E) for adjacency lists and O(V * V) for matrices. The path is the one
+        DFS walks into first, not necessarily the shortest, use bfs_traverse() for that.
 
         Args:
-            graph (list[list[int]]): Graph in the form of an adjacency list or matrix.
+            graph (list[list[int]]): Graph in the form of an adjacency list, matrix or CSRGraph.
             start (int): Starting graph node.
             end (int): Ending graph node.
+            is_adjacency_list (bool, optional): False if graph is an adjacency matrix, ignored for a CSRGraph.
+            Defaults to True.
 
         Returns:
-            list[int]: Returns shortest path found, otherwise returns None if no path exists.
+            list[int]: Returns path found, otherwise returns None if no path exists.
+        """
+        is_adjacency_list = is_adjacency_list or isinstance(graph, CSRGraph)
+        return Graph.__dfs_list_traverse__(graph, start, end) if is_adjacency_list else Graph.__dfs_matrix_traverse__(graph, start, end)
+    
+    @staticmethod
+    def dfs_order(graph: 'list[list[int]]', start: int, is_adjacency_list: bool = True):
+        """Lazily yields the nodes reachable from start in Depth-First Search preorder, neighbors being visited in
+        the order they're listed. Iterative, so deep graphs can't overflow the recursion limit.
+
+        Args:
+            graph (list[list[int]]): Graph in the form of an adjacency list, matrix or CSRGraph.
+            start (int): Starting graph node.
+            is_adjacency_list (bool, optional): False if graph is an adjacency matrix, ignored for a CSRGraph.
+            Defaults to True.
+        """
+        is_adjacency_list = is_adjacency_list or isinstance(graph, CSRGraph)
+        visited = { start }
+        stack = [Graph.__neighbors__(graph, start, is_adjacency_list)]
+        yield start
+        while stack:
+            # Descend into the first unvisited neighbor, or backtrack once there are none left
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    yield neighbor
+                    stack.append(Graph.__neighbors__(graph, neighbor, is_adjacency_list))
+                    break
+            else:
+                stack.pop()
+    
+    @staticmethod
+    def bfs_order(graph: 'list[list[int]]', start: int, is_adjacency_list: bool = True):
+        """Lazily yields the nodes reachable from start in Breadth-First Search order, nearest first.
+
+        Args:
+            graph (list[list[int]]): Graph in the form of an adjacency list, matrix or CSRGraph.
+            start (int): Starting graph node.
+            is_adjacency_list (bool, optional): False if graph is an adjacency matrix, ignored for a CSRGraph.
+            Defaults to True.
+        """
+        is_adjacency_list = is_adjacency_list or isinstance(graph, CSRGraph)
+        visited = { start }
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            yield node
+            for neighbor in Graph.__neighbors__(graph, node, is_adjacency_list):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+    
+    @staticmethod
+    def reachable(graph: 'list[list[int]]', start: int, is_adjacency_list: bool = True) -> 'set[int]':
+        """Finds every node reachable from start, start included.
+
+        Args:
+            graph (list[list[int]]): Graph in the form of an adjacency list, matrix or CSRGraph.
+            start (int): Starting graph node.
+            is_adjacency_list (bool, optional): False if graph is an adjacency matrix. Defaults to True.
+
+        Returns:
+            set[int]: Returns the reachable nodes.
         """
-        return Graph.__dfs_list_traverse__(graph, end, start, [start])
+        return set(Graph.dfs_order(graph, start, is_adjacency_list))
+    
+    @staticmethod
+    def is_reachable(graph: 'list[list[int]]', start: int, end: int, is_adjacency_list: bool = True) -> bool:
+        """Checks if there's a path from start to end, stopping as soon as end is reached.
+
+        Args:
+            graph (list[list[int]]): Graph in the form of an adjacency list, matrix or CSRGraph.
+            start (int): Starting graph node.
+            end (int): Ending graph node.
+            is_adjacency_list (bool, optional): False if graph is an adjacency matrix. Defaults to True.
+
+        Returns:
+            bool: Returns True if end can be reached from start.
+        """
+        return any(node == end for node in Graph.dfs_order(graph, start, is_adjacency_list))
     
     @staticmethod
     def dijkstra(graph: 'list[list[int]]', start: int, end: int) -> 'list[int]':
         """Finds the shortest path via Dijkstra's Algorithm. This assumes that the graph passed in is in the form of an
-        adjacency matrix that contains weights.
+        adjacency matrix that contains weights, a CSRGraph is searched with dijkstra_pq() instead.
 
         Args:
-            graph (list[list[int]]): An adjacency matrix with weights on each edge.
+            graph (list[list[int]]): An adjacency matrix with weights on each edge, or a CSRGraph.
             start (int): Starting graph node.
             end (int): Ending graph node.
 
         Returns:
             list[int]: Returns shortest path found, otherwise returns None if no path exists.
         """
+        if isinstance(graph, CSRGraph):
+            return Graph.dijkstra_pq(graph, start, end)
+        
         # len(graph) == # of vertices/nodes in graph
         # Set necessary info for weights, prepare queue
         distance = [math.inf for _ in range(len(graph))]
@@ -53,18 +143,14 @@ class Graph(object):
         
         # Iterate through queue and find MST
         while queue:
-            # Grab next closest node
+            # Grab next closest node, stop if the rest can't be reached
             node = Graph.__min_distance__(distance, queue)
+            if node < 0:
+                break
             
             # Check if we're at our destination
             if node == end:
-                stack = deque()
-                if previous[node] or node == start:
-                    while node:
-                        stack.appendleft(node)
-                        node = previous[node]
-                    stack.appendleft(start)
-                return list(stack)
+                return Graph.__backtrace__(previous, end)
             
             # Otherwise remove node from queue and keep going
             queue.remove(node)
@@ -80,19 +166,254 @@ class Graph(object):
         return None
     
     @staticmethod
-    def dijkstra_pq(graph: 'list[list[int]]', start: int, end: int) -> 'list[int]':
-        """Finds the shortest path via Dijkstra's Algorithm implemented with a min-priority queue. This assumes that the
-        graph passed in is in the form of an adjacency matrix that contains weights.
+    def dijkstra_pq(graph: 'list[list[int]]', start: int, end: int, weights: 'list[list[float]]' = None,
+                    is_adjacency_list: bool = True) -> 'list[int]':
+        """Finds the shortest path via Dijkstra's Algorithm implemented with a binary heap as the min-priority queue,
+        O((V + E) log V). Instead of decreasing keys, an improved distance pushes another entry and outdated entries
+        are skipped when popped (lazy deletion). The search stops as soon as end is popped.
+
+        Args:
+            graph (list[list[int]]): Adjacency list (or matrix, see is_adjacency_list) of the graph, or a CSRGraph.
+            start (int): Starting graph node.
+            end (int): Ending graph node.
+            weights (list[list[float]], optional): Non-negative weight of each edge in the adjacency list, in the
+            format adjacency_matrix_to_list() returns. Defaults to None, every edge weighing 1 (or the weights
+            stored in a CSRGraph).
+            is_adjacency_list (bool, optional): False if graph is an adjacency matrix with weights on each edge.
+            Defaults to True.
+
+        Returns:
+            list[int]: Returns shortest path found, otherwise returns None if no path exists.
+        """
+        if isinstance(graph, CSRGraph):
+            weights = graph.weight_rows if weights is None else weights
+        elif not is_adjacency_list:
+            graph, weights = Graph.adjacency_matrix_to_list(graph)
+        
+        distance = [math.inf for _ in range(len(graph))]
+        previous = [None for _ in range(len(graph))]
+        distance[start] = 0
+        heap = [(0, start)]
+        while heap:
+            node_distance, node = heapq.heappop(heap)
+            
+            # Outdated entry, the node was already popped with a shorter distance
+            if node_distance > distance[node]:
+                continue
+            
+            # Check if we're at our destination
+            if node == end:
+                return Graph.__backtrace__(previous, end)
+            
+            # Relax all edges of the current node
+            edge_weights = weights[node] if weights is not None else repeat(1)
+            for neighbor, weight in zip(graph[node], edge_weights):
+                path_distance = node_distance + weight
+                if path_distance < distance[neighbor]:
+                    distance[neighbor] = path_distance
+                    previous[neighbor] = node
+                    heapq.heappush(heap, (path_distance, neighbor))
+        
+        return None
+    
+    @staticmethod
+    def bidirectional_bfs(graph: 'list[list[int]]', start: int, end: int, reverse: 'list[list[int]]' = None,
+                          is_adjacency_list: bool = True) -> 'list[int]':
+        """Finds the shortest path via Breadth-First Search run from both ends at once. Each round expands the whole
+        next level of the smaller frontier, and the search stops after the first level that meets the other side,
+        so only about two balls of half the path length are explored instead of one of the full length.
+
+        Args:
+            graph (list[list[int]]): Graph in the form of an adjacency list, matrix or CSRGraph.
+            start (int): Starting graph node.
+            end (int): Ending graph node.
+            reverse (list[list[int]], optional): The graph with every edge reversed, in the same form (see
+            transpose()). Defaults to None, the graph being undirected.
+            is_adjacency_list (bool, optional): False if graph and reverse are adjacency matrices. Defaults to True.
+
+        Returns:
+            list[int]: Returns shortest path found, otherwise returns None if no path exists.
+        """
+        if not is_adjacency_list and not isinstance(graph, CSRGraph):
+            graph = Graph.adjacency_matrix_to_list(graph)[0]
+            reverse = Graph.adjacency_matrix_to_list(reverse)[0] if reverse is not None else None
+        reverse = graph if reverse is None else reverse
+        if start == end:
+            return [start]
+        
+        # Parents and depths of both sides, the backward parents point towards end
+        forward, backward = { start: None }, { end: None }
+        forward_depth, backward_depth = { start: 0 }, { end: 0 }
+        forward_frontier, backward_frontier = [start], [end]
+        while forward_frontier and backward_frontier:
+            # Grow the smaller side by one full level
+            if len(forward_frontier) <= len(backward_frontier):
+                edges, parents, depth, others, other_depth = graph, forward, forward_depth, backward, backward_depth
+                frontier = forward_frontier
+            else:
+                edges, parents, depth, others, other_depth = reverse, backward, backward_depth, forward, forward_depth
+                frontier = backward_frontier
+            
+            meeting, best = None, math.inf
+            next_frontier = []
+            for node in frontier:
+                for neighbor in edges[node]:
+                    if neighbor in others and depth[node] + 1 + other_depth[neighbor] < best:
+                        meeting, best = (node, neighbor), depth[node] + 1 + other_depth[neighbor]
+                    if neighbor not in parents:
+                        parents[neighbor] = node
+                        depth[neighbor] = depth[node] + 1
+                        next_frontier.append(neighbor)
+            
+            # Every path through this level is found, the shortest of them is the shortest overall
+            if meeting is not None:
+                node, neighbor = meeting
+                if parents is backward:
+                    node, neighbor = neighbor, node
+                return Graph.__backtrace__(forward, node) + Graph.__backtrace__(backward, neighbor)[::-1]
+            
+            if parents is forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+        
+        # One side ran out of nodes without meeting the other
+        return None
+    
+    @staticmethod
+    def bidirectional_dijkstra(graph: 'list[list[int]]', start: int, end: int, weights: 'list[list[float]]' = None,
+                               reverse: 'list[list[int]]' = None, reverse_weights: 'list[list[float]]' = None) -> 'list[int]':
+        """Finds the shortest path via Dijkstra's Algorithm run from both ends at once, each step settling a node of
+        the side with the smaller heap. Every relaxed edge that reaches a node labeled by the other side is a
+        candidate path, and the search stops once the two heap minimums add up to the best candidate, as no
+        unsettled path can be shorter.
 
         Args:
-            graph (list[list[int]]): An adjacency matrix with weights on each edge.
+            graph (list[list[int]]): Adjacency list of the graph, or a CSRGraph.
             start (int): Starting graph node.
             end (int): Ending graph node.
+            weights (list[list[float]], optional): Non-negative weight of each edge in the adjacency list. Defaults
+            to None, every edge weighing 1 (or the weights stored in a CSRGraph).
+            reverse (list[list[int]], optional): The graph with every edge reversed (see transpose()). Defaults to
+            None, the graph being undirected.
+            reverse_weights (list[list[float]], optional): Weights of the reversed edges. Defaults to None, the
+            weights of the graph if it's undirected.
 
         Returns:
             list[int]: Returns shortest path found, otherwise returns None if no path exists.
         """
-        pass
+        if isinstance(graph, CSRGraph):
+            weights = graph.weight_rows if weights is None else weights
+        if reverse is None:
+            reverse, reverse_weights = graph, weights
+        elif isinstance(reverse, CSRGraph):
+            reverse_weights = reverse.weight_rows if reverse_weights is None else reverse_weights
+        if start == end:
+            return [start]
+        
+        # Only nodes the searches reach get a distance, the point of searching from both sides
+        forward, backward = { start: None }, { end: None }
+        forward_distance, backward_distance = { start: 0 }, { end: 0 }
+        forward_heap, backward_heap = [(0, start)], [(0, end)]
+        meeting, best = None, math.inf
+        while forward_heap and backward_heap:
+            # No path through unsettled nodes can beat the best one found
+            if forward_heap[0][0] + backward_heap[0][0] >= best:
+                break
+            
+            if len(forward_heap) <= len(backward_heap):
+                heap, edges, edge_weights, parents, distance, other_distance = (forward_heap, graph, weights,
+                                                                                forward, forward_distance, backward_distance)
+            else:
+                heap, edges, edge_weights, parents, distance, other_distance = (backward_heap, reverse, reverse_weights,
+                                                                                backward, backward_distance, forward_distance)
+            node_distance, node = heapq.heappop(heap)
+            if node_distance > distance[node]:
+                continue
+            
+            for neighbor, weight in zip(edges[node], edge_weights[node] if edge_weights is not None else repeat(1)):
+                path_distance = node_distance + weight
+                if path_distance < distance.get(neighbor, math.inf):
+                    distance[neighbor] = path_distance
+                    parents[neighbor] = node
+                    heapq.heappush(heap, (path_distance, neighbor))
+                if neighbor in other_distance and distance[neighbor] + other_distance[neighbor] < best:
+                    meeting, best = neighbor, distance[neighbor] + other_distance[neighbor]
+        
+        if meeting is None:
+            return None
+        return Graph.__backtrace__(forward, meeting) + Graph.__backtrace__(backward, meeting)[-2::-1]
+    
+    @staticmethod
+    def astar(graph: 'list[list[int]]', start: int, end: int, heuristic, weights: 'list[list[float]]' = None,
+              is_adjacency_list: bool = True) -> 'list[int]':
+        """Finds the shortest path via A* search: Dijkstra's Algorithm ordered by the distance so far plus the
+        heuristic's estimate of the distance left, so nodes leading towards end are expanded first. The heuristic
+        must be admissible (never overestimate) for the path to be the shortest. A node reached again by a shorter
+        path is reopened, so a heuristic that isn't also consistent still gives the shortest path.
+
+        Args:
+            graph (list[list[int]]): Adjacency list (or matrix, see is_adjacency_list) of the graph, or a CSRGraph.
+            start (int): Starting graph node.
+            end (int): Ending graph node.
+            heuristic (Callable[[int], float]): Lower bound of the distance from a node to end, e.g. the straight
+            line distance on a map. A heuristic of 0 turns the search into Dijkstra's Algorithm.
+            weights (list[list[float]], optional): Non-negative weight of each edge in the adjacency list. Defaults
+            to None, every edge weighing 1 (or the weights stored in a CSRGraph).
+            is_adjacency_list (bool, optional): False if graph is an adjacency matrix with weights on each edge.
+            Defaults to True.
+
+        Returns:
+            list[int]: Returns shortest path found, otherwise returns None if no path exists.
+        """
+        if isinstance(graph, CSRGraph):
+            weights = graph.weight_rows if weights is None else weights
+        elif not is_adjacency_list:
+            graph, weights = Graph.adjacency_matrix_to_list(graph)
+        
+        previous = { start: None }
+        distance = { start: 0 }
+        # Ties on the estimate go to the node furthest along, which is closest to end if the estimate is good
+        heap = [(heuristic(start), 0, start)]
+        while heap:
+            _, node_distance, node = heapq.heappop(heap)
+            node_distance = -node_distance
+            if node_distance > distance[node]:
+                continue
+            if node == end:
+                return Graph.__backtrace__(previous, end)
+            
+            edge_weights = weights[node] if weights is not None else repeat(1)
+            for neighbor, weight in zip(graph[node], edge_weights):
+                path_distance = node_distance + weight
+                if path_distance < distance.get(neighbor, math.inf):
+                    distance[neighbor] = path_distance
+                    previous[neighbor] = node
+                    heapq.heappush(heap, (path_distance + heuristic(neighbor), -path_distance, neighbor))
+        
+        return None
+    
+    @staticmethod
+    def transpose(list: 'list[list[int]]', weights: 'list[list[int]]' = None) -> 'tuple[list[list[int]], list[list[int]]]':
+        """Reverses every edge of an adjacency list, for the backward side of the bidirectional searches.
+
+        Args:
+            list (list[list[int]]): Adjacency list to reverse.
+            weights (list[list[int]], optional): Weight of each edge in the adjacency list. Defaults to None.
+
+        Returns:
+            tuple[list[list[int]], list[list[int]]]: Returns the reversed edges and their weights as a tuple ->
+            (adjacency_list, weights), weights is None if none were given.
+        """
+        result_edges = [[] for _ in range(len(list))]
+        result_weights = [[] for _ in range(len(list))] if weights is not None else None
+        for node, neighbors in enumerate(list):
+            for index, neighbor in enumerate(neighbors):
+                result_edges[neighbor].append(node)
+                if weights is not None:
+                    result_weights[neighbor].append(weights[node][index])
+        
+        return (result_edges, result_weights)
     
     @staticmethod
     def adjacency_list_to_matrix(list: 'list[list[int]]', weights: 'list[list[int]]' = None) -> 'list[list[int]]':
@@ -198,27 +519,53 @@ class Graph(object):
         return None
     
     @staticmethod
-    def __dfs_list_traverse__(graph: 'list[list[int]]', end: int, node: int, path: 'list[int]') -> 'list[int]':
-        # If we're at the end, return out
-        if node == end:
-            return list(path)
-        
-        # Keep recursing until we reach destination
-        found_paths = []
-        for neighbor in graph[node]:
-            if neighbor not in path:
-                path.append(neighbor)
-                found_paths.append(Graph.__dfs_list_traverse__(graph, end, neighbor, path))
-                path.remove(neighbor)
+    def __dfs_list_traverse__(graph: 'list[list[int]]', start: int, end: int) -> 'list[int]':
+        return Graph.__dfs_path__(graph, start, end, True)
+    
+    @staticmethod
+    def __dfs_matrix_traverse__(graph: 'list[list[int]]', start: int, end: int) -> 'list[int]':
+        return Graph.__dfs_path__(graph, start, end, False)
+    
+    @staticmethod
+    def __dfs_path__(graph: 'list[list[int]]', start: int, end: int, is_adjacency_list: bool) -> 'list[int]':
+        # The path holds the nodes whose neighbor iterators are on the stack, the current DFS branch
+        visited = { start }
+        path = [start]
+        stack = [Graph.__neighbors__(graph, start, is_adjacency_list)]
+        while stack:
+            # If we're at the end, the branch is the path
+            if path[-1] == end:
+                return path
+            
+            # Descend into the next unvisited neighbor, otherwise backtrack
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    path.append(neighbor)
+                    stack.append(Graph.__neighbors__(graph, neighbor, is_adjacency_list))
+                    break
+            else:
+                stack.pop()
+                path.pop()
         
-        # Return minimum length path found
-        if found_paths:
-            return min(found_paths)
-        return []
+        # If no path found, return nothing
+        return None
     
     @staticmethod
-    def __dfs_matrix_traverse__(graph: 'list[list[int]]', end: int, node: int, path: 'list[int]') -> 'list[int]':
-        pass
+    def __neighbors__(graph: 'list[list[int]]', node: int, is_adjacency_list: bool):
+        # Iterator over the neighbors of node, resumable so the searches can backtrack into it
+        if is_adjacency_list:
+            return iter(graph[node])
+        return (neighbor for neighbor, edge in enumerate(graph[node]) if edge > 0)
+    
+    @staticmethod
+    def __backtrace__(previous: 'list[int]', node: int) -> 'list[int]':
+        # Follow the previous links back from node, start is the only node without one
+        path = []
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return path[::-1]
     
     @staticmethod
     def __min_distance__(distance: 'list[float]', queue: 'list[int]'):
@@ -281,6 +628,19 @@ if __name__ == '__main__':
     print(dfs_list)
     dfs_mat = Graph.dfs_traverse(adj_mat, 0, 2, False)
     print(dfs_mat)
+    assert(dfs_list == dfs_mat == [0, 1, 2] and Graph.dfs_traverse(adj_list2, 4, 0) is None)
+    assert(Graph.dfs_traverse(Graph.adjacency_list_to_matrix(adj_list2), 0, 6, False) == [0, 3, 2, 5, 6])
+    assert(list(Graph.dfs_order(adj_list2, 0)) == [0, 1, 3, 2, 5, 6, 4] and list(Graph.bfs_order(adj_list2, 0)) == [0, 1, 3, 4, 2, 5, 6])
+    assert(list(Graph.dfs_order(adj_mat, 0, False)) == [0, 1, 2, 3, 4] and list(Graph.bfs_order(adj_mat, 0, False)) == [0, 1, 4, 2, 3])
+    assert(Graph.reachable(adj_list2, 5) == {5, 6} and Graph.is_reachable(adj_list2, 0, 6) and not Graph.is_reachable(adj_list2, 6, 0))
+    
+    # A 1000 node path graph is far deeper than the recursion limit, and a dense one has exponentially many paths
+    chain_list = [[node + 1] for node in range(999)] + [[]]
+    assert(Graph.dfs_traverse(chain_list, 0, 999) == list(range(1000)) and len(Graph.reachable(chain_list, 0)) == 1000)
+    dense_list = [[neighbor for neighbor in range(1000) if neighbor != node] for node in range(1000)]
+    dense_path = Graph.dfs_traverse(dense_list, 0, 999)
+    assert(dense_path[0] == 0 and dense_path[-1] == 999 and len(set(dense_path)) == len(dense_path))
+    print("Linear DFS on 1000 node graphs: Pass")
     print()
     
     print("Checking Dijkstra's with non-weighted graph")
@@ -290,3 +650,63 @@ if __name__ == '__main__':
     print("Checking Dijkstra's with weighted graph")
     djk_w = Graph.dijkstra(weighted_adj_mat, 0, 4)
     print(djk_w)
+    
+    print("Checking heap-based Dijkstra's with both graph forms")
+    djk_pq = Graph.dijkstra_pq(weighted_adj_list, 0, 4, weighted_adj_list_weights)
+    print(djk_pq)
+    assert(djk_pq == Graph.dijkstra_pq(weighted_adj_mat, 0, 4, is_adjacency_list=False) == djk_w)
+    assert(Graph.dijkstra_pq(adj_list, 0, 2) == bfs_list and Graph.dijkstra_pq(adj_list2, 0, 6) == bfs_list2)
+    assert(Graph.dijkstra_pq(adj_list2, 4, 0) is None and Graph.dijkstra_pq(adj_list2, 3, 3) == [3])
+    adj_mat2 = Graph.adjacency_list_to_matrix(adj_list2)
+    assert(Graph.dijkstra(adj_mat2, 4, 0) is None and Graph.dijkstra(adj_mat2, 3, 1) == Graph.dijkstra_pq(adj_list2, 3, 1) == [3, 1])
+    
+    print("Checking all searches with a CSR graph")
+    csr = CSRGraph.from_adjacency_matrix(weighted_adj_mat)
+    csr_list, csr_weights = csr.to_adjacency_list()
+    assert(csr_list == weighted_adj_list and csr_weights == weighted_adj_list_weights)
+    assert(Graph.adjacency_list_to_matrix(csr_list, csr_weights) == csr.to_adjacency_matrix() == weighted_adj_mat)
+    assert(Graph.dijkstra(csr, 0, 4) == Graph.dijkstra_pq(csr, 0, 4) == djk_w)
+    csr = CSRGraph.from_adjacency_list(adj_list2)
+    assert(Graph.bfs_traverse(csr, 0, 6) == Graph.bfs_traverse(csr, 0, 6, False) == bfs_list2)
+    assert(Graph.dfs_traverse(csr, 0, 6) == Graph.dfs_traverse(adj_list2, 0, 6) == [0, 3, 2, 5, 6])
+    assert(Graph.dijkstra_pq(csr, 4, 0) is None and Graph.dijkstra_pq(csr, 0, 6) == bfs_list2)
+    print(csr, Graph.bfs_traverse(csr, 0, 6))
+    
+    print("Checking bidirectional searches and A*")
+    bi_bfs = Graph.bidirectional_bfs(adj_list, 0, 2)
+    print(bi_bfs)
+    assert(bi_bfs == bfs_list and Graph.bidirectional_bfs(adj_mat, 0, 2, is_adjacency_list=False) == bfs_mat)
+    reverse_list2 = Graph.transpose(adj_list2)[0]
+    assert(Graph.bidirectional_bfs(adj_list2, 0, 6, reverse_list2) == bfs_list2)
+    assert(Graph.bidirectional_bfs(adj_list2, 4, 0, reverse_list2) is None and Graph.bidirectional_bfs(adj_list2, 3, 3) == [3])
+    assert(Graph.bidirectional_dijkstra(weighted_adj_list, 0, 4, weighted_adj_list_weights) == djk_w)
+    assert(Graph.bidirectional_dijkstra(adj_list2, 0, 6, None, reverse_list2) == bfs_list2)
+    assert(Graph.bidirectional_dijkstra(adj_list2, 4, 0, None, reverse_list2) is None)
+    csr = CSRGraph.from_adjacency_matrix(weighted_adj_mat)
+    assert(Graph.bidirectional_dijkstra(csr, 0, 4) == Graph.bidirectional_dijkstra(csr, 0, 4, reverse=csr.transpose()) == djk_w)
+    assert(Graph.astar(weighted_adj_mat, 0, 4, lambda node: 0, is_adjacency_list=False) == djk_w)
+    assert(Graph.astar(csr, 0, 4, lambda node: 0) == djk_w and Graph.astar(adj_list2, 4, 0, lambda node: 0) is None)
+    
+    # Randomized directed graphs checked against the one-sided searches
+    import random
+    generator = random.Random(5)
+    for _ in range(200):
+        size = generator.randrange(2, 30)
+        rand_list = [generator.sample(range(size), min(size, generator.randrange(0, 4))) for _ in range(size)]
+        rand_weights = [[generator.randint(1, 9) for _ in neighbors] for neighbors in rand_list]
+        rand_reverse, rand_reverse_weights = Graph.transpose(rand_list, rand_weights)
+        source, target = generator.randrange(size), generator.randrange(size)
+        def is_path(path):
+            # Runs from source to target along edges of the graph
+            return (path[0] == source and path[-1] == target and
+                    all(neighbor in rand_list[node] for node, neighbor in zip(path, path[1:])))
+        expected = Graph.bfs_traverse(rand_list, source, target)
+        found = Graph.bidirectional_bfs(rand_list, source, target, rand_reverse)
+        assert(found == expected or (is_path(found) and len(found) == len(expected)))
+        def cost(path):
+            return None if path is None else sum(rand_weights[node][rand_list[node].index(neighbor)] for node, neighbor in zip(path, path[1:]))
+        expected = cost(Graph.dijkstra_pq(rand_list, source, target, rand_weights))
+        for found in (Graph.bidirectional_dijkstra(rand_list, source, target, rand_weights, rand_reverse, rand_reverse_weights),
+                      Graph.astar(rand_list, source, target, lambda node: 0, rand_weights)):
+            assert(cost(found) == expected and (found is None or is_path(found)))
+    print("Randomized bidirectional/A* searches: Pass")
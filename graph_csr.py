@@ -0,0 +1,260 @@
+from array import array
+from itertools import accumulate, chain
+from exception_graph import *
+
+class CSRGraph(object):
+    """Directed graph in compressed sparse row form: the neighbors of every node are stored
+    back to back in one flat targets array, and offsets[node] to offsets[node + 1] is the
+    range of the node's edges. Edge weights, if any, run parallel to targets. Three typed
+    arrays replace one list (and one int object) per node and edge, and a node's neighbors
+    are a single slice, so large sparse graphs take a fraction of the memory of adjacency
+    lists and none of the V * V cells of a matrix.
+
+    Indexing a CSRGraph gives the neighbors of a node like an adjacency list does, so it can
+    be passed to the Graph algorithms as one.
+    """
+    # Structs
+    class WeightRows(object):
+        """Read-only view of the edge weights, weight_rows[node] lines up with graph[node]
+        like the weights lists of Graph.adjacency_matrix_to_list().
+        """
+        __slots__ = ("graph",)
+
+        def __init__(self, graph: 'CSRGraph') -> None:
+            self.graph = graph
+
+        def __len__(self) -> int:
+            return len(self.graph)
+
+        def __getitem__(self, node: int) -> 'array':
+            graph = self.graph
+            start, end = graph.__range__(node)
+            return graph.weights[start:end]
+
+    # Constructor
+    def __init__(self, offsets: 'array', targets: 'array', weights: 'array' = None):
+        """Constructor that wraps already built CSR arrays, see the from_* builders.
+
+        Args:
+            offsets (array): array('l') of node count + 1 edge offsets, starting at 0.
+            targets (array): array('l') of the target node of each edge.
+            weights (array, optional): array('d') of the weight of each edge. Defaults to None, every edge weighing 1.
+
+        Raises:
+            GraphException: Raised if the arrays don't describe a graph.
+        """
+        if not offsets or offsets[0] != 0 or offsets[-1] != len(targets):
+            raise GraphException(__class__.__name__, f"Offsets must run from 0 to the edge count ({len(targets)}).")
+        if weights is not None and len(weights) != len(targets):
+            raise GraphException(__class__.__name__, f"Expected {len(targets)} weights, got {len(weights)}.")
+
+        # Public
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.node_count = len(offsets) - 1
+        self.edge_count = len(targets)
+
+    @classmethod
+    def from_edges(cls, node_count: int, edges) -> 'CSRGraph':
+        """Builds a graph from directed edges given in any order. The edges are bucketed by
+        their source with a counting sort, O(V + E), and keep their given order within a node.
+
+        Args:
+            node_count (int): Number of nodes, nodes are numbered 0 to node_count - 1.
+            edges (iterable): (source, target) or (source, target, weight) tuples, all of the same form.
+
+        Raises:
+            GraphException: Raised if an edge refers to a node outside of the graph.
+
+        Returns:
+            CSRGraph: The graph.
+        """
+        edges = list(edges)
+        is_weighted = bool(edges) and len(edges[0]) == 3
+
+        # Count the out-degree of each node, the prefix sums are the offsets
+        degree = [0 for _ in range(node_count + 1)]
+        for edge in edges:
+            source, target = edge[0], edge[1]
+            if not (0 <= source < node_count and 0 <= target < node_count):
+                raise GraphException(cls.__name__, f"Edge {edge} refers to a node outside of 0 to {node_count - 1}.")
+            degree[source + 1] = degree[source + 1] + 1
+        offsets = array("l", accumulate(degree))
+
+        # Place each edge at the next free slot of its source
+        cursor = list(offsets)
+        targets = array("l", [0]) * len(edges)
+        weights = array("d", [0.0]) * len(edges) if is_weighted else None
+        for edge in edges:
+            source = edge[0]
+            slot = cursor[source]
+            targets[slot] = edge[1]
+            if is_weighted:
+                weights[slot] = edge[2]
+            cursor[source] = slot + 1
+        return cls(offsets, targets, weights)
+
+    @classmethod
+    def from_adjacency_list(cls, adjacency: 'list[list[int]]', weights: 'list[list[float]]' = None) -> 'CSRGraph':
+        """Builds a graph from an adjacency list and respective weights (if provided), in the
+        format Graph.adjacency_matrix_to_list() returns.
+
+        Args:
+            adjacency (list[list[int]]): Adjacency list to convert.
+            weights (list[list[float]], optional): Weight of each edge in the adjacency list. Defaults to None.
+
+        Raises:
+            GraphException: Raised if a neighbor is outside of the graph.
+
+        Returns:
+            CSRGraph: The graph.
+        """
+        offsets = array("l", chain((0,), accumulate(len(neighbors) for neighbors in adjacency)))
+        targets = array("l", chain.from_iterable(adjacency))
+        if targets and not (0 <= min(targets) and max(targets) < len(adjacency)):
+            raise GraphException(cls.__name__, f"Adjacency list refers to a node outside of 0 to {len(adjacency) - 1}.")
+        edge_weights = array("d", chain.from_iterable(weights)) if weights is not None else None
+        return cls(offsets, targets, edge_weights)
+
+    @classmethod
+    def from_adjacency_matrix(cls, matrix: 'list[list[int]]') -> 'CSRGraph':
+        """Builds a weighted graph from an adjacency matrix, every positive cell is an edge.
+
+        Args:
+            matrix (list[list[int]]): Adjacency matrix with weights on each edge.
+
+        Returns:
+            CSRGraph: The graph.
+        """
+        offsets = array("l", [0])
+        targets = array("l")
+        weights = array("d")
+        for row in matrix:
+            for neighbor, weight in enumerate(row):
+                if weight > 0:
+                    targets.append(neighbor)
+                    weights.append(weight)
+            offsets.append(len(targets))
+        return cls(offsets, targets, weights)
+
+    # Operator Overrides
+    def __len__(self) -> int:
+        return self.node_count
+
+    def __getitem__(self, node: int) -> 'array':
+        start, end = self.__range__(node)
+        return self.targets[start:end]
+
+    def __iter__(self):
+        offsets, targets = self.offsets, self.targets
+        for node in range(self.node_count):
+            yield targets[offsets[node]:offsets[node + 1]]
+
+    def __str__(self) -> str:
+        return f"CSRGraph(nodes={self.node_count}, edges={self.edge_count}, weighted={self.weights is not None})"
+
+    # Properties
+    @property
+    def weight_rows(self) -> 'CSRGraph.WeightRows':
+        """Per node view of the edge weights, None if the graph is unweighted.
+        """
+        return self.WeightRows(self) if self.weights is not None else None
+
+    # Public Methods
+    def edges(self):
+        """Lazily yields every edge as (source, target, weight), grouped by source.
+        """
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for source in range(self.node_count):
+            for edge in range(offsets[source], offsets[source + 1]):
+                yield (source, targets[edge], weights[edge] if weights is not None else 1)
+
+    def transpose(self) -> 'CSRGraph':
+        """Builds the graph with every edge reversed, for the backward side of the
+        bidirectional searches.
+
+        Returns:
+            CSRGraph: The reversed graph.
+        """
+        if self.weights is None:
+            return self.from_edges(self.node_count, ((target, source) for source, target, _ in self.edges()))
+        return self.from_edges(self.node_count, ((target, source, weight) for source, target, weight in self.edges()))
+
+    def to_adjacency_list(self) -> 'tuple[list[list[int]], list[list[float]]]':
+        """Converts the graph to an adjacency list and its associated weights list.
+
+        Returns:
+            tuple[list[list[int]], list[list[float]]]: Returns the edges and weights as a tuple like
+            Graph.adjacency_matrix_to_list() -> (adjacency_list, weights), weights is None if the graph is unweighted.
+        """
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        adjacency = [targets[offsets[node]:offsets[node + 1]].tolist() for node in range(self.node_count)]
+        if weights is None:
+            return (adjacency, None)
+        return (adjacency, [weights[offsets[node]:offsets[node + 1]].tolist() for node in range(self.node_count)])
+
+    def to_adjacency_matrix(self) -> 'list[list[int]]':
+        """Converts the graph to an adjacency matrix like Graph.adjacency_list_to_matrix(),
+        each edge is represented by its weight (1 if the graph is unweighted). This takes
+        V * V cells, only use it on small graphs.
+
+        Returns:
+            list[list[int]]: Returns the adjacency matrix.
+        """
+        result = []
+        for source in range(self.node_count):
+            row = [0 for _ in range(self.node_count)]
+            for edge in range(self.offsets[source], self.offsets[source + 1]):
+                row[self.targets[edge]] = self.weights[edge] if self.weights is not None else 1
+            result.append(row)
+        return result
+
+    # Helper (Private) Methods
+    def __range__(self, node: int) -> 'tuple[int, int]':
+        """Range of the node's edges in targets and weights, on the hot path of every search
+        so the bounds check is left to the offsets array where possible. This method is not
+        meant to be called outside of the class.
+
+        Raises:
+            GraphException: Raised if the node is outside of 0 to node_count - 1.
+        """
+        offsets = self.offsets
+        try:
+            if node >= 0:
+                return (offsets[node], offsets[node + 1])
+        except (IndexError, TypeError):
+            pass
+        raise GraphException(self.__class__.__name__, f"Node {node} is outside of 0 to {self.node_count - 1}.")
+
+if __name__ == '__main__':
+    graph = CSRGraph.from_edges(5, [(0, 1), (0, 4), (1, 0), (1, 2), (2, 1), (2, 3), (3, 2), (3, 4), (4, 0), (4, 3)])
+    print(graph)
+    adjacency, weights = graph.to_adjacency_list()
+    print(adjacency)
+    assert(adjacency == [[1, 4], [0, 2], [1, 3], [2, 4], [0, 3]] and weights is None)
+    assert(CSRGraph.from_adjacency_list(adjacency).to_adjacency_list() == (adjacency, None))
+    assert(graph.to_adjacency_matrix()[0] == [0, 1, 0, 0, 1] and list(graph[3]) == [2, 4])
+    print("Edge list builder: Pass")
+
+    matrix = [
+        [0, 4, 0, 8],
+        [4, 0, 8, 0],
+        [0, 8, 0, 7],
+        [8, 0, 7, 0],
+    ]
+    weighted = CSRGraph.from_adjacency_matrix(matrix)
+    assert(weighted.to_adjacency_matrix() == matrix and list(weighted.weight_rows[2]) == [8, 7])
+    assert(CSRGraph.from_edges(4, weighted.edges()).to_adjacency_list() == weighted.to_adjacency_list())
+    assert(weighted.transpose().to_adjacency_matrix() == [list(column) for column in zip(*matrix)])
+    directed = CSRGraph.from_edges(3, [(0, 1, 2.5), (1, 2, 1.0), (0, 2, 4.0)]).transpose()
+    assert(directed.to_adjacency_list() == ([[], [0], [0, 1]], [[], [2.5], [4.0, 1.0]]))
+    print("Matrix round trip: Pass")
+
+    for invalid in (lambda: graph[5], lambda: CSRGraph.from_edges(2, [(0, 2)]), lambda: CSRGraph.from_adjacency_list([[1]])):
+        try:
+            invalid()
+            assert(False)
+        except GraphException:
+            pass
+    print("Invalid nodes: Pass")
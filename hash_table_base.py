@@ -1,6 +1,7 @@
-from exception_hash import HashException
+from collections import abc
+from exception_hash import HashException, HashKeyException
 
-class HashTableBase(object):
+class HashTableBase(abc.MutableMapping):
     """Base Hash Table implementation, only meant to be inherited. This has no default implementation
     other than a few common functions.
     """
@@ -19,6 +20,35 @@ class HashTableBase(object):
             self.key = key
             self.value = value
     
+    class KeysView(abc.KeysView):
+        """Lazy view over the keys of a hash table. Walks the buckets on every iteration
+        instead of copying the keys out.
+        """
+        def __iter__(self):
+            for key, _ in self._mapping.__entries__():
+                yield key
+    
+    class ValuesView(abc.ValuesView):
+        """Lazy view over the values of a hash table. Walks the buckets on every iteration
+        instead of copying the values out.
+        """
+        def __contains__(self, value: object) -> bool:
+            for _, entry_value in self._mapping.__entries__():
+                if entry_value is value or entry_value == value:
+                    return True
+            return False
+        
+        def __iter__(self):
+            for _, value in self._mapping.__entries__():
+                yield value
+    
+    class ItemsView(abc.ItemsView):
+        """Lazy view over the key-value pairs of a hash table. Walks the buckets on every
+        iteration instead of copying the pairs out.
+        """
+        def __iter__(self):
+            yield from self._mapping.__entries__()
+    
     # Constructor
     def __init__(self, hash_function=None, max_size=32):
         """Constructor for the Hash Table, allows for custom version of the hash function
@@ -46,10 +76,16 @@ class HashTableBase(object):
         Args:
             key (object): Key to get to obtain value.
 
+        Raises:
+            HashKeyException: Raised if the key isn't found in the hash table.
+
         Returns:
             object: Value paired with the given key.
         """
-        raise HashException(self.__class__.__name__, "'__getitem__' method not implemented")
+        entry = self.__find_entry__(key)
+        if entry is None:
+            raise HashKeyException(self.__class__.__name__, f"{key} was not found, could not retrive value.")
+        return entry.value
     
     def __setitem__(self, key: object, value: object) -> None:
         """Accessor operator [] override for set methods.
@@ -59,6 +95,28 @@ class HashTableBase(object):
             value (object): Value to pair with the given key.
         """
         self.insert(key, value)
+    
+    def __delitem__(self, key: object) -> None:
+        """Accessor operator [] override for del statements.
+
+        Args:
+            key (object): Key to remove.
+        """
+        self.remove(key)
+    
+    def __len__(self) -> int:
+        """Number of key-value pairs currently stored in the hash table.
+
+        Returns:
+            int: Count of stored pairs.
+        """
+        return self.count
+    
+    def __iter__(self):
+        """Lazily iterates through the keys of the hash table, bucket by bucket.
+        """
+        for key, _ in self.__entries__():
+            yield key
         
     # Comparison Operators
     def __contains__(self, key: object) -> bool:
@@ -71,9 +129,64 @@ class HashTableBase(object):
         Returns:
             bool: True if the key is found inside the hash table.
         """ 
-        raise HashException(self.__class__.__name__, "'__contains__' method not implemented")
+        return self.__find_entry__(key) is not None
     
     # Public Methods
+    def get(self, key: object, default: object = None) -> object:
+        """Get the value paired with the given key. Unlike the [] operator, a missing key
+        does not raise.
+
+        Args:
+            key (object): Key to get to obtain value.
+            default (object, optional): Value returned if the key isn't found. Defaults to None.
+
+        Returns:
+            object: Value paired with the given key, or default if not found.
+        """
+        entry = self.__find_entry__(key)
+        if entry is None:
+            return default
+        return entry.value
+    
+    def pop(self, key: object, *default: object) -> object:
+        """Removes the given key from the hash table and returns its value.
+
+        Args:
+            key (object): Key to remove.
+            default (object, optional): Value returned if the key isn't found. If not given,
+            a missing key raises HashKeyException.
+
+        Returns:
+            object: Value that was paired with the key, or default if not found.
+        """
+        if default and self.__find_entry__(key) is None:
+            return default[0]
+        return self.remove(key)[1]
+    
+    def keys(self) -> 'HashTableBase.KeysView':
+        """Lazy view over the keys of the hash table.
+
+        Returns:
+            HashTableBase.KeysView: View that walks the table's buckets when iterated.
+        """
+        return self.KeysView(self)
+    
+    def values(self) -> 'HashTableBase.ValuesView':
+        """Lazy view over the values of the hash table.
+
+        Returns:
+            HashTableBase.ValuesView: View that walks the table's buckets when iterated.
+        """
+        return self.ValuesView(self)
+    
+    def items(self) -> 'HashTableBase.ItemsView':
+        """Lazy view over the key-value pairs of the hash table.
+
+        Returns:
+            HashTableBase.ItemsView: View that walks the table's buckets when iterated.
+        """
+        return self.ItemsView(self)
+    
     def insert(self, key: object, value: object) -> None:
         """Insert key-value pair into the hash table. The key will be hashed prior to insertion.
         If the count exceeds the max_size, resize table.
@@ -101,9 +214,27 @@ class HashTableBase(object):
         # Reset values
         self.count = 0
         self.max_size = self.__original_size__
-        self.__table__ = [None for _ in range(self.max_size)]
+        self.__table__ = [self.TableEntry() for _ in range(self.max_size)]
         
     # Helper (Private) Methods
+    def __find_entry__(self, key: object) -> 'TableEntry':
+        """Finds the stored entry for the given key without raising on a miss. This is a
+        private function and should only be called internally.
+
+        Args:
+            key (object): Key to find.
+
+        Returns:
+            TableEntry: Object holding the matched key and value, None if not found.
+        """
+        raise HashException(self.__class__.__name__, "'__find_entry__' method not implemented")
+    
+    def __entries__(self):
+        """Generator that walks every bucket and yields stored (key, value) pairs without
+        copying the table. This is a private function and should only be called internally.
+        """
+        raise HashException(self.__class__.__name__, "'__entries__' method not implemented")
+    
     def __resize__(self) -> None:
         """Resizes the given array and rehashes all values. This is a private function and should
         only be called internally.
@@ -136,8 +267,8 @@ class HashTableBase(object):
         elif key_type is str:
             sum = 0
             for c in key:
-                sum = sum * 23 + int(c)
-            return sum
+                sum = sum * 23 + ord(c)
+            return sum % self.max_size
         elif key_type is None:
             raise HashException(self.__class__.__name__, "Key is of type None, can not hash NoneType key.")
         else:
@@ -0,0 +1,455 @@
+import functools
+import sys
+import time
+from enum import IntEnum
+from hash_table_chaining import *
+
+class CachePolicy(IntEnum):
+    """Eviction policies supported by HashTableCache: [LRU, LFU]
+    """
+    LRU = 0
+    LFU = 1
+
+class HashTableCache(HashTableSC):
+    """A separate chaining Hash Table that evicts entries once it goes over its limits.
+    Every entry is threaded onto an intrusive doubly linked recency list, so lookups,
+    inserts and evictions stay O(1) for both LRU and LFU (one recency list per frequency).
+    Entries can also expire after a time-to-live, expired entries are dropped lazily when
+    they're looked up or by calling expire(). len(), iteration and remove() drop them first,
+    so an expired key is absent everywhere, at O(n) per call while any entry has a ttl.
+    """
+    # Class Structs
+    class ListNode(HashTableSC.ListNode):
+        """Chain node that additionally sits on a recency list. prev/next link the node
+        inside of its bucket's chain, older/newer link it inside of its recency list.
+        """
+        def __init__(self, key: object = None, value: object = None, prev: 'ListNode' = None, next: 'ListNode' = None) -> None:
+            super().__init__(key, value, prev, next)
+            self.older = None
+            self.newer = None
+            self.frequency = 1
+            self.expires = None
+            self.size = 0
+
+    class RecencyList(object):
+        """Circular doubly linked list of ListNodes with a sentinel, newest entries are
+        pushed at the front and the oldest entry sits at the back.
+        """
+        def __init__(self) -> None:
+            self.sentinel = HashTableCache.ListNode()
+            self.sentinel.older = self.sentinel
+            self.sentinel.newer = self.sentinel
+
+        def __bool__(self) -> bool:
+            return self.sentinel.older is not self.sentinel
+
+        def push(self, node: 'HashTableCache.ListNode') -> None:
+            """Links the node in as the newest entry.
+
+            Args:
+                node (ListNode): Node to link.
+            """
+            newest = self.sentinel.older
+            node.older = newest
+            node.newer = self.sentinel
+            newest.newer = node
+            self.sentinel.older = node
+
+        def unlink(self, node: 'HashTableCache.ListNode') -> None:
+            """Unlinks the node from the list.
+
+            Args:
+                node (ListNode): Node to unlink.
+            """
+            node.older.newer = node.newer
+            node.newer.older = node.older
+            node.older = node.newer = None
+
+        def oldest(self) -> 'HashTableCache.ListNode':
+            """Returns the oldest node in the list without unlinking it.
+
+            Returns:
+                ListNode: Oldest node, None if the list is empty.
+            """
+            node = self.sentinel.newer
+            return None if node is self.sentinel else node
+
+    # Constructor
+    def __init__(self, max_entries: int = None, max_bytes: int = None, ttl: float = None,
+                 policy: CachePolicy = CachePolicy.LRU, hash_function=None, max_size=None,
+                 sizeof=None, timer=time.monotonic):
+        """Constructor for the Cache. Any limit left as None is not enforced.
+
+        Args:
+            max_entries (int, optional): Max number of stored pairs. Defaults to None.
+            max_bytes (int, optional): Max total size of the stored pairs. Defaults to None.
+            ttl (float, optional): Seconds a pair stays valid after it's inserted. Defaults to None.
+            policy (CachePolicy, optional): Which entry to evict when over a limit. Defaults to CachePolicy.LRU.
+            hash_function (lambda, optional): Hashing function. Defaults to None.
+            max_size (int, optional): Number of buckets. Defaults to max_entries, or 32 if unbounded.
+            sizeof (lambda, optional): Called with (key, value) to get a pair's size. Defaults to
+            the sum of sys.getsizeof of both.
+            timer (lambda, optional): Clock used for expiry. Defaults to time.monotonic.
+
+        Raises:
+            HashException: Raised if a limit is less than 1.
+        """
+        for name, limit in (("max_entries", max_entries), ("max_bytes", max_bytes)):
+            if limit is not None and limit < 1:
+                raise HashException(self.__class__.__name__, f"'{name}' must be at least 1, got {limit}.")
+
+        super().__init__(hash_function, max_size or max_entries or 32)
+
+        # Public
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.policy = policy
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        # Private
+        self.__entry_size__ = sizeof or (lambda key, value: sys.getsizeof(key) + sys.getsizeof(value))
+        self.__timer__ = timer
+        self.__expiring__ = 0
+        self.__reset_recency__()
+
+    # Operator Overloads
+    def __len__(self) -> int:
+        if self.__expiring__:
+            self.expire()
+        return self.count
+
+    def __getitem__(self, key: object) -> object:
+        node = self.__lookup__(key)
+        if node is None:
+            raise HashKeyException(self.__class__.__name__, f"{key} was not found, could not retrive value.")
+        return node.value
+
+    # Public Methods
+    def get(self, key: object, default: object = None) -> object:
+        node = self.__lookup__(key)
+        if node is None:
+            return default
+        return node.value
+
+    def insert(self, key: object, value: object, ttl: float = None) -> None:
+        """Insert key-value pair into the cache, evicting other pairs if a limit is exceeded.
+        Overwriting a key counts as a use of it.
+
+        Args:
+            key (object): Key to insert and hash.
+            value (object): Value assigned to the key as a pair.
+            ttl (float, optional): Overrides the cache's ttl for this pair. Defaults to None.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        size = self.__entry_size__(key, value) if self.max_bytes is not None else 0
+
+        node = super().__find_entry__(key)
+        if node:
+            node.value = value
+            self.bytes = self.bytes + size - node.size
+            self.__touch__(node)
+        else:
+            # Make room first, the new node would otherwise be the LFU victim of a warm cache
+            self.__evict__(1, size)
+
+            # Push a new node at the head of its bucket's chain
+            entry = self.__table__[self.__hash_function__(key)]
+            node = self.ListNode(key, value, next=entry.node)
+            if entry.node:
+                entry.node.prev = node
+            entry.node = node
+            self.count = self.count + 1
+            self.bytes = self.bytes + size
+            self.__recency_list__(1).push(node)
+            self.__min_frequency__ = 1
+
+        node.size = size
+        self.__expiring__ = self.__expiring__ + (ttl is not None) - (node.expires is not None)
+        node.expires = None if ttl is None else self.__timer__() + ttl
+        self.__evict__()
+
+    def remove(self, key: object) -> object:
+        node = self.__find_entry__(key)
+        if node is None:
+            raise HashKeyException(self.__class__.__name__, f"{key} was not found, could not remove value.")
+
+        self.__unlink_entry__(node)
+        return (node.key, node.value)
+
+    def expire(self) -> int:
+        """Removes every pair whose time-to-live has run out.
+
+        Returns:
+            int: Number of removed pairs.
+        """
+        now = self.__timer__()
+        expired = [node for node in self.__nodes__() if node.expires is not None and node.expires <= now]
+        for node in expired:
+            self.__unlink_entry__(node)
+        self.expirations = self.expirations + len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        super().clear()
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self.__expiring__ = 0
+        self.__reset_recency__()
+
+    # Helper (Private) Methods
+    def __entries__(self):
+        # Drop expired pairs first so iteration and the views agree with lookups
+        if self.__expiring__:
+            self.expire()
+        yield from super().__entries__()
+
+    def __find_entry__(self, key: object) -> 'ListNode':
+        # Find node and drop it if it has expired
+        node = super().__find_entry__(key)
+        if node and node.expires is not None and node.expires <= self.__timer__():
+            self.__unlink_entry__(node)
+            self.expirations = self.expirations + 1
+            return None
+        return node
+
+    def __lookup__(self, key: object) -> 'ListNode':
+        """Finds the node for a read, recording the hit or miss and marking the node as
+        used. This is a private function and should only be called internally.
+
+        Args:
+            key (object): Key to find.
+
+        Returns:
+            ListNode: The matched node, None if not found or expired.
+        """
+        node = self.__find_entry__(key)
+        if node is None:
+            self.misses = self.misses + 1
+            return None
+
+        self.hits = self.hits + 1
+        self.__touch__(node)
+        return node
+
+    def __nodes__(self):
+        """Generator that walks every bucket and yields the stored nodes. This is a private
+        function and should only be called internally.
+        """
+        for entry in self.__table__:
+            node = entry.node
+            while node:
+                yield node
+                node = node.next
+
+    def __reset_recency__(self) -> None:
+        """Drops every recency list. This is a private function and should only be called
+        internally.
+        """
+        self.__recency__ = {}
+        self.__min_frequency__ = 1
+
+    def __recency_list__(self, frequency: int) -> RecencyList:
+        """Returns the recency list for the given use frequency, creating it if needed. LRU
+        keeps every node on the frequency 1 list. This is a private function and should only
+        be called internally.
+
+        Args:
+            frequency (int): Use frequency of the list.
+
+        Returns:
+            RecencyList: The list for that frequency.
+        """
+        recency = self.__recency__.get(frequency)
+        if recency is None:
+            recency = self.__recency__[frequency] = self.RecencyList()
+        return recency
+
+    def __touch__(self, node: ListNode) -> None:
+        """Marks the node as just used. LRU moves it to the front of the recency list, LFU
+        also moves it up to the next frequency list. This is a private function and should
+        only be called internally.
+
+        Args:
+            node (ListNode): Node that was used.
+        """
+        recency = self.__recency__[node.frequency]
+        recency.unlink(node)
+        if self.policy == CachePolicy.LFU:
+            if not recency:
+                del self.__recency__[node.frequency]
+                if self.__min_frequency__ == node.frequency:
+                    self.__min_frequency__ = node.frequency + 1
+            node.frequency = node.frequency + 1
+        self.__recency_list__(node.frequency).push(node)
+
+    def __unlink_entry__(self, node: ListNode) -> None:
+        """Removes the node from both its bucket's chain and its recency list. This is a
+        private function and should only be called internally.
+
+        Args:
+            node (ListNode): Node to remove.
+        """
+        # Unlink from the bucket's chain
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.__table__[self.__hash_function__(node.key)].node = node.next
+        if node.next:
+            node.next.prev = node.prev
+
+        # Unlink from the recency list, dropping it once empty
+        recency = self.__recency__[node.frequency]
+        recency.unlink(node)
+        if not recency and node.frequency != 1:
+            del self.__recency__[node.frequency]
+
+        self.count = self.count - 1
+        self.bytes = self.bytes - node.size
+        if node.expires is not None:
+            self.__expiring__ = self.__expiring__ - 1
+
+    def __evict__(self, entries: int = 0, size: int = 0) -> None:
+        """Evicts pairs until the cache is back within its limits. LRU evicts the least
+        recently used pair, LFU the least recently used pair among the least frequently
+        used ones. This is a private function and should only be called internally.
+
+        Args:
+            entries (int, optional): Pairs about to be inserted. Defaults to 0.
+            size (int, optional): Size of the pairs about to be inserted. Defaults to 0.
+        """
+        while self.count and ((self.max_entries is not None and self.count + entries > self.max_entries) or
+                              (self.max_bytes is not None and self.bytes + size > self.max_bytes)):
+            recency = self.__recency__.get(self.__min_frequency__)
+            if not recency:
+                # Explicit removals can empty the min frequency list, find the next one
+                self.__min_frequency__ = min(frequency for frequency, nodes in self.__recency__.items() if nodes)
+                recency = self.__recency__[self.__min_frequency__]
+
+            self.__unlink_entry__(recency.oldest())
+            self.evictions = self.evictions + 1
+
+def memoize(max_entries: int = 128, max_bytes: int = None, ttl: float = None, policy: CachePolicy = CachePolicy.LRU):
+    """Decorator that caches a function's results in a HashTableCache, keyed by its
+    arguments. The cache is exposed as the wrapped function's 'cache' attribute.
+
+    Args:
+        max_entries (int, optional): Max number of cached results. Defaults to 128.
+        max_bytes (int, optional): Max total size of the cached results. Defaults to None.
+        ttl (float, optional): Seconds a result stays valid. Defaults to None.
+        policy (CachePolicy, optional): Eviction policy. Defaults to CachePolicy.LRU.
+
+    Returns:
+        lambda: Decorator to apply to the function.
+    """
+    def decorator(function):
+        buckets = max_entries or 32
+        cache = HashTableCache(max_entries, max_bytes, ttl, policy, hash_function=lambda key: hash(key) % buckets)
+        missing = object()
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key = args + (missing,) + tuple(sorted(kwargs.items()))
+
+            value = cache.get(key, missing)
+            if value is missing:
+                value = function(*args, **kwargs)
+                cache.insert(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+if __name__ == '__main__':
+    print("LRU eviction")
+    lru = HashTableCache(max_entries=3)
+    lru[1] = "a"
+    lru[2] = "b"
+    lru[3] = "c"
+    lru[1]
+    lru[4] = "d"
+    assert(2 not in lru and sorted(lru) == [1, 3, 4])
+    assert(lru.evictions == 1 and lru.hits == 1)
+    assert(lru.get(2) is None and lru.misses == 1)
+
+    print("LFU eviction")
+    lfu = HashTableCache(max_entries=3, policy=CachePolicy.LFU)
+    lfu[1] = "a"
+    lfu[2] = "b"
+    lfu[3] = "c"
+    for _ in range(3):
+        lfu[1]
+    lfu[2]
+    lfu[4] = "d"
+    assert(3 not in lfu and sorted(lfu) == [1, 2, 4])
+    lfu.remove(4)
+    lfu.remove(2)
+    lfu[5] = "e"
+    lfu[6] = "f"
+    assert(sorted(lfu) == [1, 5, 6])
+    lfu[7] = "g"
+    assert(sorted(lfu) == [1, 6, 7])
+
+    # A new key must not be the victim once every other pair has been used
+    warm = HashTableCache(max_entries=2, policy=CachePolicy.LFU)
+    warm["a"] = 1
+    warm["b"] = 2
+    warm["a"]
+    warm["b"]
+    warm["c"] = 3
+    assert("c" in warm and len(warm) == 2 and warm.evictions == 1)
+
+    print("TTL expiry")
+    now = [0.0]
+    ttl = HashTableCache(ttl=10, timer=lambda: now[0])
+    ttl["short"] = 1
+    ttl.insert("long", 2, ttl=100)
+    now[0] = 50
+    assert("short" not in ttl and ttl["long"] == 2)
+    assert(ttl.expirations == 1 and len(ttl) == 1)
+    now[0] = 200
+    assert(ttl.expire() == 1 and len(ttl) == 0)
+
+    # Expired pairs nobody looked up are absent from len(), iteration and remove()
+    ttl["a"] = 1
+    ttl.insert("b", 2, ttl=100)
+    ttl.insert("c", 3, ttl=100)
+    ttl.insert("c", 4, ttl=100)
+    now[0] = 250
+    assert(len(ttl) == 2 and sorted(ttl) == ["b", "c"] and dict(ttl.items()) == {"b": 2, "c": 4})
+    try:
+        ttl.remove("a")
+        assert(False)
+    except HashKeyException:
+        pass
+    now[0] = 400
+    assert(list(ttl) == [] and len(ttl) == 0 and ttl.__expiring__ == 0)
+
+    print("Size-based eviction")
+    sized = HashTableCache(max_bytes=10, sizeof=lambda key, value: len(value))
+    sized["a"] = "xxxx"
+    sized["b"] = "yyyy"
+    sized["c"] = "zzzz"
+    assert("a" not in sized and sized.bytes == 8)
+    sized["b"] = "y"
+    assert(sized.bytes == 5)
+
+    print("Memoize")
+    calls = []
+    @memoize(max_entries=2)
+    def square(x, offset=0):
+        calls.append(x)
+        return x * x + offset
+    assert(square(3) == 9 and square(3) == 9 and calls == [3])
+    assert(square(3, offset=1) == 10 and calls == [3, 3])
+    square(4)
+    square(3)
+    assert(calls == [3, 3, 4, 3])
+    assert(square.cache.evictions == 2)
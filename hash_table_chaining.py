@@ -27,79 +27,114 @@ class HashTableSC(HashTableBase):
             """
             self.key = key
             self.value = value
-            self.next = None
-            self.prev = None
+            self.next = next
+            self.prev = prev
     
     # Constructor
-    def __init__(self):
-        super().__init__()
+    def __init__(self, hash_function=None, max_size=32):
+        super().__init__(hash_function, max_size)
         
-    # Operator Overload
-    def __getitem__(self, key: object) -> object:
+    # Public Method
+    def insert(self, key: object, value: object) -> None:
+        entry = self.__table__[self.__hash_function__(key)]
+        if self.__chain_insert__(entry, key, value):
+            self.count = self.count + 1
+        
+    def remove(self, key: object) -> object:
+        entry = self.__table__[self.__hash_function__(key)]
+        node = self.__chain_remove__(entry, key)
+        if node:
+            self.count = self.count - 1
+            return (node.key, node.value)
+        
+        raise HashKeyException(self.__class__.__name__, f"{key} was not found, could not remove value.")
+    
+    # Helper (Private) Methods
+    def __find_entry__(self, key: object) -> 'ListNode':
         # Grab entry from table with hash
         entry = self.__table__[self.__hash_function__(key)]
         
-        # Iterate through chain to find proper value
+        # Iterate through chain to find the matching node
         node = entry.node
         while node:
             if node.key == key:
-                return node.value
+                return node
             node = node.next
-
-        # If nothing found, raise not found exception
-        raise HashException(self.__class__.__name__, f"{key} was not found, could not retrive value.")
         
-    # Public Method
-    def insert(self, key: object, value: object) -> None:
-        hashed_code = self.__hash_function__(key)
-        entry = self.__table__[hashed_code]
+        return None
+    
+    def __chain_insert__(self, entry: TableEntry, key: object, value: object) -> bool:
+        """Inserts or overwrites the key-value pair inside of a single bucket's chain. This
+        is a private function and should only be called internally.
+
+        Args:
+            entry (TableEntry): Bucket that the key hashes to.
+            key (object): Key to insert.
+            value (object): Value assigned to the key as a pair.
+
+        Returns:
+            bool: True if a new node was added, False if an existing value was overwritten.
+        """
         if not entry.node:
             entry.node = self.ListNode(key, value)
-        else:
-            # Find the next available space in the chain
-            node = entry.node
-            while node.next:
-                # Check if the key we're using is a duplicate, if so override
-                # existing value
-                if node.next.key == key:
-                    node.value = value
-                    return
-                node.next = node.next.next
-            
-            # Check if current node is a duplicate value (this assumes only
-            # one node exists in the TableEntry)
+            return True
+        
+        # Find the next available space in the chain
+        node = entry.node
+        while node.next:
+            # Check if the key we're using is a duplicate, if so override
+            # existing value
             if node.key == key:
                 node.value = value
-                return
-            
-            # Once found, add new node to the chain
-            node.next = self.ListNode(key, value, prev=node)
+                return False
+            node = node.next
         
-        self.count = self.count + 1
+        # Check if the tail node is a duplicate value
+        if node.key == key:
+            node.value = value
+            return False
         
-    def remove(self, key: object) -> object:
-        hashed_code = self.__hash_function__(key)
-        entry = self.__table__[hashed_code]
-        if entry.node:
-            # Find the next available space in the chain
+        # Once found, add new node to the chain
+        node.next = self.ListNode(key, value, prev=node)
+        return True
+    
+    def __chain_remove__(self, entry: TableEntry, key: object) -> 'ListNode':
+        """Unlinks the node holding the key from a single bucket's chain. The removed node
+        keeps its own next link, so a reader currently standing on it can carry on walking.
+        This is a private function and should only be called internally.
+
+        Args:
+            entry (TableEntry): Bucket that the key hashes to.
+            key (object): Key to remove.
+
+        Returns:
+            ListNode: The unlinked node, None if the key wasn't found.
+        """
+        node = entry.node
+        while node:
+            if node.key == key:
+                # Relink next/prev nodes to one another after this node's
+                # removal
+                if node.prev:
+                    node.prev.next = node.next
+                else:
+                    # No prev implies head of the list, so the next node
+                    # becomes the new head of the TableEntry
+                    entry.node = node.next
+                if node.next:
+                    node.next.prev = node.prev
+                return node
+            node = node.next
+        
+        return None
+    
+    def __entries__(self):
+        # Walk every bucket's chain in table order
+        for entry in self.__table__:
             node = entry.node
             while node:
-                if node.key == key:
-                    # Relink next/prev nodes to one another after this node's
-                    # removal
-                    if node.prev:
-                        node.prev.next = node.next
-                    else:
-                        # No prev implies head of the list, so remove ListNode
-                        # from TableEntry
-                        entry.node = None
-                    if node.next:
-                        node.next.prev = node.prev
-                    self.count = self.count - 1
-                    return (node.key, node.value)
+                yield (node.key, node.value)
                 node = node.next
-        
-        raise HashException(self.__class__.__name__, f"{key} was not found, could not remove value.")
 
 if __name__ == '__main__':
     table = HashTableSC()
@@ -133,3 +168,28 @@ if __name__ == '__main__':
     except HashException:
         print("Successfully removed")
     assert(table.count == 2)
+    
+    print("Mapping protocol")
+    for key in range(1, 200, 7):
+        table[key] = str(key)
+    assert(len(table) == table.count)
+    assert(table.get(3) is None)
+    assert(table.get(3, "missing") == "missing")
+    assert(table.get(42) == "World")
+    assert(42 in table and 3 not in table)
+    assert(sorted(table.keys()) == sorted(key for key, _ in table.items()))
+    assert("World" in table.values())
+    assert((10, "Hello") in table.items())
+    del table[42]
+    assert(42 not in table)
+    assert(table.pop(42, None) is None)
+    assert(table.pop(15) == "15")
+    table["abc"] = 1
+    assert(table["abc"] == 1)
+    try:
+        table[3]
+    except KeyError:
+        print("Missing key raises KeyError: Pass")
+    assert(dict(table.items()) == {key: table[key] for key in table})
+    table.clear()
+    assert(len(table) == 0 and list(table) == [])
@@ -0,0 +1,178 @@
+import threading
+from hash_table_chaining import *
+
+class ConcurrentHashTable(HashTableSC):
+    """Thread-safe separate chaining Hash Table. Buckets are split into contiguous ranges
+    (stripes), each guarded by its own lock, so writers only contend when they touch the
+    same range of buckets.
+
+    Reads (get, [], in, iteration) never take a lock. Writers only ever publish fully built
+    nodes with a single reference store and unlinked nodes keep their own next link, so a
+    reader always sees a consistent chain. This holds under the GIL and on free-threaded
+    builds, where single attribute loads and stores are still atomic. Iteration is weakly
+    consistent: it reflects some of the writes made while it runs.
+    """
+    # Constructor
+    def __init__(self, hash_function=None, max_size=256, stripes=16):
+        """Constructor for the Concurrent Hash Table.
+
+        Args:
+            hash_function (lambda, optional): Hashing function. Defaults to None.
+            max_size (int, optional): Number of buckets, fixed for the table's lifetime. Defaults to 256.
+            stripes (int, optional): Number of locks the buckets are split between. Defaults to 16.
+
+        Raises:
+            HashException: Raised if the number of stripes is less than 1.
+        """
+        if stripes < 1:
+            raise HashException(self.__class__.__name__, f"Stripe count must be at least 1, got {stripes}.")
+
+        # Public
+        self.stripes = min(stripes, max_size)
+        
+        # Private
+        self.__locks__ = [threading.Lock() for _ in range(self.stripes)]
+        self.__counts__ = [0 for _ in range(self.stripes)]
+
+        super().__init__(hash_function, max_size)
+
+    # Properties
+    @property
+    def count(self) -> int:
+        """Number of stored pairs, summed from the per-stripe counters so that writers on
+        different stripes never share a counter.
+        """
+        return sum(self.__counts__)
+
+    @count.setter
+    def count(self, value: int) -> None:
+        # Only used by the base class to initialize/reset the table
+        self.__counts__ = [0 for _ in range(self.stripes)]
+        self.__counts__[0] = value
+
+    # Public Methods
+    def insert(self, key: object, value: object) -> None:
+        bucket = self.__hash_function__(key)
+        stripe = self.__stripe__(bucket)
+        with self.__locks__[stripe]:
+            if self.__chain_insert__(self.__table__[bucket], key, value):
+                self.__counts__[stripe] += 1
+
+    def remove(self, key: object) -> object:
+        bucket = self.__hash_function__(key)
+        stripe = self.__stripe__(bucket)
+        with self.__locks__[stripe]:
+            node = self.__chain_remove__(self.__table__[bucket], key)
+            if node:
+                self.__counts__[stripe] -= 1
+                return (node.key, node.value)
+
+        raise HashKeyException(self.__class__.__name__, f"{key} was not found, could not remove value.")
+
+    def setdefault(self, key: object, default: object = None) -> object:
+        """Atomically returns the value paired with the key, inserting default first if the
+        key is missing.
+
+        Args:
+            key (object): Key to look up.
+            default (object, optional): Value to insert if the key is missing. Defaults to None.
+
+        Returns:
+            object: The value paired with the key once the call completes.
+        """
+        return self.compute_if_absent(key, lambda _: default)
+
+    def compute_if_absent(self, key: object, function) -> object:
+        """Atomically returns the value paired with the key. If the key is missing, the
+        function is called with the key and its result is inserted. The function runs at
+        most once per missing key, while holding the key's stripe lock, so it should be
+        quick and must not write to this table.
+
+        Args:
+            key (object): Key to look up.
+            function (lambda): Called with the key to produce the missing value.
+
+        Returns:
+            object: The value paired with the key once the call completes.
+        """
+        # Lock-free fast path for keys that are already present
+        node = self.__find_entry__(key)
+        if node:
+            return node.value
+
+        bucket = self.__hash_function__(key)
+        stripe = self.__stripe__(bucket)
+        with self.__locks__[stripe]:
+            # Check again, another writer may have won the race for the lock
+            node = self.__find_entry__(key)
+            if node:
+                return node.value
+
+            value = function(key)
+            self.__chain_insert__(self.__table__[bucket], key, value)
+            self.__counts__[stripe] += 1
+            return value
+
+    def clear(self) -> None:
+        # Take every stripe in order so no writer is mid-update
+        for lock in self.__locks__:
+            lock.acquire()
+        try:
+            super().clear()
+        finally:
+            for lock in reversed(self.__locks__):
+                lock.release()
+
+    # Helper (Private) Methods
+    def __stripe__(self, bucket: int) -> int:
+        """Maps a bucket index to the stripe (lock) owning its range of buckets. This is a
+        private function and should only be called internally.
+
+        Args:
+            bucket (int): Bucket index.
+
+        Returns:
+            int: Index of the stripe.
+        """
+        return bucket * self.stripes // self.max_size
+
+if __name__ == '__main__':
+    from concurrent.futures import ThreadPoolExecutor
+
+    table = ConcurrentHashTable()
+
+    def writer(offset):
+        for key in range(offset, 4000, 8):
+            table[key] = key * 2
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(writer, range(8)))
+    assert(len(table) == 4000)
+    assert(all(table[key] == key * 2 for key in range(4000)))
+    print("Concurrent inserts: Pass")
+
+    def remover(offset):
+        for key in range(offset, 4000, 8):
+            del table[key]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(remover, range(0, 8, 2)))
+    assert(len(table) == 2000)
+    assert(all((key in table) == (key % 2 == 1) for key in range(4000)))
+    print("Concurrent removals: Pass")
+
+    calls = []
+    def compute(key):
+        calls.append(key)
+        return "computed"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: table.compute_if_absent(-1, compute), range(64)))
+    assert(results == ["computed"] * 64)
+    assert(calls == [-1])
+    assert(table.setdefault(-1, "ignored") == "computed")
+    assert(table.setdefault(-2, "default") == "default")
+    print("Atomic compute_if_absent/setdefault: Pass")
+
+    table.clear()
+    assert(len(table) == 0 and list(table) == [])
@@ -0,0 +1,219 @@
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+from hash_table_base import *
+
+class MappedHashTable(HashTableBase):
+    """Read-only Hash Table that probes a file through mmap instead of loading it. Opening
+    is O(1) no matter the size of the table, and processes that open the same file share
+    its pages through the OS page cache.
+
+    File layout (little-endian):
+        header: magic (4s), version (H), reserved (H), slot count (Q), pair count (Q)
+        slots:  slot count * [key hash (Q), heap offset (Q)], offset 0 marks an empty slot
+        heap:   pair count * [key length (I), value length (I), key bytes, value bytes]
+
+    Slots are open addressed with linear probing. Keys and values are stored pickled and
+    keys are matched by their pickled bytes, so keys should have a canonical pickle (str,
+    bytes, int, or tuples of them). Note that 1 and 1.0 are therefore different keys.
+    """
+    # Constants
+    MAGIC = b"PLHT"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHQQ")
+    SLOT = struct.Struct("<QQ")
+    ENTRY = struct.Struct("<II")
+
+    # Constructor
+    def __init__(self, path: str):
+        """Maps the file written by MappedHashTable.write() and validates its header.
+
+        Args:
+            path (str): Path of the table file.
+
+        Raises:
+            HashException: Raised if the file isn't a table file or is of another version.
+        """
+        super().__init__(max_size=0)
+
+        # mmap can't map an empty file, check the size before mapping
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < self.HEADER.size:
+                raise HashException(self.__class__.__name__, f"'{path}' is too small to be a table file.")
+            self.__map__ = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, slot_count, count = self.HEADER.unpack_from(self.__map__, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise HashException(self.__class__.__name__, f"'{path}' is not a version {self.VERSION} table file.")
+        if len(self.__map__) < self.HEADER.size + slot_count * self.SLOT.size:
+            self.close()
+            raise HashException(self.__class__.__name__, f"'{path}' is truncated, its slot array is incomplete.")
+
+        # Public
+        self.path = path
+        self.count = count
+        self.max_size = slot_count
+
+        # Private
+        self.__mask__ = slot_count - 1
+        self.__heap_start__ = self.HEADER.size + slot_count * self.SLOT.size
+
+    # Context Manager
+    def __enter__(self) -> 'MappedHashTable':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    # Public Methods
+    def insert(self, key: object, value: object) -> None:
+        raise HashException(self.__class__.__name__, "Table is read-only, could not insert value.")
+
+    def remove(self, key: object) -> object:
+        raise HashException(self.__class__.__name__, "Table is read-only, could not remove value.")
+
+    def clear(self) -> None:
+        raise HashException(self.__class__.__name__, "Table is read-only, could not clear values.")
+
+    def close(self) -> None:
+        """Unmaps the file, the table can't be used afterwards.
+        """
+        self.__map__.close()
+
+    @staticmethod
+    def write(mapping: 'abc.Mapping', path: str) -> None:
+        """Serializes any mapping (e.g. a HashTableSC) into a table file. Only the slot array
+        is held in memory, pairs are streamed into the heap. The file is written next to
+        path first and then moved into place, so readers never see a partial file.
+
+        Args:
+            mapping (Mapping): Key-value pairs to write.
+            path (str): Destination path.
+        """
+        cls = MappedHashTable
+        count = len(mapping)
+
+        # Keep the load factor at or below 1/2, slot count is a power of two
+        slot_count = 1
+        while slot_count < count * 2:
+            slot_count = slot_count * 2
+        mask = slot_count - 1
+        slots = bytearray(slot_count * cls.SLOT.size)
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, slot_count, count))
+            file.write(slots)
+
+            # Stream pairs into the heap, recording where each one landed
+            offset = cls.HEADER.size + len(slots)
+            for key, value in mapping.items():
+                key_bytes = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+                value_bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                file.write(cls.ENTRY.pack(len(key_bytes), len(value_bytes)))
+                file.write(key_bytes)
+                file.write(value_bytes)
+
+                key_hash = cls.__hash_bytes__(key_bytes)
+                index = key_hash & mask
+                while cls.SLOT.unpack_from(slots, index * cls.SLOT.size)[1]:
+                    index = (index + 1) & mask
+                cls.SLOT.pack_into(slots, index * cls.SLOT.size, key_hash, offset)
+
+                offset = offset + cls.ENTRY.size + len(key_bytes) + len(value_bytes)
+
+            # Go back and fill in the slot array
+            file.seek(cls.HEADER.size)
+            file.write(slots)
+
+        os.replace(temp_path, path)
+
+    # Helper (Private) Methods
+    def __find_entry__(self, key: object) -> 'HashTableBase.TableEntry':
+        # Probe the mapped slot array, only unpickling the value on a match
+        key_bytes = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+        key_hash = self.__hash_bytes__(key_bytes)
+        index = key_hash & self.__mask__
+        while True:
+            slot_hash, offset = self.SLOT.unpack_from(self.__map__, self.HEADER.size + index * self.SLOT.size)
+            if not offset:
+                return None
+            if slot_hash == key_hash:
+                key_length, value_length = self.ENTRY.unpack_from(self.__map__, offset)
+                start = offset + self.ENTRY.size
+                if self.__map__[start:start + key_length] == key_bytes:
+                    value = pickle.loads(self.__map__[start + key_length:start + key_length + value_length])
+                    return self.TableEntry(key, value)
+            index = (index + 1) & self.__mask__
+
+    def __entries__(self):
+        # Walk the heap front to back, pairs are stored contiguously
+        offset = self.__heap_start__
+        for _ in range(self.count):
+            key_length, value_length = self.ENTRY.unpack_from(self.__map__, offset)
+            start = offset + self.ENTRY.size
+            key = pickle.loads(self.__map__[start:start + key_length])
+            value = pickle.loads(self.__map__[start + key_length:start + key_length + value_length])
+            yield (key, value)
+            offset = start + key_length + value_length
+
+    @staticmethod
+    def __hash_bytes__(data: bytes) -> int:
+        """Hashes the serialized key with a hash that's stable between processes (unlike the
+        builtin hash() of str). This is a private function and should only be called internally.
+
+        Args:
+            data (bytes): Pickled key.
+
+        Returns:
+            int: 64-bit hash.
+        """
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+if __name__ == '__main__':
+    import tempfile
+    from hash_table_chaining import HashTableSC
+
+    table = HashTableSC()
+    for key in range(500):
+        table[key] = f"value {key}"
+    table["name"] = ("tuple", 1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.plht")
+        MappedHashTable.write(table, path)
+
+        with MappedHashTable(path) as mapped:
+            assert(len(mapped) == 501)
+            assert(mapped[42] == "value 42" and mapped["name"] == ("tuple", 1))
+            assert(500 not in mapped and mapped.get(500, "missing") == "missing")
+            assert(dict(mapped.items()) == dict(table.items()))
+            try:
+                mapped[1] = "read-only"
+            except HashException:
+                print("Read-only table: Pass")
+            try:
+                mapped[500]
+            except KeyError:
+                print("Missing key raises KeyError: Pass")
+
+        MappedHashTable.write({}, path)
+        with MappedHashTable(path) as mapped:
+            assert(len(mapped) == 0 and list(mapped) == [] and 0 not in mapped)
+        print("Empty table: Pass")
+
+        # Empty and truncated files are rejected like files with a bad header
+        with open(path, "rb") as file:
+            data = file.read()
+        for content in (b"", data[:MappedHashTable.HEADER.size - 1], data[:MappedHashTable.HEADER.size + 1], b"nope" * 10):
+            with open(path, "wb") as file:
+                file.write(content)
+            try:
+                MappedHashTable(path)
+                assert(False)
+            except HashException:
+                pass
+        print("Invalid files: Pass")
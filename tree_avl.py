@@ -1,4 +1,5 @@
 from tree_bst import *
+from sort_merge import mergesort
 
 class AVLTree(TreeBST):
     """An AVL Tree that inherits from the Tree BST class. Self-balances as you
@@ -7,107 +8,438 @@ class AVLTree(TreeBST):
     # Class Structs
     class Node(TreeBST.Node):
         """An AVL Node that inherits from the Tree BST class. Has additional
-        structural data to allow for AVL operations.
+        structural data to allow for AVL operations, and the size of its subtree
+        for order statistics.
         """
         # Use TreeBST.Node as our basis, add AVL specific fields
-        def __init__(self, value=None, left=None, right=None, balance_factor=None, height=None) -> None:
+        def __init__(self, value=None, left=None, right=None, balance_factor=0, height=0, size=1) -> None:
             super().__init__(value, left, right)
             self.balance_factor = balance_factor
             self.height = height
+            self.size = size
     
     # Constructor
     def __init__(self) -> None:
         super().__init__()
     
-    # Helper Operations
-    def __insert__(self, value: object, node: Node) -> Node:
-        """A recursive insert helper function to insert the node into the tree. This is
-        purely a helper method and isn't meant to be called outside of the class.
+    # Bulk Construction
+    @classmethod
+    def from_sorted(cls, iterable) -> 'AVLTree':
+        """Builds a perfectly balanced tree from ascending values in O(n), filling in each
+        node's AVL data directly instead of inserting and rotating. Repeated values are
+        stored once and None values are skipped, same as insert().
 
         Args:
-            value (object): The item to insert into the tree.
-            node (Node): The current node that we're at.
+            iterable (iterable): Values in ascending order.
+
+        Raises:
+            TreeException: Raised if the values aren't in ascending order.
 
         Returns:
-            Node: The balanced node after insertion has occurred, may or may not be the
-            recently inserted node.
+            AVLTree: The newly built tree.
         """
-        # If our current node is None, insert value
-        if node == None:
-            return self.Node(value, balance_factor=0, height=0)
+        values = []
+        for value in iterable:
+            if value is None:
+                continue
+            if values and value < values[-1]:
+                raise TreeException(cls.__name__, f"Values must be in ascending order, {value} came after {values[-1]}.")
+            if not values or values[-1] < value:
+                values.append(value)
         
-        # Insert value left if less than current node, otherwise insert right
-        if value < node.value:
-            node.left = self.__insert__(value, node.left)
-        else:
-            node.right = self.__insert__(value, node.right)
+        tree = cls()
+        tree.__root__ = tree.__build_balanced__(values, 0, len(values))
+        tree.count = len(values)
+        return tree
+    
+    @classmethod
+    def from_iterable(cls, iterable, sort=mergesort) -> 'AVLTree':
+        """Builds a perfectly balanced tree from values in any order by sorting them first,
+        O(n log n) overall.
+
+        Args:
+            iterable (iterable): Values to store.
+            sort (lambda, optional): Sort taking and returning a list. Defaults to mergesort.
+
+        Returns:
+            AVLTree: The newly built tree.
+        """
+        return cls.from_sorted(sort([value for value in iterable if value is not None]))
+    
+    def union(self, other: 'TreeBST') -> 'AVLTree':
+        """Builds a new tree holding the values of both trees in O(n + m) by merging their
+        inorder walks and bulk loading the result. Neither tree is modified.
+
+        Args:
+            other (TreeBST): Tree to combine with.
+
+        Returns:
+            AVLTree: The newly built tree.
+        """
+        return self.from_sorted(self.__merge_sorted__(self.iter_inorder(), other.iter_inorder()))
+    
+    def merge(self, other: 'TreeBST') -> None:
+        """Adds every value of the other tree into this one in O(n + m), by rebuilding this
+        tree from the union of both.
+
+        Args:
+            other (TreeBST): Tree whose values are added.
+        """
+        merged = self.union(other)
+        self.__root__ = merged.__root__
+        self.count = merged.count
+    
+    # Join/Split
+    @classmethod
+    def join(cls, left: 'AVLTree', value: object, right: 'AVLTree') -> 'AVLTree':
+        """Joins two trees and a value in between them into one tree in O(log n). Every value
+        of left must be smaller than value and every value of right larger. Both trees are
+        emptied, their nodes now belong to the joined tree.
+
+        Args:
+            left (AVLTree): Tree of smaller values.
+            value (object): Value to put in between.
+            right (AVLTree): Tree of larger values.
+
+        Raises:
+            TreeException: Raised if the trees and value aren't in order.
+
+        Returns:
+            AVLTree: The joined tree.
+        """
+        if (left.__root__ and not left.max() < value) or (right.__root__ and not value < right.min()):
+            raise TreeException(cls.__name__, f"Can't join, {value} must be between the values of both trees.")
         
-        # Update node data and restructure tree if necessary
-        self.__update_node__(node)
-        return self.__balance_tree__(node)
+        tree = cls()
+        tree.__root__ = tree.__join__(left.__root__, value, right.__root__)
+        tree.count = tree.__root__.size
+        left.clear()
+        right.clear()
+        return tree
     
-    def __remove__(self, value: object, node: Node) -> Node:
-        """A recursive remove helper function to remove a node from the tree. This is
-        purely a helper method and isn't meant to be called outside of the class.
+    def split(self, value: object) -> 'tuple[AVLTree, bool, AVLTree]':
+        """Splits the tree around the given value in O(log n). This tree is emptied, its
+        nodes now belong to the two returned trees.
 
         Args:
-            value (object): The item to be removed from the tree.
-            node (Node): The current node that we're at.
+            value (object): Value to split around, doesn't need to be in the tree.
 
         Returns:
-            Node: The removed node.
+            tuple[AVLTree, bool, AVLTree]: (tree of smaller values, whether value was in the
+            tree, tree of larger values)
         """
-        # Ensure we're at a node that exists
-        if not node:
+        left, found, right = self.__split__(self.__root__, value)
+        self.clear()
+        
+        trees = []
+        for root in (left, right):
+            tree = self.__class__()
+            tree.__root__ = root
+            tree.count = root.size if root else 0
+            trees.append(tree)
+        return (trees[0], found, trees[1])
+    
+    def copy(self) -> 'AVLTree':
+        """Copies the tree node by node in O(n), keeping its shape.
+
+        Returns:
+            AVLTree: The copy.
+        """
+        tree = self.__class__()
+        tree.__root__ = self.__copy_node__(self.__root__)
+        tree.count = self.count
+        return tree
+    
+    # Order Statistics
+    def select(self, k: int) -> object:
+        """Returns the kth smallest value in the tree in O(log n).
+
+        Args:
+            k (int): Position of the value in ascending order, starting at 1.
+
+        Raises:
+            TreeException: Raised if k isn't between 1 and the number of values.
+
+        Returns:
+            object: The kth smallest value.
+        """
+        if k < 1 or k > self.count:
+            raise TreeException(self.__class__.__name__, f"k must be between 1 and {self.count}, got {k}.")
+        
+        # Skip over whole left subtrees using their sizes
+        node = self.__root__
+        while node:
+            left_size = node.left.size if node.left else 0
+            if k <= left_size:
+                node = node.left
+            elif k == left_size + 1:
+                return node.value
+            else:
+                k = k - left_size - 1
+                node = node.right
+    
+    def rank(self, value: object) -> int:
+        """Counts the values in the tree that are less than the given value in O(log n). The
+        value itself doesn't need to be in the tree.
+
+        Args:
+            value (object): Value to rank.
+
+        Returns:
+            int: Number of smaller values, i.e. the 0-based position value has or would have.
+        """
+        return self.__rank__(value, inclusive=False)
+    
+    def count_range(self, low: object = None, high: object = None, include_high: bool = False) -> int:
+        """Counts the values in [low, high) in O(log n), matching what range() would yield.
+
+        Args:
+            low (object, optional): Smallest value to count, None for no lower bound. Defaults to None.
+            high (object, optional): Value to stop at, None for no upper bound. Defaults to None.
+            include_high (bool, optional): Also count high itself if stored. Defaults to False.
+
+        Returns:
+            int: Number of values within the range.
+        """
+        below_high = (self.__root__.size if self.__root__ else 0) if high is None else self.__rank__(high, include_high)
+        below_low = 0 if low is None else self.__rank__(low, inclusive=False)
+        return max(0, below_high - below_low)
+    
+    # Helper Operations
+    def __build_balanced__(self, values: 'list[object]', start: int, end: int) -> Node:
+        """Builds a balanced subtree out of values[start:end] by making the middle value the
+        root. Recursion depth is only O(log n). This is a helper function not meant to be
+        called outside of the class.
+
+        Args:
+            values (list[object]): Sorted values without repeats.
+            start (int): First index of the subtree's values.
+            end (int): One past the last index of the subtree's values.
+
+        Returns:
+            Node: Root of the built subtree, None if the range is empty.
+        """
+        if start >= end:
             return None
         
-        # Recursively traverse the tree to find our value.
-        # When our value is less, traverse left
-        if value < node.value:
-            left_child = self.__remove__(value, node.left)
-            if not left_child:
-                return None
-            node.left = left_child
-        # When our value is more, traverse right
-        elif value > node.value:
-            right_child = self.__remove__(value, node.right)
-            if not right_child:
-                return None
-            node.right = right_child
-        # We have found our value
-        else:
-            # Node has either one or no children
-            if not node.left:
-                return node.right
-            elif not node.right:
-                return node.left
-            # Node has both children
+        middle = (start + end) // 2
+        node = self.Node(values[middle])
+        node.left = self.__build_balanced__(values, start, middle)
+        node.right = self.__build_balanced__(values, middle + 1, end)
+        self.__update_node__(node)
+        return node
+    
+    @staticmethod
+    def __merge_sorted__(first, second):
+        """Generator that merges two ascending iterators into one, yielding values found in
+        both only once. This is a helper function not meant to be called outside of the class.
+
+        Args:
+            first (iterator): Ascending values.
+            second (iterator): Ascending values.
+        """
+        missing = object()
+        left = next(first, missing)
+        right = next(second, missing)
+        while left is not missing and right is not missing:
+            if left < right:
+                yield left
+                left = next(first, missing)
+            elif right < left:
+                yield right
+                right = next(second, missing)
             else:
-                # Remove from left child
-                if node.left.height > node.right.height:
-                    # Swap the value of the successor into the node.
-                    successor = self.__find_max__(node.left)
-                    node.value = successor.value
-
-                    # Find and replace largest value in the left child
-                    replacement = self.__remove__(successor.value, node.left)
-                    if not replacement:
-                        return None
-                    node.left = replacement
+                yield left
+                left = next(first, missing)
+                right = next(second, missing)
+        
+        # Only one of the iterators has values left
+        if left is not missing:
+            yield left
+            yield from first
+        if right is not missing:
+            yield right
+            yield from second
+    
+    def __rank__(self, value: object, inclusive: bool) -> int:
+        """Counts the values less than (or equal to) the given value by adding up the sizes
+        of the left subtrees passed on the way down. This is a helper function not meant to
+        be called outside of the class.
+
+        Args:
+            value (object): Value to rank.
+            inclusive (bool): Also count a value equal to the given value.
+
+        Returns:
+            int: Number of matching values.
+        """
+        rank = 0
+        node = self.__root__
+        while node:
+            if value < node.value or (not inclusive and not node.value < value):
+                node = node.left
+            else:
+                rank = rank + 1 + (node.left.size if node.left else 0)
+                node = node.right
+        return rank
+    
+    def __retrace__(self, path: 'list[Node]', delta: int) -> None:
+        """Walks the path back up from the changed position, updating and rebalancing each
+        ancestor. Once an ancestor's subtree height is the same as before, nothing above
+        it can be out of balance, so the remaining ancestors only get their sizes adjusted.
+        This is a helper function not meant to be called outside of the class.
+
+        Args:
+            path (list[Node]): Ancestors of the changed position, root first.
+            delta (int): 1 after an insert, -1 after a removal.
+        """
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            old_height = node.height
+            
+            # Update node data and restructure tree if necessary
+            self.__update_node__(node)
+            balanced = self.__balance_tree__(node)
+            
+            # Link a rotated subtree back in under its parent
+            if balanced is not node:
+                if depth == 0:
+                    self.__root__ = balanced
+                elif path[depth - 1].left is node:
+                    path[depth - 1].left = balanced
                 else:
-                    # Swap the value of the successor into the node.
-                    successor = self.__find_min__(node.right)
-                    node.value = successor.value
+                    path[depth - 1].right = balanced
+            
+            # Height didn't change, stop rebalancing
+            if balanced.height == old_height:
+                for ancestor in path[:depth]:
+                    ancestor.size = ancestor.size + delta
+                return
+    
+    # Join/Split Operations
+    def __join__(self, left: Node, value: object, right: Node, node: Node = None) -> Node:
+        """Joins two subtrees with a value in between them. The value's node is attached
+        along the spine of the taller subtree where the heights meet, then the spine is
+        rebalanced on the way back up. This is a helper function not meant to be called
+        outside of the class.
+
+        Args:
+            left (Node): Subtree of smaller values.
+            value (object): Value in between both subtrees.
+            right (Node): Subtree of larger values.
+            node (Node, optional): Detached node to reuse for the value instead of
+            allocating one. Defaults to None.
 
-                    # Find and replace the smallest value in the right child
-                    replacement = self.__remove__(successor.value, node.right)
-                    if not replacement:
-                        return None
-                    node.right = replacement
+        Returns:
+            Node: Root of the joined subtree.
+        """
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
         
-        # Update and rebalance nodes
-        self.__update_node__(node)
-        return self.__balance_tree__(node)
+        if node is None:
+            node = self.Node(value)
+        else:
+            node.value = value
+        
+        # Similar heights, the value can become the root directly
+        if abs(left_height - right_height) <= 1:
+            node.left = left
+            node.right = right
+            self.__update_node__(node)
+            return node
+        
+        # Walk down the inner spine of the taller subtree until the heights meet
+        taller_left = left_height > right_height
+        shorter_height = right_height if taller_left else left_height
+        path = []
+        spine = left if taller_left else right
+        while spine and spine.height > shorter_height + 1:
+            path.append(spine)
+            spine = spine.right if taller_left else spine.left
+        
+        joined = node
+        joined.left = spine if taller_left else left
+        joined.right = right if taller_left else spine
+        self.__update_node__(joined)
+        
+        # Attach and rebalance back up the spine
+        for parent in reversed(path):
+            if taller_left:
+                parent.right = joined
+            else:
+                parent.left = joined
+            self.__update_node__(parent)
+            joined = self.__balance_tree__(parent)
+        return joined
+    
+    def __join2__(self, left: Node, right: Node) -> Node:
+        """Joins two subtrees without a value in between by pulling the largest value out
+        of the left one. This is a helper function not meant to be called outside of the
+        class.
+
+        Args:
+            left (Node): Subtree of smaller values.
+            right (Node): Subtree of larger values.
+
+        Returns:
+            Node: Root of the joined subtree.
+        """
+        if not left:
+            return right
+        left, largest = self.__split_last__(left)
+        return self.__join__(left, largest, right)
+    
+    def __split__(self, node: Node, value: object) -> 'tuple[Node, bool, Node]':
+        """Splits a subtree around a value by rejoining the pieces hanging off the search
+        path, reusing the nodes on the path. This is a helper function not meant to be
+        called outside of the class.
+
+        Args:
+            node (Node): Subtree to split.
+            value (object): Value to split around.
+
+        Returns:
+            tuple[Node, bool, Node]: (smaller subtree, whether value was found, larger subtree)
+        """
+        if not node:
+            return (None, False, None)
+        if value < node.value:
+            left, found, right = self.__split__(node.left, value)
+            return (left, found, self.__join__(right, node.value, node.right, node))
+        if node.value < value:
+            left, found, right = self.__split__(node.right, value)
+            return (self.__join__(node.left, node.value, left, node), found, right)
+        return (node.left, True, node.right)
+    
+    def __copy_node__(self, node: Node) -> Node:
+        """Recursively copies a subtree, recursion depth is only O(log n). This is a helper
+        function not meant to be called outside of the class.
+
+        Args:
+            node (Node): Subtree to copy.
+
+        Returns:
+            Node: Root of the copy.
+        """
+        if not node:
+            return None
+        return self.Node(node.value, self.__copy_node__(node.left), self.__copy_node__(node.right),
+                         node.balance_factor, node.height, node.size)
+    
+    def __split_last__(self, node: Node) -> 'tuple[Node, object]':
+        """Removes the largest value from a subtree. This is a helper function not meant to
+        be called outside of the class.
+
+        Args:
+            node (Node): Subtree to remove from.
+
+        Returns:
+            tuple[Node, object]: (remaining subtree, removed largest value)
+        """
+        if not node.right:
+            return (node.left, node.value)
+        right, largest = self.__split_last__(node.right)
+        return (self.__join__(node.left, node.value, right, node), largest)
     
     # AVL Operations
     def __balance_tree__(self, node: Node) -> Node:
@@ -148,23 +480,28 @@ class AVLTree(TreeBST):
         return node
     
     def __update_node__(self, node: Node) -> None:
-        """Updates given node's AVL data to maintain balance (height and balance_factor).
+        """Updates given node's AVL data to maintain balance (height and balance_factor)
+        and its subtree size.
 
         Args:
             node (Node): Node to update.
         """
-        # Init children heights
+        # Init children heights and sizes
         left_height = -1
         right_height = -1
+        size = 1
         
-        # Grab children node heights
+        # Grab children node heights and sizes
         if node.left:
             left_height = node.left.height
+            size = size + node.left.size
         if node.right:
             right_height = node.right.height
+            size = size + node.right.size
         
-        # Update this node's height
+        # Update this node's height and size
         node.height = 1 + max(left_height, right_height)
+        node.size = size
         
         # Update balance factor
         node.balance_factor = right_height - left_height
@@ -246,3 +583,86 @@ if __name__ == '__main__':
     # Removals
     myTree.remove(30)
     print(myTree.inorder())
+    
+    # Ordered queries checked against a sorted list
+    import bisect
+    import random
+    values = random.Random(1).sample(range(0, 2000, 2), 300)
+    ordered = AVLTree()
+    for value in values:
+        ordered.insert(value)
+    values.sort()
+    for probe in range(-3, 2003):
+        index = bisect.bisect_right(values, probe)
+        assert(ordered.floor(probe) == (values[index - 1] if index else None))
+        index = bisect.bisect_left(values, probe)
+        assert(ordered.ceiling(probe) == ordered.lower_bound(probe) == (values[index] if index < len(values) else None))
+        index = bisect.bisect_right(values, probe)
+        assert(ordered.upper_bound(probe) == (values[index] if index < len(values) else None))
+    for low, high in [(None, None), (100, 500), (101, 499), (500, 100), (None, 50), (1900, None)]:
+        start = 0 if low is None else bisect.bisect_left(values, low)
+        end = len(values) if high is None else bisect.bisect_left(values, high)
+        assert(list(ordered.range(low, high)) == values[start:end])
+    assert(list(ordered.range(values[3], values[7], include_high=True)) == values[3:8])
+    print("Ordered queries: Pass")
+    
+    # Order statistics checked against a sorted list
+    assert(ordered.__root__.size == ordered.count == len(values))
+    assert([ordered.select(k) for k in range(1, len(values) + 1)] == values)
+    for probe in range(-3, 2003, 7):
+        assert(ordered.rank(probe) == bisect.bisect_left(values, probe))
+    assert(ordered.count_range(100, 500) == len(list(ordered.range(100, 500))))
+    assert(ordered.count_range(values[3], values[7], include_high=True) == 5)
+    assert(ordered.count_range(500, 100) == 0)
+    for low, high in ((None, 500), (100, None), (None, None), (None, values[7])):
+        assert(ordered.count_range(low, high) == len(list(ordered.range(low, high))))
+        assert(ordered.count_range(low, high, include_high=True) == len(list(ordered.range(low, high, include_high=True))))
+    print("Order statistics: Pass")
+    
+    # Randomized inserts and removals checked against a set
+    def check(node):
+        # Returns (height, size) of the subtree after verifying its AVL data
+        if not node:
+            return (-1, 0)
+        left_height, left_size = check(node.left)
+        right_height, right_size = check(node.right)
+        assert(node.height == 1 + max(left_height, right_height))
+        assert(node.balance_factor == right_height - left_height and abs(node.balance_factor) <= 1)
+        assert(node.size == 1 + left_size + right_size)
+        return (node.height, node.size)
+    
+    generator = random.Random(2)
+    churn = AVLTree()
+    expected = set()
+    for _ in range(5000):
+        value = generator.randrange(500)
+        if generator.random() < 0.55:
+            assert(churn.insert(value) == (value not in expected))
+            expected.add(value)
+        else:
+            assert(churn.remove(value) == (value in expected))
+            expected.discard(value)
+    check(churn.__root__)
+    assert(churn.inorder() == sorted(expected) and churn.count == len(expected))
+    print("Randomized insert/remove: Pass")
+    
+    # Bulk construction
+    bulk = AVLTree.from_sorted(range(1000))
+    check(bulk.__root__)
+    assert(bulk.inorder() == list(range(1000)) and bulk.count == 1000 and bulk.__root__.height == 9)
+    unsorted = AVLTree.from_iterable(generator.sample(range(1000), 1000) + [5, 5, None])
+    check(unsorted.__root__)
+    assert(unsorted == bulk)
+    try:
+        AVLTree.from_sorted([1, 3, 2])
+    except TreeException:
+        print("Unsorted input to from_sorted: Pass")
+    evens = AVLTree.from_sorted(range(0, 100, 2))
+    thirds = AVLTree.from_sorted(range(0, 100, 3))
+    combined = evens.union(thirds)
+    check(combined.__root__)
+    assert(combined.inorder() == sorted(set(range(0, 100, 2)) | set(range(0, 100, 3))))
+    evens.merge(thirds)
+    assert(evens == combined and evens.insert(1) and evens.remove(0))
+    check(evens.__root__)
+    print("Bulk construction and union: Pass")
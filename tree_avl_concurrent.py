@@ -0,0 +1,235 @@
+import threading
+from tree_avl_persistent import *
+
+class ConcurrentAVLTree(object):
+    """Thread-safe ordered container with the same API as AVLTree, built on the path-copying
+    PersistentAVLTree. Writers are serialized by one lock, apply their change to a private
+    persistent tree and then publish its new root with a single reference store.
+
+    Reads never take a lock. Each read loads the published root once and runs entirely on
+    that version, which no writer will ever modify, so a reader can't observe a half-done
+    rotation or retry because of one. Iteration and range scans see the whole tree as it
+    was when they started. This holds under the GIL and on free-threaded builds, where
+    single attribute loads and stores are still atomic.
+    """
+    # Constructor
+    def __init__(self) -> None:
+        # Private
+        self.__lock__ = threading.Lock()
+        self.__writer__ = PersistentAVLTree()
+        self.__root__ = None
+
+    # Properties
+    @property
+    def count(self) -> int:
+        """Number of stored values, read from the published root so it always matches the
+        version that a read right after it would see.
+        """
+        root = self.__root__
+        return root.size if root else 0
+
+    # Comparison Operators
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ConcurrentAVLTree):
+            other = other.snapshot()
+        return self.snapshot() == other
+
+    def __contains__(self, value: object) -> bool:
+        # Hot path, walk the published root directly instead of wrapping it in a snapshot
+        node = self.__root__
+        while node:
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def similar(self, other: object) -> bool:
+        if isinstance(other, ConcurrentAVLTree):
+            other = other.snapshot()
+        return self.snapshot().similar(other)
+
+    # Iterator
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __reversed__(self):
+        return reversed(self.snapshot())
+
+    # Public Methods
+    def insert(self, value: object) -> bool:
+        with self.__lock__:
+            inserted = self.__writer__.insert(value)
+            self.__root__ = self.__writer__.__root__
+        return inserted
+
+    def remove(self, value: object) -> bool:
+        with self.__lock__:
+            removed = self.__writer__.remove(value)
+            self.__root__ = self.__writer__.__root__
+        return removed
+
+    def insert_all(self, values) -> int:
+        """Atomically inserts every given value, readers see either none or all of them. If
+        an insert raises (e.g. on a value that can't be compared), the batch is rolled back
+        and nothing is published.
+
+        Args:
+            values (iterable): Values to insert.
+
+        Returns:
+            int: Number of values that weren't already stored.
+        """
+        with self.__lock__:
+            try:
+                inserted = sum(self.__writer__.insert(value) for value in values)
+            except BaseException:
+                self.__rollback__()
+                raise
+            self.__root__ = self.__writer__.__root__
+        return inserted
+
+    def merge(self, other: 'TreeBST') -> None:
+        with self.__lock__:
+            try:
+                self.__writer__.merge(other)
+            except BaseException:
+                self.__rollback__()
+                raise
+            self.__root__ = self.__writer__.__root__
+
+    def clear(self) -> None:
+        with self.__lock__:
+            self.__writer__.clear()
+            self.__root__ = None
+
+    def snapshot(self) -> PersistentAVLTree:
+        """Captures the published version of the tree in O(1) without locking. Several reads
+        on the snapshot are consistent with each other, later writes don't affect it.
+
+        Returns:
+            PersistentAVLTree: Tree holding the current version.
+        """
+        root = self.__root__
+        tree = PersistentAVLTree()
+        tree.__root__ = root
+        tree.count = root.size if root else 0
+        return tree
+
+    def copy(self) -> PersistentAVLTree:
+        return self.snapshot().copy()
+
+    def max(self) -> object:
+        return self.snapshot().max()
+
+    def min(self) -> object:
+        return self.snapshot().min()
+
+    # Ordered Queries
+    def floor(self, value: object) -> object:
+        return self.snapshot().floor(value)
+
+    def ceiling(self, value: object) -> object:
+        return self.snapshot().ceiling(value)
+
+    def lower_bound(self, value: object) -> object:
+        return self.snapshot().lower_bound(value)
+
+    def upper_bound(self, value: object) -> object:
+        return self.snapshot().upper_bound(value)
+
+    def range(self, low: object = None, high: object = None, include_high: bool = False):
+        return self.snapshot().range(low, high, include_high)
+
+    # Order Statistics
+    def select(self, k: int) -> object:
+        return self.snapshot().select(k)
+
+    def rank(self, value: object) -> int:
+        return self.snapshot().rank(value)
+
+    def count_range(self, low: object = None, high: object = None, include_high: bool = False) -> int:
+        return self.snapshot().count_range(low, high, include_high)
+
+    # Traversals
+    def preorder(self) -> 'list[object]':
+        return self.snapshot().preorder()
+
+    def inorder(self) -> 'list[object]':
+        return self.snapshot().inorder()
+
+    def postorder(self) -> 'list[object]':
+        return self.snapshot().postorder()
+
+    def levelorder(self) -> 'list[object]':
+        return self.snapshot().levelorder()
+
+    def iter_preorder(self):
+        return self.snapshot().iter_preorder()
+
+    def iter_inorder(self):
+        return self.snapshot().iter_inorder()
+
+    def iter_postorder(self):
+        return self.snapshot().iter_postorder()
+
+    def iter_levelorder(self):
+        return self.snapshot().iter_levelorder()
+
+    # Helper (Private) Methods
+    def __rollback__(self) -> None:
+        """Resets the writer to the published version after a failed batch. The published
+        nodes are never modified, so this is O(1). Must be called with the lock held.
+        """
+        root = self.__root__
+        self.__writer__.__root__ = root
+        self.__writer__.count = root.size if root else 0
+
+if __name__ == '__main__':
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Writers on disjoint values, readers checking that every version they see is sorted
+    tree = ConcurrentAVLTree()
+    tree.insert_all(range(0, 4000, 4))
+    failures = []
+
+    def writer(offset):
+        for value in range(offset, 4000, 4):
+            tree.insert(value)
+        for value in range(offset, 4000, 8):
+            tree.remove(value)
+
+    def reader(_):
+        for _ in range(200):
+            values = list(tree)
+            if values != sorted(values) or not all(value in tree for value in range(4, 4000, 8)):
+                failures.append(values)
+            tree.floor(1001)
+            tree.range(100, 200)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(writer, offset) for offset in (1, 2, 3)]
+        futures = futures + [pool.submit(reader, seed) for seed in range(5)]
+        for future in futures:
+            future.result()
+    expected = sorted(set(range(4000)) - set(range(1, 4000, 8)) - set(range(2, 4000, 8)) - set(range(3, 4000, 8)))
+    assert(not failures and tree.inorder() == expected and tree.count == len(expected))
+    print("Concurrent writers: Pass")
+
+    # A batch that fails part way leaves no trace, not even in the next write
+    try:
+        tree.insert_all([100000, 100001, "incomparable", 100002])
+        assert(False)
+    except TypeError:
+        pass
+    tree.insert(-1)
+    assert(100000 not in tree and tree.inorder() == [-1] + expected and tree.count == len(expected) + 1)
+    tree.remove(-1)
+    print("Failed batch rolls back: Pass")
+
+    snapshot = tree.snapshot()
+    tree.clear()
+    assert(tree.count == 0 and snapshot.inorder() == expected and 4 not in tree and tree.floor(10) is None)
+    print("Snapshot survives clear: Pass")
@@ -0,0 +1,258 @@
+from tree_avl import *
+
+class PersistentAVLTree(AVLTree):
+    """An AVL Tree whose nodes are never modified once an insert or remove has finished.
+    Each write copies the O(log n) nodes on its path (plus the few a rotation touches) and
+    links them to the untouched subtrees of the previous version, so every earlier root
+    still describes a complete, balanced tree.
+
+    snapshot() is O(1) and hands out the root of the last finished write, an insert or
+    remove builds its version on a working root that is only published once rebalancing is
+    done. Readers can call snapshot() and traverse the result from other threads without any
+    locking while the writer keeps going, the writer only ever modifies nodes it allocated
+    during the current operation. The tree itself still expects a single writer at a time.
+
+    join() and split() copy their input trees first and leave them untouched, and the
+    set operations in tree_avl_sets must not be run with consume=True on these trees.
+    """
+    # Class Structs
+    class Node(AVLTree.Node):
+        """An AVL Node that remembers which write operation allocated it. Only nodes of the
+        running operation may be modified, every other node is shared with older versions.
+        """
+        # Use AVLTree.Node as our basis, add the owning operation
+        def __init__(self, value=None, left=None, right=None, balance_factor=0, height=0, size=1, version=None) -> None:
+            super().__init__(value, left, right, balance_factor, height, size)
+            self.version = version
+
+    # Constructor
+    def __init__(self) -> None:
+        # Private
+        self.__writing__ = False
+        self.__version__ = None
+        super().__init__()
+
+    # Properties
+    @property
+    def __root__(self) -> Node:
+        """The working root, which only differs from the published one while an insert or
+        remove is running.
+        """
+        return self.__working__
+
+    @__root__.setter
+    def __root__(self, root: Node) -> None:
+        self.__working__ = root
+        if not self.__writing__:
+            self.__published__ = root
+
+    # Public Methods
+    def insert(self, value: object) -> bool:
+        """Insert the given value, path-copying instead of modifying shared nodes. Will
+        ignore duplicate and None type values.
+
+        Args:
+            value (object): Value to insert.
+
+        Returns:
+            bool: Returns True if insertion was successful.
+        """
+        # Every operation gets a fresh token, so nodes of earlier ones are never modified
+        self.__version__ = object()
+        self.__writing__ = True
+        try:
+            return super().insert(value)
+        finally:
+            self.__publish__()
+
+    def remove(self, value: object) -> bool:
+        """Remove the given value, path-copying instead of modifying shared nodes.
+
+        Args:
+            value (object): Value to remove.
+
+        Returns:
+            bool: Returns True if the value was found and removed.
+        """
+        self.__version__ = object()
+        self.__writing__ = True
+        try:
+            return super().remove(value)
+        finally:
+            self.__publish__()
+
+    def snapshot(self) -> 'PersistentAVLTree':
+        """Captures the last finished version of the tree in O(1), safe to call from any
+        thread. The snapshot shares every node with this tree and neither is affected by
+        later writes to the other.
+
+        Returns:
+            PersistentAVLTree: Tree holding the current version.
+        """
+        # One read of the published root, its count comes from the root itself
+        root = self.__published__
+        tree = self.__class__()
+        tree.__root__ = root
+        tree.count = root.size if root else 0
+        return tree
+
+    # Join/Split
+    @classmethod
+    def join(cls, left: 'PersistentAVLTree', value: object, right: 'PersistentAVLTree') -> 'PersistentAVLTree':
+        """Joins copies of two trees and a value in between them, see AVLTree.join(). Both
+        trees are left untouched, which makes this O(n).
+        """
+        return super().join(left.copy(), value, right.copy())
+
+    def split(self, value: object) -> 'tuple[PersistentAVLTree, bool, PersistentAVLTree]':
+        """Splits a copy of the tree around the given value, see AVLTree.split(). This tree is
+        left untouched, which makes this O(n).
+        """
+        return AVLTree.split(self.copy(), value)
+
+    # Helper (Private) Operations
+    def __publish__(self) -> None:
+        """Ends the running write and publishes its finished root to snapshot(). This is a
+        helper function not meant to be called outside of the class.
+        """
+        self.__writing__ = False
+        self.__published__ = self.__working__
+
+    def __own__(self, node: Node) -> Node:
+        """Returns a node the running operation may modify: the node itself if this
+        operation allocated it, a copy of it otherwise. This is a helper function not
+        meant to be called outside of the class.
+
+        Args:
+            node (Node): Node about to be modified.
+
+        Returns:
+            Node: The node or its copy.
+        """
+        if node.version is self.__version__:
+            return node
+        return self.Node(node.value, node.left, node.right, node.balance_factor, node.height, node.size, self.__version__)
+
+    def __own_path__(self, path: 'list[Node]') -> 'list[Node]':
+        """Copies the nodes on the path and links the copies to each other, making the first
+        one the new root. This is a helper function not meant to be called outside of the
+        class.
+
+        Args:
+            path (list[Node]): Nodes about to be modified, root first.
+
+        Returns:
+            list[Node]: The copies, root first.
+        """
+        owned = [self.__own__(node) for node in path]
+        for depth in range(1, len(path)):
+            parent = owned[depth - 1]
+            if parent.left is path[depth]:
+                parent.left = owned[depth]
+            else:
+                parent.right = owned[depth]
+        if owned:
+            # Only the working root, readers keep the previous version until the write ends
+            self.__root__ = owned[0]
+        return owned
+
+    # AVL Rotations
+    def __rotate_left__(self, node: Node) -> Node:
+        # Rebalancing after a removal rotates nodes off the path, copy them first
+        node = self.__own__(node)
+        node.right = self.__own__(node.right)
+        return super().__rotate_left__(node)
+
+    def __rotate_right__(self, node: Node) -> Node:
+        node = self.__own__(node)
+        node.left = self.__own__(node.left)
+        return super().__rotate_right__(node)
+
+if __name__ == '__main__':
+    import random
+    import threading
+
+    def check(node):
+        # Returns (height, size) of the subtree after verifying its AVL data
+        if not node:
+            return (-1, 0)
+        left_height, left_size = check(node.left)
+        right_height, right_size = check(node.right)
+        assert(node.height == 1 + max(left_height, right_height))
+        assert(node.balance_factor == right_height - left_height and abs(node.balance_factor) <= 1)
+        assert(node.size == 1 + left_size + right_size)
+        return (node.height, node.size)
+
+    # Every snapshot has to keep its exact contents while the writer churns
+    generator = random.Random(5)
+    tree = PersistentAVLTree()
+    expected = set()
+    versions = []
+    for step in range(6000):
+        value = generator.randrange(700)
+        if generator.random() < 0.55:
+            assert(tree.insert(value) == (value not in expected))
+            expected.add(value)
+        else:
+            assert(tree.remove(value) == (value in expected))
+            expected.discard(value)
+        if step % 200 == 0:
+            versions.append((tree.snapshot(), sorted(expected)))
+    check(tree.__root__)
+    assert(tree.inorder() == sorted(expected) and tree.count == len(expected))
+    for snapshot, values in versions:
+        check(snapshot.__root__)
+        assert(snapshot.inorder() == values and snapshot.count == len(values))
+    print("Randomized insert/remove with snapshots: Pass")
+
+    # Writes to a snapshot branch off without touching the original
+    branch = versions[10][0]
+    branch.insert(-1)
+    branch.remove(versions[10][1][0])
+    assert(versions[11][0].inorder() == versions[11][1] and tree.inorder() == sorted(expected))
+    print("Branching snapshots: Pass")
+
+    # A reader walks a snapshot on another thread without locking
+    base = PersistentAVLTree.from_sorted(range(0, 20000, 2))
+    snapshot = base.snapshot()
+    results = []
+    reader = threading.Thread(target=lambda: results.append([list(snapshot) for _ in range(5)]))
+    reader.start()
+    for value in range(1, 20000, 2):
+        base.insert(value)
+    for value in range(0, 20000, 4):
+        base.remove(value)
+    reader.join()
+    assert(all(walk == list(range(0, 20000, 2)) for walk in results[0]))
+    print("Lock-free reader: Pass")
+
+    # Snapshots taken on another thread mid-write are always finished, consistent versions
+    writer_tree = PersistentAVLTree()
+    done = threading.Event()
+    failures = []
+    def take_snapshots():
+        while not done.is_set():
+            taken = writer_tree.snapshot()
+            try:
+                check(taken.__root__)
+                assert(taken.count == len(list(taken)))
+            except AssertionError:
+                failures.append(taken)
+    reader = threading.Thread(target=take_snapshots)
+    reader.start()
+    for step in range(20000):
+        value = generator.randrange(2000)
+        if generator.random() < 0.6:
+            writer_tree.insert(value)
+        else:
+            writer_tree.remove(value)
+    done.set()
+    reader.join()
+    assert(not failures and writer_tree.snapshot().inorder() == writer_tree.inorder())
+    print("Snapshots during writes: Pass")
+
+    smaller, found, larger = base.split(5001)
+    assert(found and base.count == 15000 and smaller.count + larger.count == 14999)
+    joined = PersistentAVLTree.join(smaller, 5001, larger)
+    assert(joined.similar(base) and smaller.count + larger.count == 14999)
+    print("Join/split leave their inputs: Pass")
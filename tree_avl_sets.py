@@ -0,0 +1,210 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from enum import IntEnum
+from tree_avl import *
+
+class SetOperation(IntEnum):
+    """Set operations supported by set_operation(): [UNION, INTERSECTION, DIFFERENCE]
+    """
+    UNION        = 0
+    INTERSECTION = 1
+    DIFFERENCE   = 2
+
+def union(first: AVLTree, second: AVLTree, processes: int = None, threshold: int = 100000, consume: bool = False) -> AVLTree:
+    """Tree holding the values found in either tree. See set_operation().
+    """
+    return set_operation(SetOperation.UNION, first, second, processes, threshold, consume)
+
+def intersection(first: AVLTree, second: AVLTree, processes: int = None, threshold: int = 100000, consume: bool = False) -> AVLTree:
+    """Tree holding the values found in both trees. See set_operation().
+    """
+    return set_operation(SetOperation.INTERSECTION, first, second, processes, threshold, consume)
+
+def difference(first: AVLTree, second: AVLTree, processes: int = None, threshold: int = 100000, consume: bool = False) -> AVLTree:
+    """Tree holding the values of the first tree that aren't in the second. See set_operation().
+    """
+    return set_operation(SetOperation.DIFFERENCE, first, second, processes, threshold, consume)
+
+def set_operation(operation: SetOperation, first: AVLTree, second: AVLTree, processes: int = None,
+                  threshold: int = 100000, consume: bool = False) -> AVLTree:
+    """Runs a divide-and-conquer set operation built on AVL join and split. The root of one
+    tree splits the other one, both halves are solved independently and the results are
+    joined back together, which costs O(m log(n / m + 1)) for trees of sizes m <= n.
+
+    Only subproblems holding at least threshold values combined go to a process pool,
+    anything smaller is solved in this process, where it's cheaper than pickling the trees
+    to a worker. No pool is started if both trees together are below threshold. The caller
+    must be guarded by "if __name__ == '__main__'" on platforms that spawn workers.
+
+    Args:
+        operation (SetOperation): Operation to run.
+        first (AVLTree): First tree.
+        second (AVLTree): Second tree.
+        processes (int, optional): Worker processes, None or 1 runs in this process. Defaults to None.
+        threshold (int, optional): Min combined size for a split to be run in parallel. Defaults to 100000.
+        consume (bool, optional): Reuse the nodes of both trees instead of copying them first,
+        which empties both trees. Defaults to False.
+
+    Returns:
+        AVLTree: Tree holding the result.
+    """
+    if not consume:
+        first = first.copy()
+        second = second.copy()
+
+    tree = first.__class__()
+    first_root = first.__root__
+    second_root = second.__root__
+    first.clear()
+    second.clear()
+
+    size = (first_root.size if first_root else 0) + (second_root.size if second_root else 0)
+    if processes is None or processes <= 1 or size < threshold:
+        root = __solve__(tree, operation, first_root, second_root)
+    else:
+        # Split levels until there's roughly one subproblem per process
+        levels = max(1, (processes - 1).bit_length())
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            plan = __plan__(tree, pool, operation, first_root, second_root, levels, threshold)
+            root = __assemble__(tree, operation, plan)
+
+    tree.__root__ = root
+    tree.count = root.size if root else 0
+    return tree
+
+def __solve__(tree: AVLTree, operation: SetOperation, first: AVLTree.Node, second: AVLTree.Node) -> AVLTree.Node:
+    """Sequentially runs the set operation on two subtrees, consuming their nodes. This is a
+    private function and should only be called internally.
+
+    Args:
+        tree (AVLTree): Tree whose join/split helpers are used.
+        operation (SetOperation): Operation to run.
+        first (Node): Root of the first subtree.
+        second (Node): Root of the second subtree.
+
+    Returns:
+        Node: Root of the resulting subtree.
+    """
+    if operation == SetOperation.UNION:
+        if not first or not second:
+            return first or second
+        
+        # Both operations are symmetric, recursing over the smaller tree does less work
+        if second.size < first.size:
+            first, second = second, first
+        left, _, right = tree.__split__(second, first.value)
+        return tree.__join__(__solve__(tree, operation, first.left, left), first.value,
+                             __solve__(tree, operation, first.right, right), first)
+
+    if operation == SetOperation.INTERSECTION:
+        if not first or not second:
+            return None
+        if second.size < first.size:
+            first, second = second, first
+        left, found, right = tree.__split__(second, first.value)
+        left = __solve__(tree, operation, first.left, left)
+        right = __solve__(tree, operation, first.right, right)
+        return tree.__join__(left, first.value, right, first) if found else tree.__join2__(left, right)
+
+    # Difference, split the first tree by the values being removed
+    if not first or not second:
+        return first
+    left, _, right = tree.__split__(first, second.value)
+    return tree.__join2__(__solve__(tree, operation, left, second.left),
+                          __solve__(tree, operation, right, second.right))
+
+def __solve_task__(operation: SetOperation, first: AVLTree.Node, second: AVLTree.Node) -> AVLTree.Node:
+    """Entry point for worker processes. This is a private function and should only be
+    called internally.
+    """
+    return __solve__(AVLTree(), operation, first, second)
+
+def __plan__(tree: AVLTree, pool: ProcessPoolExecutor, operation: SetOperation, first: AVLTree.Node,
+             second: AVLTree.Node, levels: int, threshold: int) -> object:
+    """Performs the top levels of the recursion in this process and submits the remaining
+    subproblems of at least threshold values to the pool, smaller ones are solved right
+    away. This is a private function and should only be called internally.
+
+    Returns:
+        object: A Future for a submitted subproblem, the root of a subproblem solved in this
+        process, or a (left plan, value, keep value, right plan) tuple for a split done here.
+    """
+    size = (first.size if first else 0) + (second.size if second else 0)
+    if size < threshold or not first or not second:
+        return __solve__(tree, operation, first, second)
+    if levels == 0:
+        return pool.submit(__solve_task__, operation, first, second)
+
+    if operation == SetOperation.DIFFERENCE:
+        value = second.value
+        left, _, right = tree.__split__(first, value)
+        pairs = ((left, second.left), (right, second.right))
+        keep = False
+    else:
+        value = first.value
+        left, found, right = tree.__split__(second, value)
+        pairs = ((first.left, left), (first.right, right))
+        keep = operation == SetOperation.UNION or found
+
+    return (__plan__(tree, pool, operation, *pairs[0], levels - 1, threshold), value, keep,
+            __plan__(tree, pool, operation, *pairs[1], levels - 1, threshold))
+
+def __assemble__(tree: AVLTree, operation: SetOperation, plan: object) -> AVLTree.Node:
+    """Waits for the submitted subproblems and joins their results. This is a private
+    function and should only be called internally.
+    """
+    if isinstance(plan, Future):
+        return plan.result()
+    if not isinstance(plan, tuple):
+        return plan
+
+    left_plan, value, keep, right_plan = plan
+    left = __assemble__(tree, operation, left_plan)
+    right = __assemble__(tree, operation, right_plan)
+    return tree.__join__(left, value, right) if keep else tree.__join2__(left, right)
+
+if __name__ == '__main__':
+    import random
+
+    generator = random.Random(3)
+    first_values = set(generator.sample(range(5000), 1500))
+    second_values = set(generator.sample(range(5000), 800))
+    first = AVLTree.from_iterable(first_values)
+    second = AVLTree.from_iterable(second_values)
+
+    def check(node):
+        # Returns (height, size) of the subtree after verifying its AVL data
+        if not node:
+            return (-1, 0)
+        left_height, left_size = check(node.left)
+        right_height, right_size = check(node.right)
+        assert(node.height == 1 + max(left_height, right_height))
+        assert(abs(right_height - left_height) <= 1 and node.size == 1 + left_size + right_size)
+        return (node.height, node.size)
+
+    for processes in (None, 2):
+        result = union(first, second, processes, threshold=100)
+        check(result.__root__)
+        assert(result.inorder() == sorted(first_values | second_values))
+        result = intersection(first, second, processes, threshold=100)
+        check(result.__root__)
+        assert(result.inorder() == sorted(first_values & second_values))
+        result = difference(first, second, processes, threshold=100)
+        check(result.__root__)
+        assert(result.inorder() == sorted(first_values - second_values))
+        assert(first.count == len(first_values) and second.count == len(second_values))
+        print(f"Set operations (processes={processes}): Pass")
+
+    # Below the threshold everything runs in this process, even with a pool requested
+    result = union(first, second, 2, threshold=len(first_values) + len(second_values) + 1)
+    assert(result.inorder() == sorted(first_values | second_values))
+
+    smaller, found, larger = first.copy().split(2500)
+    check(smaller.__root__)
+    check(larger.__root__)
+    assert(found == (2500 in first_values))
+    assert(smaller.inorder() == sorted(value for value in first_values if value < 2500))
+    assert(larger.inorder() == sorted(value for value in first_values if value > 2500))
+    joined = AVLTree.join(smaller, 2500, larger)
+    check(joined.__root__)
+    assert(joined.inorder() == sorted(first_values | {2500}) and smaller.count == 0)
+    print("Join/split: Pass")
@@ -1,4 +1,6 @@
+from collections import deque
 from enum import IntEnum
+from itertools import zip_longest
 from exception_tree import TreeException
     
 class TreeBST(object):
@@ -12,12 +14,13 @@ class TreeBST(object):
     """
     # Class Structs
     class TreeTraversalOrder(IntEnum):
-        """A Traversal Order Enum to describe the three main traversal orders: 
-        [PREORDER, INORDER, POSTORDER]
+        """A Traversal Order Enum to describe the three main traversal orders and the
+        breadth-first one: [PREORDER, INORDER, POSTORDER, LEVELORDER]
         """
-        PREORDER  = 1 << 0,
-        INORDER   = 1 << 1,
-        POSTORDER = 1 << 2,
+        PREORDER   = 1 << 0,
+        INORDER    = 1 << 1,
+        POSTORDER  = 1 << 2,
+        LEVELORDER = 1 << 3,
 
     class Node(object):
         """Generic Tree Node structure to contain necessary tree information.
@@ -80,18 +83,28 @@ class TreeBST(object):
         Returns:
             bool: Result of whether both trees contain the same value
         """
-        return self.inorder() == other.inorder()
+        missing = object()
+        pairs = zip_longest(self.iter_inorder(), other.iter_inorder(), fillvalue=missing)
+        return all(this_value == other_value for this_value, other_value in pairs)
     
     # Iterator
     def __iter__(self):
-        raise TreeException(self.__class__.__name__, 'Iterator not implemented.')
+        """Lazily yields the values in ascending (inorder) order using O(height) memory.
+        The tree must not be modified while iterating.
+        """
+        return self.__traverse__(self.__root__, self.TreeTraversalOrder.INORDER)
 
-    def __next__(self):
-        raise TreeException(self.__class__.__name__, 'Iterator not implemented.')
+    def __reversed__(self):
+        """Lazily yields the values in descending order using O(height) memory. The tree
+        must not be modified while iterating.
+        """
+        return self.__inorder__(self.__root__, reverse=True)
     
     # Public Methods
     def insert(self, value: object) -> bool:
         """Insert the given value into the tree. Will ignore duplicate and None type values.
+        Duplicates are detected during the same single descent that finds the insertion
+        point.
 
         Args:
             value (object): Value to insert.
@@ -100,26 +113,94 @@ class TreeBST(object):
             bool: Returns True if insertion was successful.
         """
         # If value is None type, ignore insert
-        if value == None:
+        if value is None:
             return False
         
-        # If value is already contained in the tree, ignore duplicate
-        if self.__contains__(value):
-            return False
+        # Descend to the insertion point, remembering the path for retracing
+        path = []
+        node = self.__root__
+        while node:
+            path.append(node)
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                # Value is already contained in the tree, ignore duplicate
+                return False
+        
+        # Attach the new leaf under the last node on the path
+        path = self.__own_path__(path)
+        leaf = self.Node(value)
+        if not path:
+            self.__root__ = leaf
+        elif value < path[-1].value:
+            path[-1].left = leaf
+        else:
+            path[-1].right = leaf
         
-        # Run helper insert function, set root to rebalanced root and increment count
-        self.__root__ = self.__insert__(value, self.__root__,)
+        # Let subclasses fix up the nodes on the path, then increment count
+        self.__retrace__(path, 1)
         self.count = self.count + 1
         return True
     
     def remove(self, value: object) -> bool:
-        new_root = self.__remove__(value, self.__root__)
-        if new_root and new_root != self.__null_node__:
-            self.__root__ = new_root
-            self.count = self.count - 1
-            return True
+        """Remove the given value from the tree with a single iterative descent.
+
+        Args:
+            value (object): Value to remove.
+
+        Returns:
+            bool: Returns True if the value was found and removed.
+        """
+        if value is None:
+            return False
         
-        return False
+        # Descend to the node holding the value, remembering the path for retracing
+        path = []
+        node = self.__root__
+        while node:
+            if value < node.value:
+                path.append(node)
+                node = node.left
+            elif node.value < value:
+                path.append(node)
+                node = node.right
+            else:
+                break
+        
+        # Value isn't contained in the tree
+        if not node:
+            return False
+        
+        # Node has both children, swap the value of the successor into the node
+        # and remove the successor instead, which has no left child
+        swapped = None
+        if node.left and node.right:
+            swapped = len(path)
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node = successor
+        path = self.__own_path__(path)
+        if swapped is not None:
+            path[swapped].value = node.value
+        
+        # Node has either one or no children, replace it with that child
+        child = node.left if node.left else node.right
+        if not path:
+            self.__root__ = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        
+        # Let subclasses fix up the nodes on the path, then decrement count
+        self.__retrace__(path, -1)
+        self.count = self.count - 1
+        return True
     
     def clear(self) -> None:
         # Reset values
@@ -141,80 +222,112 @@ class TreeBST(object):
             object: Min value found.
         """
         return self.__find_min__(self.__root__).value
-        
-    # Helper (Private) Operations
-    def __insert__(self, value: object, node: Node) -> Node:
-        """A recursive insert helper function to insert the node into the tree. This is
-        purely a helper method and isn't meant to be called outside of the class.
+    
+    # Ordered Queries
+    def floor(self, value: object) -> object:
+        """Find the largest value in the tree that is less than or equal to the given value.
 
         Args:
-            value (object): The item to insert into the tree.
-            node (Node): The current node that we're at.
+            value (object): Value to compare against.
 
         Returns:
-            Node: The newly inserted node.
+            object: Matching value, None if every value in the tree is larger.
         """
-        # If our current node is None, insert value
-        if node == None:
-            return self.Node(value, balance_factor=0, height=0)
-        
-        # Insert value left if less than current node, otherwise insert right
-        if value < node.value:
-            node.left = self.__insert__(value, node.left)
-        else:
-            node.right = self.__insert__(value, node.right)
-        return node
+        return self.__find_bound__(value, above=False, inclusive=True)
     
-    def __remove__(self, value: object, node: Node) -> Node:
-        """A recursive remove helper function to remove a node from the tree. This is
-        purely a helper method and isn't meant to be called outside of the class.
+    def ceiling(self, value: object) -> object:
+        """Find the smallest value in the tree that is greater than or equal to the given value.
 
         Args:
-            value (object): The item to be removed from the tree.
-            node (Node): The current node that we're at.
+            value (object): Value to compare against.
 
         Returns:
-            Node: The removed node.
+            object: Matching value, None if every value in the tree is smaller.
         """
-        # Ensure we're at a node that exists
-        if not node:
-            return None
-        
-        # Recursively traverse the tree to find our value.
-        # When our value is less, traverse left
-        if value < node.value:
-            left_child = self.__remove__(value, node.left)
-            if not left_child:
-                return None
-            node.left = left_child
-        # When our value is more, traverse right
-        elif value > node.value:
-            right_child = self.__remove__(value, node.right)
-            if not right_child:
-                return None
-            node.right = right_child
-        # We have found our value
-        else:
-            # Node has either one or no children
-            if not node.left:
-                return node.right
-            elif not node.right:
-                return node.left
-            # Node has both children
+        return self.__find_bound__(value, above=True, inclusive=True)
+    
+    def lower_bound(self, value: object) -> object:
+        """Find the first value in sorted order that is not less than the given value (same
+        as ceiling()).
+
+        Args:
+            value (object): Value to compare against.
+
+        Returns:
+            object: Matching value, None if every value in the tree is smaller.
+        """
+        return self.__find_bound__(value, above=True, inclusive=True)
+    
+    def upper_bound(self, value: object) -> object:
+        """Find the first value in sorted order that is greater than the given value.
+
+        Args:
+            value (object): Value to compare against.
+
+        Returns:
+            object: Matching value, None if no value in the tree is larger.
+        """
+        return self.__find_bound__(value, above=True, inclusive=False)
+    
+    def range(self, low: object = None, high: object = None, include_high: bool = False):
+        """Lazily yields the values in [low, high) in ascending order. The walk descends
+        straight to low and stops at high, so it costs O(log n + k) for k yielded values on
+        a balanced tree. The tree must not be modified while iterating.
+
+        Args:
+            low (object, optional): Smallest value to yield, None for no lower bound. Defaults to None.
+            high (object, optional): Value to stop at, None for no upper bound. Defaults to None.
+            include_high (bool, optional): Also yield high itself if stored. Defaults to False.
+        """
+        # Descend to low, keeping every node whose left subtree may still hold values
+        # within range as a pending ancestor
+        stack = []
+        node = self.__root__
+        while node:
+            if low is not None and node.value < low:
+                node = node.right
             else:
-                # Swap the value of the successor into the node.
-                successor = self.__find_min__(node.right)
-                node.value = successor.value
-
-                # Go into the right subtree and remove the leftmost node we
-                # found and swapped data with. This prevents us from having
-                # two nodes in our tree with the same value.
-                replacement = self.__remove__(node.right, successor.value)
-                if not replacement:
-                    return None
-                node.right = replacement
+                stack.append(node)
+                node = node.left
         
-        return node
+        # Continue as a regular inorder walk until high is reached
+        while stack:
+            node = stack.pop()
+            if high is not None and (high < node.value or (not include_high and not node.value < high)):
+                return
+            yield node.value
+            
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+        
+    # Helper (Private) Operations
+    def __retrace__(self, path: 'list[Node]', delta: int) -> None:
+        """Called after a node was attached or detached below the last node of path (root
+        first) so subclasses can update and rebalance the affected ancestors. A plain BST
+        has nothing to update. This is purely a helper method and isn't meant to be called
+        outside of the class.
+
+        Args:
+            path (list[Node]): Ancestors of the changed position, root first.
+            delta (int): 1 after an insert, -1 after a removal.
+        """
+        pass
+    
+    def __own_path__(self, path: 'list[Node]') -> 'list[Node]':
+        """Called before insert() or remove() modifies the nodes of path (root first), so
+        subclasses can hand back copies to modify instead. A plain BST modifies its nodes
+        in place. This is purely a helper method and isn't meant to be called outside of
+        the class.
+
+        Args:
+            path (list[Node]): Nodes about to be modified, root first.
+
+        Returns:
+            list[Node]: Nodes to modify, linked to each other the same way.
+        """
+        return path
     
     def __find_node__(self, value: object) -> Node:
         """Iterates through the tree to find the matching node that contains
@@ -239,6 +352,34 @@ class TreeBST(object):
         
         return self.__null_node__
     
+    def __find_bound__(self, value: object, above: bool, inclusive: bool) -> object:
+        """Walks from the root to find the closest value on one side of the given value.
+        This is purely a helper method and isn't meant to be called outside of the class.
+
+        Args:
+            value (object): Value to compare against.
+            above (bool): Look for the closest larger value instead of the closest smaller one.
+            inclusive (bool): Whether a value equal to the given value matches.
+
+        Returns:
+            object: Closest matching value, None if there isn't one.
+        """
+        candidate = None
+        node = self.__root__
+        while node:
+            if node.value == value and inclusive:
+                return node.value
+            
+            # Going towards the bound, every node on the correct side is a better candidate
+            # than the last one
+            if (value < node.value) if above else (node.value < value):
+                candidate = node
+                node = node.left if above else node.right
+            else:
+                node = node.right if above else node.left
+        
+        return candidate.value if candidate else None
+    
     def __find_min__(self, node: Node) -> Node:
         """Iterates through the tree to find the node that contains the smallest value.
         This is purely a helper method and isn't meant to be called outside of the class.
@@ -268,24 +409,147 @@ class TreeBST(object):
         return node
     
     # Traversals
-    def traverse(self, node: Node, order: TreeTraversalOrder) -> 'list[Node]':
-        # Ensure that current node exists, otherwise break out early
-        if not node:
-            return []
-        
-        # Traverse based on TreeTraversalOrder and return resultant list
-        if order == self.TreeTraversalOrder.PREORDER:
-            return [node.value] + self.traverse(node.left, order) + self.traverse(node.right, order)
-        elif order == self.TreeTraversalOrder.POSTORDER:
-            return self.traverse(node.left, order) + self.traverse(node.right, order) + [node.value]
-        else:
-            return self.traverse(node.left, order) + [node.value] + self.traverse(node.right, order)
+    def traverse(self, node: Node, order: TreeTraversalOrder) -> 'list[object]':
+        """Collects the values of the subtree rooted at node in the given order.
+
+        Args:
+            node (Node): Root of the subtree to traverse.
+            order (TreeTraversalOrder): Order to visit the nodes in.
+
+        Returns:
+            list[object]: Values in traversal order.
+        """
+        return list(self.__traverse__(node, order))
         
-    def preorder(self) -> 'list[Node]':
+    def preorder(self) -> 'list[object]':
         return self.traverse(self.__root__, self.TreeTraversalOrder.PREORDER)
     
-    def inorder(self) -> 'list[Node]':
+    def inorder(self) -> 'list[object]':
         return self.traverse(self.__root__, self.TreeTraversalOrder.INORDER)
     
-    def postorder(self) -> 'list[Node]':
+    def postorder(self) -> 'list[object]':
         return self.traverse(self.__root__, self.TreeTraversalOrder.POSTORDER)
+    
+    def levelorder(self) -> 'list[object]':
+        return self.traverse(self.__root__, self.TreeTraversalOrder.LEVELORDER)
+    
+    def iter_preorder(self):
+        """Lazy preorder generator, the tree must not be modified while iterating.
+        """
+        return self.__traverse__(self.__root__, self.TreeTraversalOrder.PREORDER)
+    
+    def iter_inorder(self):
+        """Lazy inorder generator, the tree must not be modified while iterating.
+        """
+        return self.__traverse__(self.__root__, self.TreeTraversalOrder.INORDER)
+    
+    def iter_postorder(self):
+        """Lazy postorder generator, the tree must not be modified while iterating.
+        """
+        return self.__traverse__(self.__root__, self.TreeTraversalOrder.POSTORDER)
+    
+    def iter_levelorder(self):
+        """Lazy level order generator, the tree must not be modified while iterating.
+        """
+        return self.__traverse__(self.__root__, self.TreeTraversalOrder.LEVELORDER)
+    
+    def __traverse__(self, node: Node, order: TreeTraversalOrder):
+        """Generator that walks the subtree rooted at node with an explicit stack instead
+        of recursion, so degenerate trees can't hit the recursion limit. Depth-first orders
+        use O(height) memory, level order uses O(width). This is purely a helper method and
+        isn't meant to be called outside of the class.
+
+        Args:
+            node (Node): Root of the subtree to traverse.
+            order (TreeTraversalOrder): Order to visit the nodes in.
+        """
+        if order == self.TreeTraversalOrder.PREORDER:
+            # Visit the node, then its left subtree before its right one
+            stack = [node] if node else []
+            while stack:
+                node = stack.pop()
+                yield node.value
+                if node.right:
+                    stack.append(node.right)
+                if node.left:
+                    stack.append(node.left)
+        elif order == self.TreeTraversalOrder.POSTORDER:
+            # Only visit a node once its right subtree has been finished
+            stack = []
+            last_visited = None
+            while stack or node:
+                if node:
+                    stack.append(node)
+                    node = node.left
+                else:
+                    parent = stack[-1]
+                    if parent.right and last_visited is not parent.right:
+                        node = parent.right
+                    else:
+                        yield parent.value
+                        last_visited = stack.pop()
+        elif order == self.TreeTraversalOrder.LEVELORDER:
+            # Breadth-first, one level at a time
+            queue = deque([node] if node else [])
+            while queue:
+                node = queue.popleft()
+                yield node.value
+                if node.left:
+                    queue.append(node.left)
+                if node.right:
+                    queue.append(node.right)
+        else:
+            yield from self.__inorder__(node)
+    
+    def __inorder__(self, node: Node, reverse: bool = False):
+        """Generator for an inorder walk with an explicit stack of the pending ancestors.
+        This is purely a helper method and isn't meant to be called outside of the class.
+
+        Args:
+            node (Node): Root of the subtree to traverse.
+            reverse (bool, optional): Walk from largest to smallest. Defaults to False.
+        """
+        stack = []
+        while stack or node:
+            if node:
+                # Go as far towards the smallest (or largest) value as possible
+                stack.append(node)
+                node = node.right if reverse else node.left
+            else:
+                node = stack.pop()
+                yield node.value
+                node = node.left if reverse else node.right
+
+if __name__ == '__main__':
+    # Degenerate (linked list shaped) tree
+    tree = TreeBST()
+    for value in range(500):
+        tree.insert(value)
+    assert(tree.inorder() == list(range(500)))
+    assert(list(reversed(tree)) == list(range(499, -1, -1)))
+    assert(tree.preorder() == tree.levelorder() == list(range(500)))
+    assert(tree.postorder() == list(range(499, -1, -1)))
+    print("Degenerate traversals: Pass")
+    
+    # Balanced-ish tree
+    tree = TreeBST()
+    for value in [50, 30, 70, 20, 40, 60, 80, 35]:
+        tree.insert(value)
+    print("Preorder:", tree.preorder())
+    print("Inorder:", list(tree))
+    print("Postorder:", tree.postorder())
+    print("Level order:", tree.levelorder())
+    assert(tree.preorder() == [50, 30, 20, 40, 35, 70, 60, 80])
+    assert(tree.postorder() == [20, 35, 40, 30, 60, 80, 70, 50])
+    assert(tree.levelorder() == [50, 30, 70, 20, 40, 60, 80, 35])
+    
+    iterator = iter(tree)
+    assert(next(iterator) == 20 and next(iterator) == 30)
+    print("Lazy iteration: Pass")
+    
+    # Ordered queries
+    assert(tree.floor(45) == 40 and tree.ceiling(45) == 50)
+    assert(tree.lower_bound(60) == 60 and tree.upper_bound(60) == 70)
+    assert(tree.floor(10) is None and tree.ceiling(90) is None)
+    assert(list(tree.range(30, 60)) == [30, 35, 40, 50])
+    print("Ordered queries: Pass")
@@ -0,0 +1,359 @@
+from bisect import bisect_left, bisect_right
+from itertools import chain, zip_longest
+from exception_tree import TreeException
+
+class SortedBlockList(object):
+    """An ordered container with the same public API as TreeBST, stored as a list of sorted
+    blocks (plain Python lists) instead of one node per value. Searches bisect a list of
+    each block's largest value and then bisect inside of a single block, so comparisons run
+    over contiguous lists in C instead of following a pointer per node. Blocks are split
+    once they grow past twice the fan-out and merged with a neighbor once they shrink
+    below half of it.
+
+    Only ascending (inorder) traversals exist, a list of blocks has no tree shape for
+    preorder/postorder/level order to follow.
+    """
+    # Constructor
+    def __init__(self, fan_out: int = 1000) -> None:
+        """Constructor for the block list.
+
+        Args:
+            fan_out (int, optional): Target block length. Defaults to 1000.
+
+        Raises:
+            TreeException: Raised if fan_out is less than 4.
+        """
+        if fan_out < 4:
+            raise TreeException(self.__class__.__name__, f"Fan-out must be at least 4, got {fan_out}.")
+
+        # Public
+        self.count = 0
+        self.fan_out = fan_out
+
+        # Private
+        self.__blocks__ = []
+        self.__maxes__ = []
+
+    # Comparison Operators
+    def __eq__(self, other: 'SortedBlockList') -> bool:
+        # Equality based on both containers holding the same values
+        return self.count == other.count and self.similar(other)
+
+    def __contains__(self, value: object) -> bool:
+        index = bisect_left(self.__maxes__, value)
+        if index == len(self.__maxes__):
+            return False
+        block = self.__blocks__[index]
+        position = bisect_left(block, value)
+        return not value < block[position]
+
+    def similar(self, other: object) -> bool:
+        """Whether both containers (or a container and a tree) hold the same values.
+
+        Args:
+            other (object): Container or tree to compare to.
+
+        Returns:
+            bool: Result of whether both contain the same values.
+        """
+        missing = object()
+        pairs = zip_longest(self, other, fillvalue=missing)
+        return all(this_value == other_value for this_value, other_value in pairs)
+
+    # Iterator
+    def __iter__(self):
+        """Lazily yields the values in ascending order. The container must not be modified
+        while iterating.
+        """
+        return chain.from_iterable(self.__blocks__)
+
+    def __reversed__(self):
+        """Lazily yields the values in descending order. The container must not be modified
+        while iterating.
+        """
+        return chain.from_iterable(reversed(block) for block in reversed(self.__blocks__))
+
+    # Public Methods
+    def insert(self, value: object) -> bool:
+        """Insert the given value. Will ignore duplicate and None type values.
+
+        Args:
+            value (object): Value to insert.
+
+        Returns:
+            bool: Returns True if insertion was successful.
+        """
+        if value is None:
+            return False
+
+        if not self.__blocks__:
+            self.__blocks__.append([value])
+            self.__maxes__.append(value)
+            self.count = 1
+            return True
+
+        # Find the first block whose largest value isn't smaller, or append to the last one
+        index = bisect_left(self.__maxes__, value)
+        if index == len(self.__maxes__):
+            index = index - 1
+            self.__blocks__[index].append(value)
+            self.__maxes__[index] = value
+        else:
+            block = self.__blocks__[index]
+            position = bisect_left(block, value)
+            if not value < block[position]:
+                return False
+            block.insert(position, value)
+
+        self.count = self.count + 1
+        if len(self.__blocks__[index]) > 2 * self.fan_out:
+            self.__split_block__(index)
+        return True
+
+    def remove(self, value: object) -> bool:
+        """Remove the given value.
+
+        Args:
+            value (object): Value to remove.
+
+        Returns:
+            bool: Returns True if the value was found and removed.
+        """
+        if value is None:
+            return False
+
+        index = bisect_left(self.__maxes__, value)
+        if index == len(self.__maxes__):
+            return False
+        block = self.__blocks__[index]
+        position = bisect_left(block, value)
+        if value < block[position]:
+            return False
+
+        del block[position]
+        self.count = self.count - 1
+        if not block:
+            del self.__blocks__[index]
+            del self.__maxes__[index]
+        else:
+            self.__maxes__[index] = block[-1]
+            if len(block) < self.fan_out // 2 and len(self.__blocks__) > 1:
+                self.__merge_block__(index)
+        return True
+
+    def clear(self) -> None:
+        # Reset values
+        self.count = 0
+        self.__blocks__ = []
+        self.__maxes__ = []
+
+    def max(self) -> object:
+        """Find max value contained in the container.
+
+        Raises:
+            TreeException: Raised if the container is empty.
+
+        Returns:
+            object: Max value found.
+        """
+        if not self.__maxes__:
+            raise TreeException(self.__class__.__name__, "Container is empty, no max value.")
+        return self.__maxes__[-1]
+
+    def min(self) -> object:
+        """Find min value contained in the container.
+
+        Raises:
+            TreeException: Raised if the container is empty.
+
+        Returns:
+            object: Min value found.
+        """
+        if not self.__blocks__:
+            raise TreeException(self.__class__.__name__, "Container is empty, no min value.")
+        return self.__blocks__[0][0]
+
+    # Ordered Queries
+    def floor(self, value: object) -> object:
+        """Find the largest value that is less than or equal to the given value.
+
+        Args:
+            value (object): Value to compare against.
+
+        Returns:
+            object: Matching value, None if every value is larger.
+        """
+        block, position = self.__locate__(value, after_equal=True)
+        return self.__value_before__(block, position)
+
+    def ceiling(self, value: object) -> object:
+        """Find the smallest value that is greater than or equal to the given value.
+
+        Args:
+            value (object): Value to compare against.
+
+        Returns:
+            object: Matching value, None if every value is smaller.
+        """
+        block, position = self.__locate__(value, after_equal=False)
+        return self.__value_at__(block, position)
+
+    def lower_bound(self, value: object) -> object:
+        """Find the first value in sorted order that is not less than the given value (same
+        as ceiling()).
+
+        Args:
+            value (object): Value to compare against.
+
+        Returns:
+            object: Matching value, None if every value is smaller.
+        """
+        return self.ceiling(value)
+
+    def upper_bound(self, value: object) -> object:
+        """Find the first value in sorted order that is greater than the given value.
+
+        Args:
+            value (object): Value to compare against.
+
+        Returns:
+            object: Matching value, None if no value is larger.
+        """
+        block, position = self.__locate__(value, after_equal=True)
+        return self.__value_at__(block, position)
+
+    def range(self, low: object = None, high: object = None, include_high: bool = False):
+        """Lazily yields the values in [low, high) in ascending order, O(log n + k) for k
+        yielded values. The container must not be modified while iterating.
+
+        Args:
+            low (object, optional): Smallest value to yield, None for no lower bound. Defaults to None.
+            high (object, optional): Value to stop at, None for no upper bound. Defaults to None.
+            include_high (bool, optional): Also yield high itself if stored. Defaults to False.
+        """
+        if low is None:
+            block, position = 0, 0
+        else:
+            block, position = self.__locate__(low, after_equal=False)
+
+        # Slice whole blocks at once until the block holding high
+        blocks = self.__blocks__
+        while block < len(blocks):
+            values = blocks[block]
+            if high is not None and (high < values[-1] or (not include_high and not values[-1] < high)):
+                end = bisect_right(values, high) if include_high else bisect_left(values, high)
+                yield from values[position:end]
+                return
+            yield from (values[position:] if position else values)
+            block = block + 1
+            position = 0
+
+    # Traversals
+    def inorder(self) -> 'list[object]':
+        return list(chain.from_iterable(self.__blocks__))
+
+    def iter_inorder(self):
+        """Lazy inorder generator, the container must not be modified while iterating.
+        """
+        return iter(self)
+
+    # Helper (Private) Methods
+    def __locate__(self, value: object, after_equal: bool) -> 'tuple[int, int]':
+        """Finds the position of the first value that is greater than (or equal to) the
+        given value. This is purely a helper method and isn't meant to be called outside
+        of the class.
+
+        Args:
+            value (object): Value to compare against.
+            after_equal (bool): Skip past a value equal to the given value.
+
+        Returns:
+            tuple[int, int]: (block index, position inside of the block), block index is the
+            number of blocks if every value is smaller.
+        """
+        search = bisect_right if after_equal else bisect_left
+        block = search(self.__maxes__, value)
+        if block == len(self.__maxes__):
+            return (block, 0)
+        return (block, search(self.__blocks__[block], value))
+
+    def __value_at__(self, block: int, position: int) -> object:
+        """Value at a located position, None if past the end. This is purely a helper method
+        and isn't meant to be called outside of the class.
+        """
+        if block == len(self.__blocks__):
+            return None
+        return self.__blocks__[block][position]
+
+    def __value_before__(self, block: int, position: int) -> object:
+        """Value right before a located position, None if at the start. This is purely a
+        helper method and isn't meant to be called outside of the class.
+        """
+        if position:
+            return self.__blocks__[block][position - 1]
+        if block:
+            return self.__maxes__[block - 1]
+        return None
+
+    def __split_block__(self, index: int) -> None:
+        """Splits an oversized block in half. This is purely a helper method and isn't meant
+        to be called outside of the class.
+
+        Args:
+            index (int): Index of the block.
+        """
+        block = self.__blocks__[index]
+        half = block[self.fan_out:]
+        del block[self.fan_out:]
+        self.__blocks__.insert(index + 1, half)
+        self.__maxes__.insert(index, block[-1])
+
+    def __merge_block__(self, index: int) -> None:
+        """Merges an undersized block into a neighbor, splitting the result again if it's
+        oversized. This is purely a helper method and isn't meant to be called outside of
+        the class.
+
+        Args:
+            index (int): Index of the block.
+        """
+        if index == len(self.__blocks__) - 1:
+            index = index - 1
+        self.__blocks__[index].extend(self.__blocks__[index + 1])
+        self.__maxes__[index] = self.__blocks__[index][-1]
+        del self.__blocks__[index + 1]
+        del self.__maxes__[index + 1]
+        if len(self.__blocks__[index]) > 2 * self.fan_out:
+            self.__split_block__(index)
+
+if __name__ == '__main__':
+    import random
+    from tree_avl import AVLTree
+
+    generator = random.Random(4)
+    blocks = SortedBlockList(fan_out=8)
+    tree = AVLTree()
+    for _ in range(5000):
+        value = generator.randrange(800)
+        if generator.random() < 0.6:
+            assert(blocks.insert(value) == tree.insert(value))
+        else:
+            assert(blocks.remove(value) == tree.remove(value))
+    assert(blocks.inorder() == tree.inorder() and blocks.count == tree.count)
+    assert(list(reversed(blocks)) == list(reversed(tree)) and blocks.similar(tree))
+    assert(blocks.min() == tree.min() and blocks.max() == tree.max())
+    print("Randomized insert/remove against AVLTree: Pass")
+
+    for probe in range(-2, 802):
+        assert(blocks.floor(probe) == tree.floor(probe))
+        assert(blocks.ceiling(probe) == tree.ceiling(probe) == blocks.lower_bound(probe))
+        assert(blocks.upper_bound(probe) == tree.upper_bound(probe))
+        assert((probe in blocks) == (probe in tree))
+    for low, high in [(None, None), (100, 500), (101, 499), (500, 100), (None, 50), (700, None), (300, 300)]:
+        assert(list(blocks.range(low, high)) == list(tree.range(low, high)))
+        assert(list(blocks.range(low, high, include_high=True)) == list(tree.range(low, high, include_high=True)))
+    print("Ordered queries against AVLTree: Pass")
+
+    try:
+        SortedBlockList().min()
+    except TreeException:
+        print("Empty min: Pass")
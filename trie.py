@@ -1,24 +1,78 @@
+import heapq
+from bisect import bisect_left
 from exception_trie import TrieException
 
 class Trie(object):
     """A tree-like data structure that contains words/strings. They are
-    ordered by likeness and closeness to other existing words in the Trie
+    ordered by likeness and closeness to other existing words in the Trie.
+    Any Unicode characters can be stored, and words are case-sensitive (byte
+    strings can be decoded with 'latin-1' to store one character per byte).
     """
     # Constant
-    ALPHABET_SIZE = 26
+    COMPLETION_CACHE_SIZE = 10
 
     # Structs
     class Node(object):
-        """Simple node to contain necessary info for the individual
-        letters of the Trie. Children's indices refers to the letters
-        in the alphabet.
+        """Compact node to contain necessary info for the individual
+        characters of the Trie. Children are kept as two parallel sorted
+        sequences: a string holding one character per child and a tuple
+        holding the child nodes, so a leaf only references the shared empty
+        string and empty tuple. Each node also counts the words in its
+        subtree, holds the weight of its own word and caches the best
+        completions below it once they are asked for.
         """
+        __slots__ = ("is_terminal", "keys", "children", "count", "weight", "best")
+
         def __init__(self) -> None:
-            """Constructor that initializes then node whose children's 
-            indices refer to the alphabet (lower case) -> Trie.ALPHABET_SIZE.
+            """Constructor that initializes the node without any children.
             """
             self.is_terminal = False
-            self.children = [None for _ in range(Trie.ALPHABET_SIZE)]
+            self.keys = ""
+            self.children = ()
+            self.count = 0
+            self.weight = 0
+            self.best = None
+
+        def child(self, character: str) -> 'Trie.Node':
+            """Finds the child reached through the given character.
+
+            Args:
+                character (str): Character of the edge to follow.
+
+            Returns:
+                Node: The child, None if there is no such edge.
+            """
+            index = self.keys.find(character)
+            return self.children[index] if index >= 0 else None
+
+        def add_child(self, character: str) -> 'Trie.Node':
+            """Finds the child reached through the given character, adding
+            a new child first if there is no such edge.
+
+            Args:
+                character (str): Character of the edge to follow.
+
+            Returns:
+                Node: The existing or newly added child.
+            """
+            index = bisect_left(self.keys, character)
+            if index < len(self.keys) and self.keys[index] == character:
+                return self.children[index]
+            child = self.__class__()
+            self.keys = self.keys[:index] + character + self.keys[index:]
+            self.children = self.children[:index] + (child,) + self.children[index:]
+            return child
+
+        def remove_child(self, character: str) -> None:
+            """Removes the edge with the given character, if there is one.
+
+            Args:
+                character (str): Character of the edge to remove.
+            """
+            index = self.keys.find(character)
+            if index >= 0:
+                self.keys = self.keys[:index] + self.keys[index + 1:]
+                self.children = self.children[:index] + self.children[index + 1:]
         
     # Constructor
     def __init__(self):
@@ -38,15 +92,12 @@ class Trie(object):
         """
         # Start at head and incrementally get deeper
         node = self.__head__
-        for depth in range(len(string)):
-            # Get index at current string value
-            index = self.__to_index__(string[depth])
-            
-            # If we meet a divergent path or non-existent entry, abort
-            if not node.children[index]:
+        for character in string:
+            # If we meet a divergent path or non-existent entry, abort,
+            # otherwise go deeper until we find the end
+            index = node.keys.find(character)
+            if index < 0:
                 return False
-            
-            # Go deeper until we find the end or abort early
             node = node.children[index]
         
         # If we're at the end, make sure that where we're at is actually
@@ -54,38 +105,21 @@ class Trie(object):
         return node.is_terminal
     
     def __str__(self) -> str:
-        """Recursively prints all words contained in the Trie.
+        """Prints all words contained in the Trie in sorted order.
 
         Returns:
             str: All words found in the Trie (that are null-terminated).
         """
-        def dfs(node: 'self.Node', path: str) -> 'list[str]':
-            # If we reached the end of this branch, save word
-            if node.is_terminal:
-                return [path]
-
-            # If there are any branches, cover paths them
-            result = []
-            for index, child in enumerate(node.children):
-                if child:
-                    result.extend(dfs(child, path + self.__to_char__(index)))
-            
-            return result
-        
-        result = []
-        children = self.__head__.children
-        for index, child in enumerate(children):
-            if child:
-                result.extend(dfs(child, f"{self.__to_char__(index)}"))
-        
-        return "[" + ", ".join(result) + "]"
+        return "[" + ", ".join(self.starts_with("")) + "]"
         
     # Public Methods
-    def insert(self, string: str) -> None:
-        """Insert the given string into the Trie.
+    def insert(self, string: str, weight: float = 1) -> None:
+        """Insert the given string into the Trie. Inserting a string again
+        only updates its weight.
 
         Args:
             string (str): String to insert.
+            weight (float, optional): Rank of the string among completions. Defaults to 1.
 
         Raises:
             TrieException: Raised if the string given is an invalid type.
@@ -96,23 +130,23 @@ class Trie(object):
         
         # Start at head and check if index is taken
         node = self.__head__
-        for depth in range(len(string)):
-            # Convert current character to usable index
-            index = self.__to_index__(string[depth])
-            
-            # If the index isn't taken by a Node, divergent path;
-            # create new Node at given index
-            if not node.children[index]:
-                node.children[index] = self.Node()
-            
-            # Set current node to next practical node given our
-            # index (if character already existed, just iterate;
-            # if character didn't, the newly added Node will now
-            # show the character)
-            node = node.children[index]
+        path = [node]
+        for character in string:
+            # Follow the edge for the character, creating a new
+            # Node if it's a divergent path (if the character already
+            # existed, just iterate; if it didn't, the newly added Node
+            # will now show the character)
+            node = node.add_child(character)
+            path.append(node)
         
-        # Set final Node as our terminal node
+        # Set final Node as our terminal node, counting a new word in
+        # every subtree along the path and dropping their cached completions
+        node.weight = weight
+        new_word = not node.is_terminal
         node.is_terminal = True
+        for ancestor in path:
+            ancestor.count = ancestor.count + new_word
+            ancestor.best = None
     
     def remove(self, string: str) -> None:
         """Removes the given string from the Trie.
@@ -127,83 +161,301 @@ class Trie(object):
         if not string or not isinstance(string, str):
             raise TrieException(__class__.__name__, f"String can't be removed, given string is of incorrect type. -> {string}: {type(string)}")
   
-        # Call recursive remove method
-        self.__remove__(self.__head__, string)
+        # Descend to the word, remembering the path for pruning
+        node = self.__head__
+        path = [node]
+        for character in string:
+            index = node.keys.find(character)
+            if index < 0:
+                return
+            node = node.children[index]
+            path.append(node)
+        if not node.is_terminal:
+            return
+        
+        # Uncount the word along its path and drop cached completions
+        node.is_terminal = False
+        for ancestor in path:
+            ancestor.count = ancestor.count - 1
+            ancestor.best = None
         
+        # Prune nodes left with neither a word nor children, bottom up
+        depth = len(string)
+        while depth and not path[depth].is_terminal and not path[depth].children:
+            path[depth - 1].remove_child(string[depth - 1])
+            depth = depth - 1
+    
+    def insert_many(self, strings) -> int:
+        """Inserts every given string with a weight of 1. The path of the
+        previous string is kept, so a string only descends from where it
+        stops sharing a prefix with the one before it, and word counts are
+        added up on the way back instead of once per word and node. Fastest
+        on sorted input, but any order is correct. For very large batches
+        the cyclic garbage collector rescanning the growing Trie dominates,
+        callers that own the process can pause it around the call.
+
+        Args:
+            strings (iterable): Strings to insert.
+
+        Raises:
+            TrieException: Raised if any string given is an invalid type.
+
+        Returns:
+            int: Number of strings that weren't already stored.
+        """
+        path = [self.__head__]
+        pending = [0]
+        previous = ""
+        inserted = 0
+        try:
+            for string in strings:
+                if not string or not isinstance(string, str):
+                    raise TrieException(__class__.__name__, f"String can't be inserted, incorrect type -> {string}: {type(string)}")
+            
+                # Keep the nodes of the prefix shared with the previous string
+                common = 0
+                limit = min(len(string), len(previous))
+                while common < limit and string[common] == previous[common]:
+                    common = common + 1
+                self.__unwind__(path, pending, common + 1)
+            
+                node = path[-1]
+                for character in string[common:]:
+                    if node.keys:
+                        node = node.add_child(character)
+                    else:
+                        # Node has no children yet, attach the new child directly
+                        child = self.Node()
+                        node.keys = character
+                        node.children = (child,)
+                        node = child
+                    path.append(node)
+                    pending.append(0)
+                node.weight = 1
+                if not node.is_terminal:
+                    node.is_terminal = True
+                    pending[-1] = pending[-1] + 1
+                    inserted = inserted + 1
+                previous = string
+        finally:
+            # Add the remaining counts all the way up to the head, even if
+            # an invalid string stopped the loop
+            self.__unwind__(path, pending, 1)
+            self.__head__.count = self.__head__.count + pending[0]
+            self.__head__.best = None
+        return inserted
     
+    def starts_with(self, prefix: str):
+        """Lazily yields every word beginning with the prefix in sorted
+        order, the Trie must not be modified while iterating.
+
+        Args:
+            prefix (str): Prefix to complete, "" yields every word.
+        """
+        node, path = self.__find_path__(prefix)
+        if node:
+            for word, _ in self.__walk__(node, path):
+                yield word
+
+    def count_prefix(self, prefix: str) -> int:
+        """Counts the words beginning with the prefix in O(len(prefix)),
+        using the word count kept on every node.
+
+        Args:
+            prefix (str): Prefix to count.
+
+        Returns:
+            int: Number of stored words with the prefix.
+        """
+        node = self.__find__(prefix)
+        return node.count if node else 0
+
+    def top_k_completions(self, prefix: str, k: int = 10) -> 'list[str]':
+        """Finds the k heaviest words beginning with the prefix, ties in
+        sorted order. Up to COMPLETION_CACHE_SIZE completions are cached on
+        each node the first time they're needed and stay valid until a word
+        below the node changes, so repeated queries cost O(len(prefix) + k).
+
+        Args:
+            prefix (str): Prefix to complete.
+            k (int, optional): Number of completions. Defaults to 10.
+
+        Returns:
+            list[str]: Up to k words, heaviest first.
+        """
+        node, path = self.__find_path__(prefix)
+        if not node or k <= 0:
+            return []
+        if k <= self.COMPLETION_CACHE_SIZE:
+            return [word for _, word in self.__best__(node, path)[:k]]
+
+        # More than the cache holds, rank the whole subtree
+        ranked = ((-terminal.weight, word) for word, terminal in self.__walk__(node, path))
+        return [word for _, word in heapq.nsmallest(k, ranked)]
+
+    def fuzzy_search(self, word: str, max_distance: int) -> 'list[tuple[str, int]]':
+        """Finds every stored word within the given Levenshtein (edit)
+        distance of the word. The walk carries one row of the edit distance
+        table per character on the path, so words sharing a prefix share
+        its rows, and a branch is pruned as soon as every entry of its row
+        exceeds max_distance.
+
+        Args:
+            word (str): Word to match.
+            max_distance (int): Max number of insertions, deletions and substitutions.
+
+        Returns:
+            list[tuple[str, int]]: (word, distance) pairs in sorted order.
+        """
+        results = []
+        stack = [(self.__head__, "", list(range(len(word) + 1)))]
+        while stack:
+            node, path, row = stack.pop()
+            for label, child in self.__edges__(node):
+                current = row
+                for character in label:
+                    current = self.__levenshtein_row__(word, current, character)
+                    if min(current) > max_distance:
+                        break
+                else:
+                    child_path = path + label
+                    if child.is_terminal and current[-1] <= max_distance:
+                        results.append((child_path, current[-1]))
+                    stack.append((child, child_path, current))
+        results.sort()
+        return results
+
     def clear(self) -> None:
         """Gets rid of all words current in a Trie, effectively resets the structure.
         """
         self.__head__ = self.Node()
     
     # Private Helper Methods
-    def __to_index__(self, character: str) -> int:
-        """Converts a given character to an index-able value: [0, 26). This
-        method is not meant to be called outside of the class.
+    def __find__(self, prefix: str) -> 'Node':
+        """Follows the prefix down from the head. This method is not meant
+        to be called outside of the class.
 
         Args:
-            character (str): Character to convert.
+            prefix (str): Characters to follow.
 
-        Raises:
-            TrieException: Raised if the given character isn't a string of the
-            appropriate length (a character is an isolated letter whose length
-            is 1 -> 'a' is a character but 'ab' is not)
+        Returns:
+            Node: Node reached by the prefix, None if it isn't stored.
+        """
+        node = self.__head__
+        for character in prefix:
+            index = node.keys.find(character)
+            if index < 0:
+                return None
+            node = node.children[index]
+        return node
+
+    def __find_path__(self, prefix: str) -> 'tuple[Node, str]':
+        """Follows the prefix down from the head like __find__, also
+        returning the characters leading to the node reached, which are
+        the prefix itself here. This method is not meant to be called
+        outside of the class.
+
+        Args:
+            prefix (str): Characters to follow.
 
         Returns:
-            int: Index value offset by the unicode value for 'a'.
+            tuple[Node, str]: (node, path), node is None if the prefix isn't stored.
         """
-        if len(character) != 1:
-            raise TrieException(__class__.__name__, "Character can't be indexed, not appropriate length.")
-        return ord(str.lower(character)) - ord('a')
-    
-    def __to_char__(self, index: int) -> str:
-        """Converts a given index value to a character based on unicode. This
-        method is not meant to be called outside of the class.
+        return (self.__find__(prefix), prefix)
+
+    def __walk__(self, node: 'Node', path: str):
+        """Generator for every (word, terminal node) pair in the subtree of
+        node in sorted order, iterative so long words can't exhaust the stack.
+        This method is not meant to be called outside of the class.
 
         Args:
-            index (int): Index to convert.
+            node (Node): Root of the subtree.
+            path (str): Characters leading to node.
+        """
+        stack = [(node, path)]
+        while stack:
+            node, path = stack.pop()
+            if node.is_terminal:
+                yield (path, node)
+            for character, child in zip(reversed(node.keys), reversed(node.children)):
+                stack.append((child, path + character))
 
-        Raises:
-            TrieException: Raised if the given index isn't within the index-able
-            alphabet range [0, 26).
+    def __edges__(self, node: 'Node'):
+        """Iterable of (edge label, child) pairs of a node, a label is a
+        single character here. This method is not meant to be called
+        outside of the class.
+        """
+        return zip(node.keys, node.children)
+
+    @staticmethod
+    def __levenshtein_row__(word: str, previous: 'list[int]', character: str) -> 'list[int]':
+        """Computes the next row of the edit distance table between the word
+        and a path that just got one character longer. This method is not
+        meant to be called outside of the class.
+
+        Args:
+            word (str): Word being matched.
+            previous (list[int]): Row of the path without the character.
+            character (str): Character appended to the path.
 
         Returns:
-            str: The character whose value is offset by the value for 'a'.
+            list[int]: Distances between the new path and every prefix of word.
         """
-        if index < 0 or index >= Trie.ALPHABET_SIZE:
-            raise TrieException(__class__.__name__, f"Can't convert given integer ({index}) to a valid character.")
-        return chr(index + ord('a'))
-    
-    def __remove__(self, node: 'Node', string: str) -> 'Node':
-        """A recursive helper remove function that removes the given string
-        from the Trie. This method is not meant to be called outside of the
-        class.
+        row = [previous[0] + 1]
+        for column in range(1, len(previous)):
+            row.append(min(row[column - 1] + 1, previous[column] + 1,
+                           previous[column - 1] + (word[column - 1] != character)))
+        return row
+
+    def __best__(self, node: 'Node', path: str) -> 'list[tuple[float, str]]':
+        """Returns the cached best completions of node, merging those of its
+        children first if the cache was dropped. This method is not meant to
+        be called outside of the class.
 
         Args:
-            node (Node): Current node to modify.
-            string (str): Reference string to iterate through.
+            node (Node): Node to complete.
+            path (str): Characters leading to node.
 
         Returns:
-            Node: The modified node if it exists or hasn't been removed.
+            list[tuple[float, str]]: Up to COMPLETION_CACHE_SIZE (negated weight,
+            word) pairs in ranked order.
         """
-        # If no reference string is left, if terminal node gets
-        # removed. If node isn't terminal, then node is likely
-        # part of another word, so leave it alone and return early
-        if not string:
-            if node.is_terminal:
-                node.is_terminal = False
-            return None
+        # Iterative post-order over the nodes without a cache, so long
+        # words can't exhaust the stack
+        stack = [(node, path, False)]
+        while stack:
+            current, current_path, merging = stack.pop()
+            if not merging:
+                if current.best is None:
+                    stack.append((current, current_path, True))
+                    for label, child in self.__edges__(current):
+                        stack.append((child, current_path + label, False))
+                continue
 
-        # Grab index to current portion of reference string
-        index = self.__to_index__(string[0])
-        
-        # Set child of current node to return of the recursive remove.
-        # Increment the reference string and (naturally) the depth of
-        # the Trie until we have removed all nodes that are no longer
-        # needed
-        node.children[index] = self.__remove__(node.children[index], string[1:])
-        return node
-        
+            # Every child is cached by now, merge their completions
+            candidates = [(-current.weight, current_path)] if current.is_terminal else []
+            for child in current.children:
+                candidates.extend(child.best)
+            candidates.sort()
+            current.best = candidates[:self.COMPLETION_CACHE_SIZE]
+        return node.best
+
+    def __unwind__(self, path: 'list[Node]', pending: 'list[int]', length: int) -> None:
+        """Pops path down to the given length, adding the words counted
+        below each popped node to its count and passing them on to its
+        parent. This method is not meant to be called outside of the class.
+
+        Args:
+            path (list[Node]): Nodes from the head down.
+            pending (list[int]): Words added below each node, not counted yet.
+            length (int): Number of nodes to keep.
+        """
+        while len(path) > length:
+            node = path.pop()
+            added = pending.pop()
+            node.count = node.count + added
+            node.best = None
+            pending[-1] = pending[-1] + added
 
 if __name__ == '__main__':
     trie = Trie()
@@ -217,4 +469,64 @@ if __name__ == '__main__':
     
     trie.remove("Hi")
     print(trie)
-    
\ No newline at end of file
+    
+    # Any Unicode characters, stored case-sensitively
+    words = ["hello", "Hello", "héllo", "日本", "日本語", "naïve", "🙂"]
+    unicode_trie = Trie()
+    for word in words:
+        unicode_trie.insert(word)
+    assert(all(word in unicode_trie for word in words))
+    assert("hell" not in unicode_trie and "HELLO" not in unicode_trie and "日" not in unicode_trie)
+    unicode_trie.remove("日本")
+    unicode_trie.remove("missing")
+    assert("日本" not in unicode_trie and "日本語" in unicode_trie)
+    print("Unicode words: Pass")
+
+    # Prefix queries, including words that extend other words
+    words = {"in": 5, "inn": 1, "inner": 3, "inside": 9, "into": 2, "tea": 4, "ten": 4, "i": 1}
+    prefixed = Trie()
+    for word, weight in words.items():
+        prefixed.insert(word, weight)
+    assert(str(prefixed) == "[i, in, inn, inner, inside, into, tea, ten]")
+    assert(list(prefixed.starts_with("inn")) == ["inn", "inner"] and list(prefixed.starts_with("x")) == [])
+    assert(prefixed.count_prefix("in") == 5 and prefixed.count_prefix("") == 8 and prefixed.count_prefix("te") == 2)
+    assert(prefixed.top_k_completions("in", 3) == ["inside", "in", "inner"])
+    assert(prefixed.top_k_completions("t", 2) == ["tea", "ten"])
+    prefixed.insert("inner", 20)
+    prefixed.remove("inside")
+    assert(prefixed.top_k_completions("in", 3) == ["inner", "in", "into"] and prefixed.count_prefix("in") == 4)
+    assert(prefixed.top_k_completions("", 20) == ["inner", "in", "tea", "ten", "into", "i", "inn"])
+    deep = Trie()
+    deep.insert("a" * 5000, 2)
+    deep.insert("a" * 10)
+    assert(deep.top_k_completions("a", 2) == ["a" * 5000, "a" * 10])
+    print("Prefix search and completions: Pass")
+
+    # Edit distance search checked against a full scan
+    def distance(first, second):
+        row = list(range(len(second) + 1))
+        for character in first:
+            row = Trie.__levenshtein_row__(second, row, character)
+        return row[-1]
+
+    import random
+    generator = random.Random(8)
+    vocabulary = {"".join(generator.choices("abcd", k=generator.randrange(1, 7))) for _ in range(800)}
+    fuzzy = Trie()
+    for word in vocabulary:
+        fuzzy.insert(word)
+    for query in ["", "a", "abcd", "dcba", "abcabc", "xyz"]:
+        for max_distance in (0, 1, 2):
+            expected = sorted((word, distance(word, query)) for word in vocabulary if distance(word, query) <= max_distance)
+            assert(fuzzy.fuzzy_search(query, max_distance) == expected)
+    print("Fuzzy search: Pass")
+
+    # Bulk inserts share prefixes, removals prune dead branches
+    bulk = Trie()
+    assert(bulk.insert_many(sorted(vocabulary)) == len(vocabulary) and bulk.insert_many(["abc", "abc"]) == ("abc" not in vocabulary))
+    assert(list(bulk.starts_with("")) == sorted(vocabulary | {"abc"}) and bulk.count_prefix("") == len(vocabulary | {"abc"}))
+    assert(all(bulk.count_prefix(prefix) == sum(word.startswith(prefix) for word in vocabulary | {"abc"}) for prefix in ("a", "ab", "dc", "x")))
+    for word in vocabulary | {"abc"}:
+        bulk.remove(word)
+    assert(not bulk.__head__.children and bulk.count_prefix("") == 0)
+    print("Bulk insert and pruning remove: Pass")
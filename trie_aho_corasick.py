@@ -0,0 +1,149 @@
+from collections import deque
+from trie import *
+
+class AhoCorasick(Trie):
+    """A Trie of patterns extended into an Aho-Corasick automaton. Every node gets a failure
+    link to the node of its longest proper suffix that is also a path in the Trie, and an
+    output link to the nearest pattern along its failure links. A scan then follows one
+    edge or failure link per character and reports every pattern ending there, finding all
+    occurrences of all patterns in O(text + matches) no matter how many patterns there are.
+
+    The links are built lazily by the first scan after the patterns changed.
+    """
+    # Structs
+    class Node(Trie.Node):
+        """Trie node with the automaton links, and the pattern itself on terminal nodes so
+        matches can be reported without rebuilding the string.
+        """
+        __slots__ = ("fail", "output", "word")
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.fail = None
+            self.output = None
+            self.word = None
+
+    # Constructor
+    def __init__(self, patterns=()):
+        """Constructor that initializes the automaton with optional patterns.
+
+        Args:
+            patterns (iterable, optional): Patterns to insert. Defaults to ().
+        """
+        super().__init__()
+        self.__built__ = False
+        self.insert_many(sorted(patterns))
+
+    # Public Methods
+    def insert(self, string: str, weight: float = 1) -> None:
+        super().insert(string, weight)
+        self.__find__(string).word = string
+        self.__built__ = False
+
+    def insert_many(self, strings) -> int:
+        strings = list(strings)
+        inserted = super().insert_many(strings)
+        for string in strings:
+            self.__find__(string).word = string
+        self.__built__ = False
+        return inserted
+
+    def remove(self, string: str) -> None:
+        super().remove(string)
+        self.__built__ = False
+
+    def clear(self) -> None:
+        super().clear()
+        self.__built__ = False
+
+    def scan(self, text):
+        """Lazily yields every occurrence of every pattern in the text. The text may be one
+        string or an iterable of string chunks (e.g. lines or blocks read from a stream),
+        the automaton state carries over from one chunk to the next so matches spanning a
+        chunk boundary are found as well.
+
+        Args:
+            text (str | iterable): Text to scan, or chunks of it.
+
+        Yields:
+            tuple[int, str]: (start position in the whole text, pattern), in order of the
+            position where the match ends, longer patterns first.
+        """
+        if not self.__built__:
+            self.__build__()
+        chunks = (text,) if isinstance(text, str) else text
+
+        head = self.__head__
+        state = head
+        offset = 0
+        for chunk in chunks:
+            for position, character in enumerate(chunk):
+                # Follow failure links until the character can be matched, or give up at the head
+                while True:
+                    index = state.keys.find(character)
+                    if index >= 0:
+                        state = state.children[index]
+                        break
+                    if state is head:
+                        break
+                    state = state.fail
+
+                match = state if state.is_terminal else state.output
+                while match:
+                    yield (offset + position - len(match.word) + 1, match.word)
+                    match = match.output
+            offset = offset + len(chunk)
+
+    # Private Helper Methods
+    def __build__(self) -> None:
+        """Sets the failure and output links breadth-first, so the links of every shallower
+        node are done before they are followed. This method is not meant to be called
+        outside of the class.
+        """
+        head = self.__head__
+        head.fail = head
+        head.output = None
+        queue = deque()
+        for child in head.children:
+            child.fail = head
+            child.output = None
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for character, child in zip(node.keys, node.children):
+                # Longest suffix of the child's path that continues with the same character
+                fail = node.fail
+                index = fail.keys.find(character)
+                while index < 0 and fail is not head:
+                    fail = fail.fail
+                    index = fail.keys.find(character)
+                child.fail = fail.children[index] if index >= 0 else head
+                child.output = child.fail if child.fail.is_terminal else child.fail.output
+                queue.append(child)
+        self.__built__ = True
+
+if __name__ == '__main__':
+    automaton = AhoCorasick(["he", "she", "his", "hers", "é日"])
+    matches = list(automaton.scan("ushers and his é日"))
+    print(matches)
+    assert(matches == [(1, "she"), (2, "he"), (2, "hers"), (11, "his"), (15, "é日")])
+    assert(list(automaton.scan(["us", "h", "ers"])) == [(1, "she"), (2, "he"), (2, "hers")])
+    print("Matches across chunks: Pass")
+
+    automaton.remove("he")
+    automaton.insert("us")
+    assert(list(automaton.scan("ushers")) == [(0, "us"), (1, "she"), (2, "hers")])
+    print("Rebuild after changes: Pass")
+
+    # Randomized text checked against str.find for every pattern
+    import random
+    generator = random.Random(9)
+    patterns = {"".join(generator.choices("ab", k=generator.randrange(1, 6))) for _ in range(20)}
+    automaton = AhoCorasick(patterns)
+    text = "".join(generator.choices("abc", k=2000))
+    chunks = [text[start:start + 7] for start in range(0, len(text), 7)]
+    expected = sorted((start, pattern) for pattern in patterns
+                      for start in range(len(text)) if text.startswith(pattern, start))
+    assert(sorted(automaton.scan(text)) == expected and sorted(automaton.scan(chunks)) == expected)
+    print("Randomized scan: Pass")
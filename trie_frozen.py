@@ -0,0 +1,306 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from trie import *
+
+class FrozenTrie(object):
+    """Read-only Trie minimized into a DAWG (directed acyclic word graph): nodes whose
+    subtrees hold the same suffixes are merged, so suffixes are shared as well as prefixes.
+    The graph lives in flat integer arrays instead of one Python object per node, and
+    queries only create the ints they compare. Files written by FrozenTrie.write() are
+    mapped instead of loaded, so opening is O(1) and processes that open the same file
+    share its pages through the OS page cache.
+
+    File layout (little-endian):
+        header:    magic (4s), version (H), reserved (H), state count (I), edge count (I),
+                   word count (I), root state (I)
+        offsets:   (state count + 1) * I, edges of state s are [offsets[s], offsets[s + 1])
+        labels:    edge count * I, code point of each edge, ascending within a state
+        targets:   edge count * I, state each edge leads to
+        terminals: state count * B, 1 if a word ends at the state
+    """
+    # Constants
+    MAGIC = b"PLDW"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHIIII")
+
+    # Constructor
+    def __init__(self, path: str):
+        """Maps the file written by FrozenTrie.write() and validates its header.
+
+        Args:
+            path (str): Path of the frozen trie file.
+
+        Raises:
+            TrieException: Raised if the file isn't a frozen trie file or is of another version.
+        """
+        # mmap can't map an empty file, check the size before mapping
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < self.HEADER.size:
+                raise TrieException(self.__class__.__name__, f"'{path}' is too small to be a frozen trie file.")
+            self.__map__ = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.path = path
+        try:
+            self.__load__(self.__map__, path)
+        except TrieException:
+            self.__map__.close()
+            raise
+
+    @classmethod
+    def from_trie(cls, trie: Trie) -> 'FrozenTrie':
+        """Freezes a Trie in memory without going through a file.
+
+        Args:
+            trie (Trie): Trie to freeze, it isn't modified.
+
+        Raises:
+            TrieException: Raised if the trie has edges longer than one character (e.g. a RadixTrie).
+
+        Returns:
+            FrozenTrie: The frozen trie.
+        """
+        frozen = cls.__new__(cls)
+        frozen.__map__ = None
+        frozen.path = None
+        frozen.__load__(cls.__serialize__(trie), "<memory>")
+        return frozen
+
+    # Context Manager
+    def __enter__(self) -> 'FrozenTrie':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    # Operator Overrides
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, string: str) -> bool:
+        state = self.__find__(string)
+        return state >= 0 and self.__terminals__[state] == 1
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(self.starts_with("")) + "]"
+
+    # Public Methods
+    def starts_with(self, prefix: str):
+        """Lazily yields every word beginning with the prefix in sorted order.
+
+        Args:
+            prefix (str): Prefix to complete, "" yields every word.
+        """
+        state = self.__find__(prefix)
+        if state < 0:
+            return
+
+        offsets, labels, targets, terminals = self.__offsets__, self.__labels__, self.__targets__, self.__terminals__
+        stack = [(state, prefix)]
+        while stack:
+            state, path = stack.pop()
+            if terminals[state]:
+                yield path
+            for edge in range(offsets[state + 1] - 1, offsets[state] - 1, -1):
+                stack.append((targets[edge], path + chr(labels[edge])))
+
+    def close(self) -> None:
+        """Unmaps the file, the trie can't be used afterwards.
+        """
+        for view in (self.__offsets__, self.__labels__, self.__targets__, self.__terminals__):
+            if isinstance(view, memoryview):
+                view.release()
+        if self.__map__:
+            self.__map__.close()
+
+    @staticmethod
+    def write(trie: Trie, path: str) -> None:
+        """Freezes a Trie into a file. The file is written next to path first and then moved
+        into place, so readers never see a partial file.
+
+        Args:
+            trie (Trie): Trie to freeze, it isn't modified.
+            path (str): Destination path.
+
+        Raises:
+            TrieException: Raised if the trie has edges longer than one character (e.g. a RadixTrie).
+        """
+        data = FrozenTrie.__serialize__(trie)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    # Helper (Private) Methods
+    def __find__(self, prefix: str) -> int:
+        """Follows the prefix from the root state. This method is not meant to be called
+        outside of the class.
+
+        Args:
+            prefix (str): Characters to follow.
+
+        Returns:
+            int: State reached by the prefix, -1 if it isn't stored.
+        """
+        offsets, labels, targets = self.__offsets__, self.__labels__, self.__targets__
+        state = self.__root__
+        for character in prefix:
+            code = ord(character)
+            end = offsets[state + 1]
+            edge = bisect_left(labels, code, offsets[state], end)
+            if edge == end or labels[edge] != code:
+                return -1
+            state = targets[edge]
+        return state
+
+    def __load__(self, buffer, path: str) -> None:
+        """Points the arrays at their sections of the serialized buffer. This method is not
+        meant to be called outside of the class.
+
+        Args:
+            buffer (bytes | mmap): Serialized frozen trie.
+            path (str): Where the buffer came from, for error messages.
+
+        Raises:
+            TrieException: Raised if the buffer isn't a frozen trie or is of another version.
+        """
+        if len(buffer) < self.HEADER.size:
+            raise TrieException(self.__class__.__name__, f"'{path}' is too small to be a frozen trie file.")
+        magic, version, _, state_count, edge_count, count, root = self.HEADER.unpack_from(buffer, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise TrieException(self.__class__.__name__, f"'{path}' is not a version {self.VERSION} frozen trie file.")
+
+        # Public
+        self.count = count
+        self.state_count = state_count
+        self.edge_count = edge_count
+
+        # Private
+        self.__root__ = root
+        view = memoryview(buffer)
+        start = self.HEADER.size
+        sections = []
+        for length in (state_count + 1, edge_count, edge_count):
+            section = view[start:start + length * 4]
+            if sys.byteorder == "little":
+                sections.append(section.cast("I"))
+            else:
+                # Big-endian hosts can't map the little-endian ints, copy and swap them
+                copy = array("I", section)
+                copy.byteswap()
+                sections.append(copy)
+            start = start + length * 4
+        self.__offsets__, self.__labels__, self.__targets__ = sections
+        self.__terminals__ = view[start:start + state_count]
+
+    @staticmethod
+    def __serialize__(trie: Trie) -> bytes:
+        """Minimizes a Trie into a DAWG and lays it out in the file format. Nodes get a
+        signature of their terminal flag, edge characters and the states of their children,
+        which are numbered first (post-order), so equal signatures mean equal suffix sets.
+        This method is not meant to be called outside of the class.
+
+        Args:
+            trie (Trie): Trie to freeze.
+
+        Raises:
+            TrieException: Raised if the trie has edges longer than one character (e.g. a RadixTrie).
+
+        Returns:
+            bytes: The serialized frozen trie.
+        """
+        register = {}
+        states = []
+        state_of = {}
+        count = 0
+
+        # Iterative post-order walk, a node is numbered once all of its children are
+        stack = [(trie.__head__, False)]
+        while stack:
+            node, visited = stack.pop()
+            if not visited:
+                # Every edge label becomes one code point, multi-character labels don't fit
+                if any(len(label) != 1 for label, _ in trie.__edges__(node)):
+                    raise TrieException(FrozenTrie.__name__, "Only tries with single character edges can be frozen.")
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children)
+                continue
+            count = count + node.is_terminal
+            signature = (node.is_terminal, node.keys, tuple(state_of[id(child)] for child in node.children))
+            state = register.get(signature)
+            if state is None:
+                state = register[signature] = len(states)
+                states.append(signature)
+            state_of[id(node)] = state
+
+        offsets = array("I", [0])
+        labels = array("I")
+        targets = array("I")
+        terminals = bytearray()
+        for is_terminal, keys, children in states:
+            labels.extend(ord(character) for character in keys)
+            targets.extend(children)
+            offsets.append(len(labels))
+            terminals.append(is_terminal)
+        if sys.byteorder != "little":
+            for values in (offsets, labels, targets):
+                values.byteswap()
+
+        header = FrozenTrie.HEADER.pack(FrozenTrie.MAGIC, FrozenTrie.VERSION, 0, len(states), len(labels),
+                                        count, state_of[id(trie.__head__)])
+        return b"".join((header, offsets.tobytes(), labels.tobytes(), targets.tobytes(), bytes(terminals)))
+
+if __name__ == '__main__':
+    import random
+    import tempfile
+
+    words = ["tap", "taps", "top", "tops", "stop", "stops", "star", "stars", "日本", "日本語"]
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    frozen = FrozenTrie.from_trie(trie)
+    print(frozen)
+    assert(str(frozen) == str(trie) and len(frozen) == len(words))
+    assert(all(word in frozen for word in words) and "ta" not in frozen and "stopss" not in frozen)
+    assert(list(frozen.starts_with("sto")) == ["stop", "stops"] and list(frozen.starts_with("x")) == [])
+    print("States/edges (trie nodes):", frozen.state_count, frozen.edge_count, sum(len(word) for word in words) + 1)
+    assert(frozen.state_count < 20)
+    print("Suffix sharing: Pass")
+
+    generator = random.Random(7)
+    words = {"".join(generator.choices("abcde", k=generator.randrange(1, 9))) for _ in range(3000)}
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "words.pldw")
+        FrozenTrie.write(trie, path)
+        with FrozenTrie(path) as mapped:
+            assert(list(mapped.starts_with("")) == sorted(words) and len(mapped) == len(words))
+            for _ in range(3000):
+                probe = "".join(generator.choices("abcdef", k=generator.randrange(1, 9)))
+                assert((probe in mapped) == (probe in words))
+                assert(list(mapped.starts_with(probe[:2])) == sorted(word for word in words if word.startswith(probe[:2])))
+        print("Mapped file against a set: Pass")
+
+        for content in (b"", b"nope", b"nope" * 10):
+            with open(path, "wb") as file:
+                file.write(content)
+            try:
+                FrozenTrie(path)
+                assert(False)
+            except TrieException:
+                pass
+        print("Invalid files: Pass")
+
+    from trie_radix import RadixTrie
+    radix = RadixTrie()
+    radix.insert("stop")
+    radix.insert("star")
+    try:
+        FrozenTrie.from_trie(radix)
+        assert(False)
+    except TrieException:
+        print("Multi-character edges rejected: Pass")
@@ -0,0 +1,307 @@
+from trie import *
+
+class RadixTrie(Trie):
+    """A radix (Patricia) Trie: chains of nodes with a single child are collapsed into one
+    edge holding a string label, so a key only costs one node per branching point instead
+    of one per character. Suited to keys with long shared prefixes like URLs and file paths.
+    Lookups compare each edge label against the key in place instead of stepping through
+    it one character at a time.
+    """
+    # Structs
+    class Node(object):
+        """Radix node, the label is the string on the edge leading into the node. Children
+        are kept sorted by the first character of their labels, which are stored in keys.
+        Word counts, weights and cached completions are kept like on Trie nodes.
+        """
+        __slots__ = ("is_terminal", "label", "keys", "children", "count", "weight", "best")
+
+        def __init__(self, label: str = "") -> None:
+            self.is_terminal = False
+            self.label = label
+            self.keys = ""
+            self.children = ()
+            self.count = 0
+            self.weight = 0
+            self.best = None
+
+        def add_child(self, child: 'RadixTrie.Node') -> None:
+            """Adds a child, no other child may start with the same character.
+
+            Args:
+                child (Node): Child to add.
+            """
+            index = bisect_left(self.keys, child.label[0])
+            self.keys = self.keys[:index] + child.label[0] + self.keys[index:]
+            self.children = self.children[:index] + (child,) + self.children[index:]
+
+        def replace_child(self, child: 'RadixTrie.Node') -> None:
+            """Replaces the child whose label starts with the same character.
+
+            Args:
+                child (Node): New child.
+            """
+            index = self.keys.find(child.label[0])
+            self.children = self.children[:index] + (child,) + self.children[index + 1:]
+
+        def remove_child(self, character: str) -> None:
+            index = self.keys.find(character)
+            self.keys = self.keys[:index] + self.keys[index + 1:]
+            self.children = self.children[:index] + self.children[index + 1:]
+
+    # Operator Overrides
+    def __contains__(self, string: str) -> bool:
+        node = self.__head__
+        position = 0
+        while position < len(string):
+            index = node.keys.find(string[position])
+            if index < 0:
+                return False
+            node = node.children[index]
+
+            # Compare the whole edge label in place, no slicing of the key
+            if not string.startswith(node.label, position):
+                return False
+            position = position + len(node.label)
+        return node.is_terminal
+
+    # Public Methods
+    def insert(self, string: str, weight: float = 1) -> None:
+        """Insert the given string into the Trie, splitting an edge if the string leaves it
+        part way through its label. Inserting a string again only updates its weight.
+
+        Args:
+            string (str): String to insert.
+            weight (float, optional): Rank of the string among completions. Defaults to 1.
+
+        Raises:
+            TrieException: Raised if the string given is an invalid type.
+        """
+        if not string or not isinstance(string, str):
+            raise TrieException(__class__.__name__, f"String can't be inserted, incorrect type -> {string}: {type(string)}")
+
+        node = self.__head__
+        path = [node]
+        position = 0
+        while position < len(string):
+            index = node.keys.find(string[position])
+
+            # Divergent path, the rest of the string becomes one new edge
+            if index < 0:
+                leaf = self.Node(string[position:])
+                node.add_child(leaf)
+                node = leaf
+                path.append(node)
+                break
+
+            child = node.children[index]
+            label = child.label
+            if string.startswith(label, position):
+                node = child
+                path.append(node)
+                position = position + len(label)
+                continue
+
+            # The string leaves the edge part way through, split the edge where they differ
+            common = 1
+            while position + common < len(string) and string[position + common] == label[common]:
+                common = common + 1
+            middle = self.Node(label[:common])
+            middle.count = child.count
+            child.label = label[common:]
+            middle.add_child(child)
+            node.replace_child(middle)
+            node = middle
+            path.append(node)
+            if position + common < len(string):
+                leaf = self.Node(string[position + common:])
+                middle.add_child(leaf)
+                node = leaf
+                path.append(node)
+            break
+
+        # Count a new word in every subtree along the path and drop their cached completions
+        node.weight = weight
+        new_word = not node.is_terminal
+        node.is_terminal = True
+        for ancestor in path:
+            ancestor.count = ancestor.count + new_word
+            ancestor.best = None
+
+    def remove(self, string: str) -> None:
+        """Removes the given string from the Trie. A node left without a word and with a
+        single child is merged with that child, so edges stay maximal.
+
+        Args:
+            string (str): String to remove.
+
+        Raises:
+            TrieException: Raised if the string given is an invalid type.
+        """
+        if not string or not isinstance(string, str):
+            raise TrieException(__class__.__name__, f"String can't be removed, given string is of incorrect type. -> {string}: {type(string)}")
+
+        # Find the node of the string, remembering the path for counts and merging
+        node = self.__head__
+        path = [node]
+        position = 0
+        while position < len(string):
+            index = node.keys.find(string[position])
+            if index < 0:
+                return
+            node = node.children[index]
+            if not string.startswith(node.label, position):
+                return
+            path.append(node)
+            position = position + len(node.label)
+        if not node.is_terminal:
+            return
+
+        node.is_terminal = False
+        for ancestor in path:
+            ancestor.count = ancestor.count - 1
+            ancestor.best = None
+
+        parent = path[-2]
+        if len(node.children) == 1:
+            self.__merge__(parent, node)
+        elif not node.children:
+            parent.remove_child(node.label[0])
+            if parent is not self.__head__ and not parent.is_terminal and len(parent.children) == 1:
+                self.__merge__(path[-3], parent)
+
+    def insert_many(self, strings) -> int:
+        inserted = 0
+        for string in strings:
+            new_word = isinstance(string, str) and string not in self
+            self.insert(string)
+            inserted = inserted + new_word
+        return inserted
+
+    # Private Helper Methods
+    def __edges__(self, node: 'Node'):
+        # Edge labels are whole strings here
+        return ((child.label, child) for child in node.children)
+
+    def __find__(self, prefix: str) -> 'Node':
+        return self.__find_path__(prefix)[0]
+
+    def __find_path__(self, prefix: str) -> 'tuple[Node, str]':
+        """Follows the prefix down from the head, the prefix may end part way through an
+        edge, in which case the node below that edge is reached and the path covers its
+        whole label. This method is not meant to be called outside of the class.
+
+        Args:
+            prefix (str): Characters to follow.
+
+        Returns:
+            tuple[Node, str]: (node, path), node is None if the prefix isn't stored.
+        """
+        node = self.__head__
+        path = ""
+        while len(path) < len(prefix):
+            index = node.keys.find(prefix[len(path)])
+            if index < 0:
+                return (None, prefix)
+            node = node.children[index]
+
+            # The prefix either covers the whole label or ends inside of it
+            if not (prefix.startswith(node.label, len(path)) or node.label.startswith(prefix[len(path):])):
+                return (None, prefix)
+            path = path + node.label
+        return (node, path)
+
+    def __merge__(self, parent: 'Node', node: 'Node') -> None:
+        """Merges a node without a word into its only child. This method is not meant to be
+        called outside of the class.
+
+        Args:
+            parent (Node): Parent of the node.
+            node (Node): Node to merge away.
+        """
+        child = node.children[0]
+        child.label = node.label + child.label
+        parent.replace_child(child)
+
+    def __walk__(self, node: 'Node', path: str):
+        """Generator for every (word, terminal node) pair below node in sorted order. This
+        method is not meant to be called outside of the class.
+
+        Args:
+            node (Node): Root of the subtree.
+            path (str): Characters leading to node, including its label.
+        """
+        stack = [(node, path)]
+        while stack:
+            node, path = stack.pop()
+            if node.is_terminal:
+                yield (path, node)
+            for child in reversed(node.children):
+                stack.append((child, path + child.label))
+
+if __name__ == '__main__':
+    import random
+
+    trie = RadixTrie()
+    for word in ("romane", "romanus", "romulus", "rubens", "ruber", "rubicon", "rubicundus", "rom"):
+        trie.insert(word)
+    print(trie)
+    assert(str(trie) == "[rom, romane, romanus, romulus, rubens, ruber, rubicon, rubicundus]")
+    assert("rom" in trie and "roma" not in trie and "rub" not in trie and "rubiconx" not in trie)
+    assert(trie.__head__.keys == "r" and trie.__head__.children[0].label == "r")
+    trie.remove("rom")
+    trie.remove("romulus")
+    assert(trie.__head__.children[0].children[0].label == "oman")
+    print("Edge split/merge: Pass")
+
+    # Randomized inserts and removals of path-like keys checked against a set
+    generator = random.Random(6)
+    segments = ["usr", "local", "lib", "python3", "site-packages", "bin", "share", "doc", "é"]
+    keys = ["/" + "/".join(generator.choices(segments, k=generator.randrange(1, 6))) for _ in range(400)]
+    churn = RadixTrie()
+    expected = set()
+    for _ in range(5000):
+        key = generator.choice(keys)
+        if generator.random() < 0.6:
+            churn.insert(key)
+            expected.add(key)
+        else:
+            churn.remove(key)
+            expected.discard(key)
+    assert(all((key in churn) == (key in expected) for key in keys))
+    assert(list(churn.starts_with("")) == sorted(expected))
+    for prefix in ("/", "/us", "/usr/", "/usr/lo", "/usr/local/bin", "/x", "/é/", "/usr/localx"):
+        assert(list(churn.starts_with(prefix)) == sorted(key for key in expected if key.startswith(prefix)))
+
+    def check(node, is_head):
+        # No node besides the head may be a wordless single-child chain
+        assert(is_head or node.is_terminal or len(node.children) != 1)
+        assert(node.keys == "".join(child.label[0] for child in node.children))
+        for child in node.children:
+            check(child, False)
+    check(churn.__head__, True)
+    print("Randomized insert/remove: Pass")
+
+    # Counts and completions match a plain Trie holding the same weighted words
+    weighted = RadixTrie()
+    plain = Trie()
+    for key in sorted(expected):
+        weight = generator.randrange(1, 50)
+        weighted.insert(key, weight)
+        plain.insert(key, weight)
+    for key in generator.sample(sorted(expected), len(expected) // 3):
+        weighted.remove(key)
+        plain.remove(key)
+    for prefix in ("", "/", "/us", "/usr/", "/usr/lo", "/usr/local/bin", "/x", "/é/"):
+        assert(weighted.count_prefix(prefix) == plain.count_prefix(prefix))
+        for k in (1, 5, 30):
+            assert(weighted.top_k_completions(prefix, k) == plain.top_k_completions(prefix, k))
+    print("Prefix counts and completions: Pass")
+
+    # Fuzzy search walks the edge labels one character at a time
+    plain = Trie()
+    for key in expected:
+        plain.insert(key)
+    for query in ("/usr/lib", "/usr/lob", "/bin/share", "/é/doc"):
+        for max_distance in (0, 1, 3):
+            assert(churn.fuzzy_search(query, max_distance) == plain.fuzzy_search(query, max_distance))
+    print("Fuzzy search against Trie: Pass")